@@ -1,16 +1,15 @@
-import os
 from pathlib import Path
 
 from cli.Program import Program
 
 file_name = "ham3"
 
-current_directory = Path(os.getcwd())
+current_directory = Path.cwd()
 
-blif_file_name = "{}.blif".format(file_name)
-blif_file_path = current_directory.joinpath(blif_file_name)
+blif_file_name = f"{file_name}.blif"
+blif_file_path = current_directory / blif_file_name
 
-spec_file_name = "spec.v".format(file_name)
-spec_file_path = current_directory.joinpath(spec_file_name)
+spec_file_name = "spec.v"
+spec_file_path = current_directory / spec_file_name
 
-Program.execute("read {} | enum {}".format(blif_file_path, spec_file_path))
+Program.execute(f"read {blif_file_path} | enum {spec_file_path}")
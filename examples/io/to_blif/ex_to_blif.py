@@ -0,0 +1,18 @@
+from pathlib import Path
+
+from cli.Program import Program
+from core.benchmarks.Benchmark import VerilogBenchmark
+
+file_name = "const0"
+
+current_directory = Path.cwd()
+
+spec_file_name = "spec.v"
+spec_file_path = current_directory / spec_file_name
+
+# The output y is never true. Its function is written as a constant 0 and must be read back as such.
+blif_file_name = f"{file_name}.blif"
+blif_file_path = current_directory / blif_file_name
+VerilogBenchmark.read(spec_file_path).to_blif().write(blif_file_path)
+
+Program.execute(f"read {blif_file_path} | enum {spec_file_path}")
@@ -0,0 +1,9 @@
+module const0 ( 
+    a, b, c,
+    x, y, z  );
+  input  a, b, c;
+  output x, y, z;
+  assign x = a ? (~b | c) : (b & c);
+  assign y = a & ~a;
+  assign z = a | (b & ~c);
+endmodule
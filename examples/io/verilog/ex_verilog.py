@@ -1,16 +1,15 @@
-import os
 from pathlib import Path
 
 from cli.Program import Program
 
 file_name = "ham3"
 
-current_directory = Path(os.getcwd())
+current_directory = Path.cwd()
 
-verilog_file_name = "{}.v".format(file_name)
-verilog_file_path = current_directory.joinpath(verilog_file_name)
+verilog_file_name = f"{file_name}.v"
+verilog_file_path = current_directory / verilog_file_name
 
-spec_file_name = "spec.v".format(file_name)
-spec_file_path = current_directory.joinpath(spec_file_name)
+spec_file_name = "spec.v"
+spec_file_path = current_directory / spec_file_name
 
-Program.execute("read {} | enum {}".format(verilog_file_path, spec_file_path))
+Program.execute(f"read {verilog_file_path} | enum {spec_file_path}")
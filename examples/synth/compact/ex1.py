@@ -1,19 +1,18 @@
-import os
 from pathlib import Path
 
 from cli.Program import Program
 
 file_name = "ham3"
 
-current_directory = Path(os.getcwd())
+current_directory = Path.cwd()
 
-log_file_name = "{}_sbdd.log".format(file_name)
-log_file_path = current_directory.joinpath(log_file_name)
+log_file_name = f"{file_name}_sbdd.log"
+log_file_path = current_directory / log_file_name
 
-pla_file_name = "{}.pla".format(file_name)
-pla_file_path = current_directory.joinpath(pla_file_name)
+pla_file_name = f"{file_name}.pla"
+pla_file_path = current_directory / pla_file_name
 
-topo_file_name = "{}_sbdd.topo".format(file_name)
-topo_file_path = current_directory.joinpath(topo_file_name)
+topo_file_name = f"{file_name}_sbdd.topo"
+topo_file_path = current_directory / topo_file_name
 
-Program.execute("log {} | read {} | sbdd | compact | write {}".format(log_file_path, pla_file_path, topo_file_path))
+Program.execute(f"log {log_file_path} | read {pla_file_path} | sbdd | compact | write {topo_file_path}")
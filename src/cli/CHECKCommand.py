@@ -1,4 +1,3 @@
-import math
 from pathlib import Path
 from typing import List
 
@@ -39,39 +38,33 @@ class CHECKCommand(Command):
 
         self.specification_file_path = Path(args[0])
 
-        if "-s" in args:
-            idx = args.index("-s")
+        flags = self._parse_flags(args, {"-s"}, {"-static", "-r"})
 
+        if "-s" in flags:
             try:
-                self.sampling_size = int(args[idx + 1])
+                self.sampling_size = int(flags["-s"])
             except Exception as e:
                 self.sampling_size = -1
         else:
             self.sampling_size = 0
 
-        if "-static" in args:
-            self.dynamic = False
-        else:
-            self.dynamic = True
+        self.dynamic = "-static" not in flags
 
-        if "-r" in args:
-            config.record_formulae = True
-        else:
-            config.record_formulae = False
+        config.record_formulae = "-r" in flags
 
     def execute(self) -> bool:
         print("CHECK started")
         context = config.context_manager.get_context()
-        crossbar = list(context.boolean_functions)[0]
+        crossbar = next(iter(context.boolean_functions))
 
         benchmark_reader = BenchmarkReader(self.specification_file_path)
         boolean_function_collection_specification = benchmark_reader.read()
 
         # If no sampling size was provided, but we do want sampling, then we sample over all input vectors.
         if self.sampling_size == -1:
-            self.sampling_size = int(math.pow(2, len(boolean_function_collection_specification.input_variables)))
+            self.sampling_size = 1 << len(boolean_function_collection_specification.get_input_variables())
 
-        specification = list(boolean_function_collection_specification.boolean_functions)[0]
+        specification = next(iter(boolean_function_collection_specification.boolean_functions))
         assert isinstance(specification, VerilogBenchmark)
 
         if self.dynamic:
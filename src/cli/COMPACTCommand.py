@@ -35,72 +35,54 @@ class COMPACTCommand(Command):
 
         super(COMPACTCommand).__init__()
 
-        if "-gamma" in args:
-            idx = args.index("-gamma")
-            config.gamma = float(args[idx + 1])
-        else:
-            config.gamma = 1
+        flags = self._parse_flags(args, {"-gamma", "-g", "-l", "-r", "-c", "-t", "-obj", "-in", "-out"},
+                                  {"-vh", "-io", "-keep"})
 
-        if "-g" in args:
-            idx = args.index("-g")
-            config.gamma = float(args[idx + 1])
+        if "-g" in flags:
+            config.gamma = float(flags["-g"])
+        elif "-gamma" in flags:
+            config.gamma = float(flags["-gamma"])
         else:
             config.gamma = 1
 
-        if "-l" in args:
-            idx = args.index("-l")
-            self.layers = int(args[idx + 1])
+        if "-l" in flags:
+            self.layers = int(flags["-l"])
         else:
             self.layers = 1
 
-        if "-vh" in args:
-            config.vh_labeling = True
-        else:
-            config.vh_labeling = False
+        config.vh_labeling = "-vh" in flags
 
-        if "-io" in args:
-            config.io_constraints = False
-        else:
-            config.io_constraints = True
+        config.io_constraints = "-io" not in flags
 
-        if "-r" in args:
-            idx = args.index("-r")
-            config.max_rows = int(args[idx + 1])
+        if "-r" in flags:
+            config.max_rows = int(flags["-r"])
         else:
             config.max_rows = sys.maxsize
 
-        if "-c" in args:
-            idx = args.index("-c")
-            config.max_columns = int(args[idx + 1])
+        if "-c" in flags:
+            config.max_columns = int(flags["-c"])
         else:
             config.max_columns = sys.maxsize
 
-        if "-t" in args:
-            idx = args.index("-t")
-            config.time_limit = int(args[idx + 1])
+        if "-t" in flags:
+            config.time_limit = int(flags["-t"])
         else:
             config.time_limit = None
 
-        if "-obj" in args:
-            idx = args.index("-obj")
-            config.objective = args[idx + 1]
+        if "-obj" in flags:
+            config.objective = flags["-obj"]
         else:
             config.objective = "semi"
 
-        if "-keep" in args:
-            config.keep_files = True
-        else:
-            config.keep_files = False
+        config.keep_files = "-keep" in flags
 
-        if "-in" in args:
-            idx = args.index("-in")
-            config.input_layer = int(args[idx + 1])
+        if "-in" in flags:
+            config.input_layer = int(flags["-in"])
         else:
             config.input_layer = None
 
-        if "-out" in args:
-            idx = args.index("-out")
-            config.output_layer = int(args[idx + 1])
+        if "-out" in flags:
+            config.output_layer = int(flags["-out"])
         else:
             config.output_layer = None
 
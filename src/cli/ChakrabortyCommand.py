@@ -1,7 +1,9 @@
 from utils import config
+from utils.ParallelExecutor import ParallelExecutor
 from core.BooleanFunctionCollection import BooleanFunctionCollection
 from core.decision_diagrams.BDD import BDD
 from core.decision_diagrams.BDDCollection import BDDCollection
+from core.hardware.Crossbar import MemristorCrossbar
 from synth.ChakrabortyAutomatedSynthesis import ChakrabortyAutomatedSynthesis
 from cli.Command import Command
 
@@ -18,18 +20,19 @@ class ChakrabortyCommand(Command):
 
         super().__init__()
 
+    @staticmethod
+    def _map(bdd: BDD) -> MemristorCrossbar:
+        assert isinstance(bdd, BDD)
+
+        chakraborty = ChakrabortyAutomatedSynthesis(bdd)
+        return chakraborty.map()
+
     def execute(self) -> bool:
         boolean_function_collection = config.context_manager.get_context()
 
         assert isinstance(boolean_function_collection, BDDCollection)
 
-        new_boolean_function_collection = BooleanFunctionCollection()
-        for bdd in boolean_function_collection.boolean_functions:
-            assert isinstance(bdd, BDD)
-
-            chakraborty = ChakrabortyAutomatedSynthesis(bdd)
-            topology = chakraborty.map()
-            new_boolean_function_collection.add(topology)
+        topologies = ParallelExecutor.map(self._map, boolean_function_collection.boolean_functions)
 
-        config.context_manager.add_context("", new_boolean_function_collection)
+        config.context_manager.add_context("", BooleanFunctionCollection(topologies))
         return False
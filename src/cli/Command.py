@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import List, Set, Dict, Any
 
 
 class Command(ABC):
@@ -15,6 +16,27 @@ class Command(ABC):
         """
         pass
 
+    @staticmethod
+    def _parse_flags(args: List[str], value_flags: Set[str] = frozenset(), bool_flags: Set[str] = frozenset()) \
+            -> Dict[str, Any]:
+        """
+        Parses the optional arguments in a single pass over the given arguments.
+        A value flag is mapped on the argument following it, or on None if no argument follows it.
+        A Boolean flag is mapped on True. Flags which are not in the given arguments are not in the dictionary.
+        When a flag occurs more than once, its first occurrence is used.
+        :param args: A list of arguments.
+        :param value_flags: The flags which are followed by a value, e.g. "-t".
+        :param bool_flags: The flags which are not followed by a value, e.g. "-static".
+        :return: A dictionary mapping the flags in the given arguments on their value.
+        """
+        flags = dict()
+        for i, arg in enumerate(args):
+            if arg in value_flags:
+                flags.setdefault(arg, args[i + 1] if i + 1 < len(args) else None)
+            elif arg in bool_flags:
+                flags[arg] = True
+        return flags
+
     @abstractmethod
     def execute(self) -> bool:
         """
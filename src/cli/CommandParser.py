@@ -1,20 +1,52 @@
-from cli.ISOCommand import ISOCommand
-from cli.DDCommand import DDCommand
-from cli.COMPACTCommand import COMPACTCommand
-from cli.ChakrabortyCommand import ChakrabortyCommand
-from cli.CHECKCommand import CHECKCommand
-from cli.DrawCommand import DrawCommand
-from cli.EnumerationCommand import EnumerationCommand
-from cli.EvalCommand import EvalCommand
-from cli.ExitCommand import ExitCommand
-from cli.KLUTCommand import KLUTCommand
-from cli.LogCommand import LogCommand
-from cli.PATHCommand import PATHCommand
-from cli.PruneCommand import PruneCommand
-from cli.ReadCommand import ReadCommand
-from cli.SplitCommand import SplitCommand
-from cli.WriteCommand import WriteCommand
-from cli.XSATCommand import XSATCommand
+import importlib
+
+
+def _command(class_name: str, *command_args, takes_args: bool = True):
+    """
+    Returns a constructor for the command class with the given name.
+    The module of the command class is only imported when the command is parsed for the first time.
+    :param class_name: The name of the command class, which is also the name of its module in the package cli.
+    :param command_args: Arguments to be passed to the command class before the command line arguments.
+    :param takes_args: If true, then the command line arguments are passed to the command class.
+    :return: A function mapping the command line arguments to a command.
+    """
+    def constructor(args):
+        command_class = getattr(importlib.import_module("cli." + class_name), class_name)
+        if takes_args:
+            return command_class(*command_args, args)
+        return command_class(*command_args)
+    return constructor
+
+
+_COMMANDS = {
+    "exit": _command("ExitCommand", takes_args=False),
+
+    # I/O commands:
+    "log": _command("LogCommand"),
+    "read": _command("ReadCommand"),
+    "write": _command("WriteCommand"),
+    "draw": _command("DrawCommand"),
+
+    # Synthesis commands:
+    "bdd": _command("DDCommand", "bdd"),
+    "robdd": _command("DDCommand", "robdd"),
+    "sbdd": _command("DDCommand", "sbdd"),
+    "chakraborty": _command("ChakrabortyCommand", takes_args=False),
+    "compact": _command("COMPACTCommand"),
+    "path": _command("PATHCommand", takes_args=False),
+    "klut": _command("KLUTCommand"),
+    "iso": _command("ISOCommand"),
+
+    # Verification commands:
+    "enum": _command("EnumerationCommand"),
+    "check": _command("CHECKCommand"),
+    "xsat": _command("XSATCommand"),
+
+    # Auxiliary commands:
+    "eval": _command("EvalCommand"),
+    "split": _command("SplitCommand", takes_args=False),
+    "prune": _command("PruneCommand", takes_args=False),
+}
 
 
 class CommandParser:
@@ -22,7 +54,7 @@ class CommandParser:
     @staticmethod
     def parse(raw_command: str):
         """
-        Parses the given command. The command is split into tokens by a whitespace.
+        Parses the given command. The command is split into tokens by runs of whitespace.
         The first token is the command name, upon which the correct command is called with the respective arguments.
         :param raw_command: A command in the format of one string.
         :return: Returns the command based on the first token in the given command string.
@@ -55,55 +87,13 @@ class CommandParser:
 
         """
 
-        command_list = raw_command.strip().split(" ")
+        command_list = raw_command.split()
+        if not command_list:
+            raise Exception("Unknown command.")
         command_name = command_list[0]
         args = command_list[1:]
 
-        if command_name == "exit":
-            return ExitCommand()
-
-        # I/O commands:
-        elif command_name == "log":
-            return LogCommand(args)
-        elif command_name == "read":
-            return ReadCommand(args)
-        elif command_name == "write":
-            return WriteCommand(args)
-        elif command_name == "draw":
-            return DrawCommand(args)
-
-        # Synthesis commands:
-        elif command_name == "bdd":
-            return DDCommand("bdd", args)
-        elif command_name == "robdd":
-            return DDCommand("robdd", args)
-        elif command_name == "sbdd":
-            return DDCommand("sbdd", args)
-        elif command_name == "chakraborty":
-            return ChakrabortyCommand()
-        elif command_name == "compact":
-            return COMPACTCommand(args)
-        elif command_name == "path":
-            return PATHCommand()
-        elif command_name == "klut":
-            return KLUTCommand(args)
-        elif command_name == "iso":
-            return ISOCommand(args)
-
-        # Verification commands:
-        elif command_name == "enum":
-            return EnumerationCommand(args)
-        elif command_name == "check":
-            return CHECKCommand(args)
-        elif command_name == "xsat":
-            return XSATCommand(args)
-
-        # Auxiliary commands:
-        elif command_name == "eval":
-            return EvalCommand(args)
-        elif command_name == "split":
-            return SplitCommand()
-        elif command_name == "prune":
-            return PruneCommand()
-        else:
+        command_constructor = _COMMANDS.get(command_name)
+        if command_constructor is None:
             raise Exception("Unknown command.")
+        return command_constructor(args)
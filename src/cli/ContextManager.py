@@ -7,17 +7,19 @@ class ContextManager:
         """
         The context manager keeps record of the Boolean function(s).
         These Boolean functions can be transformed through commands.
-        TODO: In future versions, we will remove the dictionary, and we will only keep record of the current state.
+        Only the current context is kept, such that the Boolean functions of previous contexts can be garbage collected.
         """
 
+        self.current_context_name = None
         self.current_context = None
-        self.contexts = dict()
 
     def get_context(self, name: str = None) -> BooleanFunctionCollection:
-        if not name:
-            return self.contexts[self.current_context]
-        return self.contexts[name]
+        if self.current_context is None:
+            raise Exception("No context available.")
+        if name and name != self.current_context_name:
+            raise Exception("Context \"{}\" is not the current context.".format(name))
+        return self.current_context
 
     def add_context(self, name: str, benchmark: BooleanFunctionCollection):
-        self.contexts[name] = benchmark
-        self.current_context = name
+        self.current_context_name = name
+        self.current_context = benchmark
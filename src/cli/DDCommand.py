@@ -27,9 +27,10 @@ class DDCommand(Command):
 
         self.dd_type = bdd_type
 
-        if "-t" in args:
-            idx = args.index("-t")
-            config.time_limit_bdd = int(args[idx + 1])
+        flags = self._parse_flags(args, {"-t"})
+
+        if "-t" in flags:
+            config.time_limit_bdd = int(flags["-t"])
         else:
             config.time_limit_bdd = 24 * 60 * 60  # 24 hours
 
@@ -47,30 +48,14 @@ class DDCommand(Command):
     def execute(self) -> bool:
         boolean_function_collection = config.context_manager.get_context()
 
-        if self.dd_type == "bdd":
-            dd_collection = BDDCollection()
-        # Reduced Ordered Binary Decision Diagram
-        elif self.dd_type == "robdd":
-            dd_collection = BDDCollection()
-        # Shared Binary Decision Diagram
-        elif self.dd_type == "sbdd":
-            dd_collection = BDDCollection()
-        else:
+        # A single SBDD is constructed for "bdd" and "sbdd", and a set of ROBDDs is constructed for "robdd".
+        if self.dd_type not in {"bdd", "robdd", "sbdd"}:
             raise Exception("Unsupported BDD type.")
+        multi_output = self.dd_type != "robdd"
 
+        dd_collection = BDDCollection()
         for boolean_function in boolean_function_collection.boolean_functions:
-            # Binary Decision Diagram default
-            if self.dd_type == "bdd":
-                parser = BDDDOTParser(boolean_function)
-            # Reduced Ordered Binary Decision Diagram
-            elif self.dd_type == "robdd":
-                parser = BDDDOTParser(boolean_function, False)
-            # Shared Binary Decision Diagram
-            elif self.dd_type == "sbdd":
-                parser = BDDDOTParser(boolean_function)
-            else:
-                raise Exception("Unsupported BDD type.")
-
+            parser = BDDDOTParser(boolean_function, multi_output)
             sub_dd_collection = parser.parse()
             for sub_dd in sub_dd_collection.boolean_functions:
                 dd_collection.add(sub_dd)
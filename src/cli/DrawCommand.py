@@ -34,10 +34,7 @@ class DrawCommand(Command):
         for boolean_function in context.get_boolean_functions():
             assert isinstance(boolean_function, DrawInterface)
 
-            file_path = self.file_path.stem + "_" + str(i) + self.file_path.suffix
-            content = boolean_function.to_dot()
-            for sub_content in content:
-                with open(file_path, 'w') as f:
-                    f.write(sub_content)
+            file_path = Path(self.file_path.stem + "_" + str(i) + self.file_path.suffix)
+            file_path.write_text(boolean_function.to_dot())
             i += 1
         return False
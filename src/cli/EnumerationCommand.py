@@ -31,9 +31,10 @@ class EnumerationCommand(Command):
 
         self.specification_file_path = Path(args[0])
 
-        if "-s" in args:
-            idx = args.index("-s")
-            self.sampling_size = int(args[idx + 1])
+        flags = self._parse_flags(args, {"-s"})
+
+        if "-s" in flags:
+            self.sampling_size = int(flags["-s"])
         else:
             self.sampling_size = 0
 
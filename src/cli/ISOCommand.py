@@ -24,11 +24,12 @@ class ISOCommand(Command):
 
         super().__init__()
 
-        if "-D" not in args:
+        flags = self._parse_flags(args, {"-D"})
+
+        if "-D" not in flags:
             self.dimension = None
         else:
-            idx = args.index("-D")
-            self.dimension = int(args[idx + 1])
+            self.dimension = int(flags["-D"])
 
     def execute(self) -> bool:
         context = config.context_manager.get_context()
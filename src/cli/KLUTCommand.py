@@ -22,15 +22,15 @@ class KLUTCommand(Command):
 
         super().__init__()
 
-        if "-K" in args:
-            idx = args.index("-K")
-            self.K = int(args[idx + 1])
+        flags = self._parse_flags(args, {"-K", "-G"})
+
+        if "-K" in flags:
+            self.K = int(flags["-K"])
         else:
             self.K = None
 
-        if "-G" in args:
-            idx = args.index("-G")
-            self.G = int(args[idx + 1])
+        if "-G" in flags:
+            self.G = int(flags["-G"])
         else:
             self.G = None
 
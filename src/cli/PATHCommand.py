@@ -1,6 +1,10 @@
+from functools import partial
+
 from utils import config
+from utils.ParallelExecutor import ParallelExecutor
 from core.decision_diagrams.BDD import BDD
 from core.BooleanFunctionCollection import BooleanFunctionCollection
+from core.hardware.Topology import Topology
 from synth.PATH import PATH
 from cli.Command import Command
 from synth.UnconstrainedPartitioning import UnconstrainedPartitioning
@@ -19,17 +23,18 @@ class PATHCommand(Command):
 
         self.partitioning_scheme = UnconstrainedPartitioning
 
-    def execute(self) -> bool:
-        collection = config.context_manager.get_context()
+    @staticmethod
+    def _map(boolean_function: BDD, partitioning_scheme: type) -> Topology:
+        assert isinstance(boolean_function, BDD)
 
-        new_boolean_functions = set()
-        for boolean_function in collection.boolean_functions:
-            assert isinstance(boolean_function, BDD)
+        path = PATH(boolean_function, partitioning_scheme)
+        return path.map()
 
-            path = PATH(boolean_function, self.partitioning_scheme)
-            topology = path.map()
+    def execute(self) -> bool:
+        collection = config.context_manager.get_context()
 
-            new_boolean_functions.add(topology)
+        new_boolean_functions = ParallelExecutor.map(partial(self._map, partitioning_scheme=self.partitioning_scheme),
+                                                     collection.boolean_functions)
 
         config.context_manager.add_context("", BooleanFunctionCollection(new_boolean_functions))
         return False
@@ -20,11 +20,6 @@ class PruneCommand(Command):
 
         assert isinstance(context, DDCollection)
 
-        new_dds = set()
-        for dd in context.boolean_functions:
-            new_dd = dd.prune()
-            new_dd.get_log()
-            new_dds.add(new_dd)
-        context.boolean_functions = new_dds
+        context.prune_inplace()
 
         return False
@@ -19,13 +19,13 @@ class SplitCommand(Command):
     def execute(self) -> bool:
         multi_output_boolean_function_collection = config.context_manager.get_context()
 
-        new_boolean_functions = set()
+        new_boolean_functions = []
         for boolean_function in multi_output_boolean_function_collection.boolean_functions:
             assert isinstance(boolean_function, BLIFBenchmark)
 
             blif_benchmarks = boolean_function.split()
 
-            new_boolean_functions.update(blif_benchmarks)
+            new_boolean_functions.extend(blif_benchmarks)
 
         config.context_manager.add_context("split", BooleanFunctionCollection(new_boolean_functions))
 
@@ -34,13 +34,15 @@ class XSATCommand(Command):
 
         self.specification_file_path = Path(args[0])
 
-        if "-T" in args:
-            self.node_threshold = int(args[args.index("-T") + 1])
+        flags = self._parse_flags(args, {"-T", "-D"})
+
+        if "-T" in flags:
+            self.node_threshold = int(flags["-T"])
         else:
             self.node_threshold = None
 
-        if "-D" in args:
-            self.depth_threshold = int(args[args.index("-D") + 1])
+        if "-D" in flags:
+            self.depth_threshold = int(flags["-D"])
         else:
             self.depth_threshold = None
 
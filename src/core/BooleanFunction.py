@@ -14,6 +14,16 @@ class BooleanFunction(BooleanFunctionInterface, ABC):
         """
         self.name = name
 
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, name: str):
+        self._name = name
+        # The file path depends on the name. Hence, it is constructed again when the name changes.
+        self._file_path = None
+
     def get_name(self) -> str:
         """
         Returns the name of this Boolean function.
@@ -29,4 +39,11 @@ class BooleanFunction(BooleanFunctionInterface, ABC):
         pass
 
     def get_file_path(self) -> Path:
-        return Path(self.get_name() + '.' + self.get_file_extension())
+        """
+        Returns the file path of this Boolean function, i.e. its name with the file extension of its file format.
+        The file path is constructed once, until the name changes.
+        :return: The file path.
+        """
+        if self._file_path is None:
+            self._file_path = Path(self.get_name() + '.' + self.get_file_extension())
+        return self._file_path
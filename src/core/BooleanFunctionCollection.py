@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Dict, Set, Any
+from typing import Dict, Set, Any, Iterable, TextIO
 
 from Loggable import Loggable
 from core.BooleanFunction import BooleanFunction
@@ -11,13 +11,18 @@ class BooleanFunctionCollection(BooleanFunctionInterface, Loggable):
     A class to represent a set of multi-output Boolean functions.
     """
 
-    def __init__(self, boolean_functions: Set[BooleanFunction] = None):
+    def __init__(self, boolean_functions: Iterable[BooleanFunction] = None):
         """
         A multi-output Boolean function collection is a set of multi-output Boolean functions.
+        The set is stored as a dictionary with the Boolean functions as keys, such that the Boolean functions
+        are iterated in the order in which they are added, instead of in the order of their hashes.
+        A given dictionary is used as is. Any other iterable of Boolean functions is converted into a dictionary.
         """
         super().__init__()
         if boolean_functions is None:
-            boolean_functions = set()
+            boolean_functions = dict()
+        elif not isinstance(boolean_functions, dict):
+            boolean_functions = dict.fromkeys(boolean_functions)
         self.boolean_functions = boolean_functions
 
     def copy(self):
@@ -37,7 +42,7 @@ class BooleanFunctionCollection(BooleanFunctionInterface, Loggable):
         :param boolean_function:
         :return:
         """
-        self.boolean_functions.add(boolean_function)
+        self.boolean_functions[boolean_function] = None
 
     def get_input_variables(self) -> Set[str]:
         """
@@ -63,7 +68,7 @@ class BooleanFunctionCollection(BooleanFunctionInterface, Loggable):
             auxiliary_variables.update(boolean_function.get_auxiliary_variables())
         return auxiliary_variables
 
-    def get_boolean_functions(self) -> Set[BooleanFunction]:
+    def get_boolean_functions(self) -> Iterable[BooleanFunction]:
         return self.boolean_functions
 
     @staticmethod
@@ -78,10 +83,16 @@ class BooleanFunctionCollection(BooleanFunctionInterface, Loggable):
     def to_string(self) -> str:
         return " \n".join([boolean_function.to_string() for boolean_function in self.boolean_functions])
 
+    def write_to(self, fp: TextIO):
+        """
+        Writes the content of this collection to the given file object.
+        :param fp: A writable file object.
+        """
+        fp.write(self.to_string())
+
     def write(self, file_path: Path = None):
-        content = self.to_string()
         with open(file_path, "w") as f:
-            f.write(content)
+            self.write_to(f)
 
     def draw(self) -> Set[str]:
         content = set()
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import TextIO
 
 from core.BooleanFunction import BooleanFunction
 
@@ -20,7 +21,13 @@ class IOInterface(ABC):
     def read(filepath: Path) -> BooleanFunction:
         pass
 
+    def write_to(self, fp: TextIO):
+        """
+        Writes the content of this object to the given file object.
+        :param fp: A writable file object.
+        """
+        fp.write(self.to_string())
+
     def write(self, file_path: Path):
         with open(file_path, 'w') as f:
-            content = self.to_string()
-            f.write(content)
+            self.write_to(f)
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import itertools
 import os
+import shlex
+import subprocess
 from abc import ABC, abstractmethod
-from functools import reduce
+from collections import deque
+from functools import lru_cache, cached_property
 from pathlib import Path
-from typing import Dict, Any, Set, List
+from typing import Dict, Any, Set, List, Callable, Iterable, Iterator, Tuple, Optional, TextIO
 
+import numpy as np
 from blifparser.blifparser import BlifParser
-from blifparser.keywords.generic import Blif, Names
-from networkx import topological_sort, DiGraph
+from blifparser.keywords.generic import Blif, Names, Model, Inputs, Outputs
+from networkx import DiGraph
 from z3 import Bool
 
 from Loggable import Loggable
@@ -18,7 +23,22 @@ from utils.VerilogParser import VerilogModule, VerilogParser
 from core.BooleanFunction import BooleanFunction
 from core.IOInterface import IOInterface
 from core.benchmarks.Formula import Formula, VerilogFormula
-from core.expressions.BooleanExpression import LITERAL
+from core.benchmarks.TruthTable import TruthTable
+from core.expressions.BooleanExpression import BooleanExpression, LITERAL
+
+
+@lru_cache(maxsize=256)
+def _parse_file(parse: Callable[[str], Any], file_path: Path, modification_time: int, size: int) -> Any:
+    """
+    Parses the file with the given file path. The result is cached by the resolved file path,
+    the modification time and the size of the file, such that a file that is rewritten is parsed again.
+    :param parse: The function that parses the file with the given file path.
+    :param file_path: The resolved file path.
+    :param modification_time: The modification time of the file in nanoseconds.
+    :param size: The size of the file in bytes.
+    :return: The parsed content.
+    """
+    return parse(str(file_path))
 
 
 class Benchmark(BooleanFunction, Loggable, IOInterface, ABC):
@@ -61,24 +81,124 @@ class Benchmark(BooleanFunction, Loggable, IOInterface, ABC):
         else:
             self.name = name
 
-    def _abc_conversion(self, original_filename: str, new_filename: str, write_cmd: str):
-        import time
-        import pexpect
+    @staticmethod
+    def _parse(parse: Callable[[str], Any], file_path: Path) -> Any:
+        """
+        Parses the file with the given file path, or returns the cached content if the file has been parsed before.
+        The parsed content is shared among benchmarks and must not be modified.
+        :param parse: The function that parses the file with the given file path. It must be defined at module level
+        or as a static method such that the same function is used for each call.
+        :param file_path: The file path.
+        :return: The parsed content.
+        """
+        file_path = Path(file_path).resolve()
+        stat = file_path.stat()
+        return _parse_file(parse, file_path, stat.st_mtime_ns, stat.st_size)
+
+    @staticmethod
+    def clear_parse_cache():
+        """
+        Clears the cache of parsed files.
+        """
+        _parse_file.cache_clear()
+
+    def to_string(self) -> str:
+        return "".join(self._iter_string())
+
+    def write_to(self, fp: TextIO):
+        # The content is written part by part, e.g. a line of a truth table at a time,
+        # such that the content of large benchmarks is not held in memory at once.
+        fp.writelines(self._iter_string())
+
+    @abstractmethod
+    def _iter_string(self) -> Iterator[str]:
+        """
+        Returns the content of this benchmark, in its file format, in parts.
+        :return: An iterator over the parts of the content.
+        """
+        pass
+
+    @staticmethod
+    def _topological_sort(fanins: Dict[str, Iterable[str]]) -> Tuple[List[str], np.ndarray]:
+        """
+        Sorts the variables of a data flow graph in topological order with Kahn's algorithm.
+        Each variable is identified by an integer, i.e. its index in the list of variables,
+        such that the order can be stored as a flat array.
+        :param fanins: A dictionary mapping each output variable of a function to the input variables of that function.
+        :return: A tuple of the list of variables and the indices of the variables in topological order.
+        """
+        variables = list(dict.fromkeys(variable for output_variable, input_variables in fanins.items()
+                                       for variable in (output_variable, *input_variables)))
+        indices = {variable: i for i, variable in enumerate(variables)}
+
+        in_degrees = np.zeros(len(variables), dtype=np.int32)
+        out_edges = [[] for _ in variables]
+        for output_variable, input_variables in fanins.items():
+            j = indices[output_variable]
+            for input_variable in input_variables:
+                out_edges[indices[input_variable]].append(j)
+                in_degrees[j] += 1
+
+        order = np.empty(len(variables), dtype=np.int32)
+        queue = deque(np.flatnonzero(in_degrees == 0).tolist())
+        k = 0
+        while queue:
+            i = queue.popleft()
+            order[k] = i
+            k += 1
+            for j in out_edges[i]:
+                in_degrees[j] -= 1
+                if in_degrees[j] == 0:
+                    queue.append(j)
+
+        if k != len(variables):
+            raise Exception("The data flow graph contains a cycle.")
+        return variables, order
+
+    def _enumerate_truthtable(self, input_variables: List[str],
+                              output_variables: List[str]) -> Optional[List[Tuple[List[str], List[str]]]]:
+        """
+        Enumerates the truth table of this benchmark by evaluating it for every assignment of the input variables.
+        Only the lines for which at least one output variable evaluates to true are retained.
+        The truth table is only enumerated when the number of input variables does not exceed the maximum number
+        of input variables for a direct conversion.
+        :param input_variables: The input variables, in the order of the columns of the input vectors.
+        :param output_variables: The output variables, in the order of the columns of the output vectors.
+        :return: A list of tuples of an input vector and an output vector, or None if there are no input variables
+        or too many input variables.
+        """
+        if not 0 < len(input_variables) <= config.max_inputs_direct_conversion:
+            return None
+
+        truthtable = []
+        for values in itertools.product((False, True), repeat=len(input_variables)):
+            evaluation = self.eval(dict(zip(input_variables, values)))
+            output_vector = ['1' if evaluation.get(output_variable) else '0' for output_variable in output_variables]
+            if '1' in output_vector:
+                truthtable.append((['1' if value else '0' for value in values], output_vector))
+        return truthtable
 
+    def _abc_conversion(self, original_filename: str, new_filename: str, write_cmd: str):
         abc_original_path = config.abc_path.joinpath(original_filename)
         abc_new_path = config.abc_path.joinpath(new_filename)
 
         self.write(abc_original_path)
+        if abc_new_path.exists():
+            os.remove(abc_new_path)
 
-        time.sleep(2)
-
-        process = pexpect.spawn(config.abc_cmd, cwd=str(config.abc_path))
-        process.sendline('read "{}"; {} "{}";'.format(original_filename, write_cmd, new_filename))
+        # ABC runs the script non-interactively and exits once the conversion is finished.
+        script = 'read "{}"; {} "{}"'.format(original_filename, write_cmd, new_filename)
+        try:
+            subprocess.run(config.bash_cmd + ["./abc -c {}".format(shlex.quote(script))], cwd=str(config.abc_path),
+                           capture_output=True, timeout=config.time_limit_abc)
+        except subprocess.TimeoutExpired:
+            raise Exception("\tABC timeout error.\n")
 
-        while not abc_new_path.exists():
-            pass
+        if not abc_new_path.exists():
+            raise Exception("ABC could not write \"{}\".".format(new_filename))
 
-        time.sleep(2)
+        # ABC rewrites the same file names for each conversion.
+        Benchmark.clear_parse_cache()
 
         benchmark = Benchmark.read(abc_new_path)
 
@@ -114,6 +234,13 @@ class BLIFBenchmark(Benchmark, Loggable):
         super().__init__(file_path, name)
         self.blif = blif
         self.functions = self._get_functions()
+        self._truthtables = self._get_truthtables()
+        # The data flow graph, its topological order, and the evaluation table are constructed when they are needed.
+        self._data_flow_graph = None
+        self._variables = None
+        self._topological_order = None
+        self._evaluation_table = None
+        self._auxiliary_variables = None
 
     @staticmethod
     def get_file_extension() -> str:
@@ -126,12 +253,10 @@ class BLIFBenchmark(Benchmark, Loggable):
         return self.blif.outputs.outputs
 
     def get_auxiliary_variables(self) -> Set[str]:
-        output_variables = self.get_output_variables()
-        auxiliary_variables = set()
-        for bf in self.blif.booleanfunctions:
-            if bf.output not in output_variables:
-                auxiliary_variables.add(bf.output)
-        return auxiliary_variables
+        if self._auxiliary_variables is None:
+            output_variables = set(self.get_output_variables())
+            self._auxiliary_variables = frozenset(bf.output for bf in self.blif.booleanfunctions) - output_variables
+        return self._auxiliary_variables
 
     def model_name(self) -> str:
         """
@@ -153,23 +278,26 @@ class BLIFBenchmark(Benchmark, Loggable):
         :param file_path: The path of the BLIF file.
         :return: A BLIF benchmark.
         """
-        parser = BlifParser(str(file_path))
-        blif = parser.blif
+        blif = Benchmark._parse(BLIFBenchmark._parse_blif, file_path)
         name = blif.model.name
         return BLIFBenchmark(blif, file_path, name)
 
+    @staticmethod
+    def _parse_blif(file_path: str) -> Blif:
+        return BlifParser(file_path).blif
+
     def to_file_path(self, file_name: str):
         return Path(file_name + '.' + self.get_file_extension())
 
-    def to_string(self) -> str:
-        content = ""
-        content += ".model {}\n".format(self.model_name())
-        content += ".inputs {}\n".format(" ".join(self.get_input_variables()))
-        content += ".outputs {}\n".format(" ".join(self.get_output_variables()))
-        for _, names in self.functions.items():
-            content += str(names)
-        content += ".end"
-        return content
+    def _iter_string(self) -> Iterator[str]:
+        yield f".model {self.model_name()}\n"
+        yield f".inputs {' '.join(self.get_input_variables())}\n"
+        yield f".outputs {' '.join(self.get_output_variables())}\n"
+        for names in self.functions.values():
+            # A function without lines, i.e. the constant 0, is written by blifparser without a line break.
+            names_string = str(names)
+            yield names_string if names_string.endswith("\n") else names_string + "\n"
+        yield ".end"
 
     def _get_functions(self) -> Dict[str, Names]:
         """
@@ -183,42 +311,26 @@ class BLIFBenchmark(Benchmark, Loggable):
             functions[bf.output] = bf
         return functions
 
+    def _get_truthtables(self) -> Dict[str, TruthTable]:
+        """
+        Returns the bit-packed truth tables of the functions of this BLIF benchmark.
+        The last column of each line in the truth table of a function is the output, and is omitted.
+        :return: A dictionary mapping the output to the bit-packed truth table.
+        """
+        return {output: TruthTable([line[:-1] for line in names.truthtable], len(names.inputs))
+                for output, names in self.functions.items()}
+
     def eval(self, instance: Dict[str, bool]) -> Dict[str, bool]:
         evaluations = dict()
         evaluations.update(instance)
 
-        graph = self.to_data_flow_graph()
-        for node in topological_sort(graph):
-            # If the node is a primary input variable, then we must not evaluate it.
-            if node in self.get_input_variables():
-                continue
-            else:
-                names = self.functions.get(node)
-                inputs = names.inputs
-                truthtable = names.truthtable
-
-                line_evaluations = []
-                for line in truthtable:
-                    line_evaluation = []
-                    for i in range(len(inputs)):
-                        variable = inputs[i]
-                        variable_value = evaluations.get(variable)
-                        raw_truthtable_value = line[i]
-
-                        if raw_truthtable_value == "~" or raw_truthtable_value == "-":
-                            continue
-                        elif raw_truthtable_value == "0":
-                            truthtable_value = False
-                        elif raw_truthtable_value == "1":
-                            truthtable_value = True
-                        else:
-                            raise Exception("Unknown truth value for input variable {}".format(variable))
-
-                        line_evaluation.append(variable_value == truthtable_value)
-
-                    line_evaluations.append(reduce(lambda x, y: x and y, line_evaluation))
-                evaluation = reduce(lambda x, y: x or y, line_evaluations)
-                evaluations[node] = evaluation
+        self._compile()
+        for node, input_variables, truthtable in self._evaluation_table:
+            # A node evaluates to true when any line of its truth table is satisfied.
+            # All lines are checked at once using the bit-packed truth table of the node.
+            instance_values, instance_present = truthtable.pack_instance(
+                [evaluations.get(variable) for variable in input_variables])
+            evaluations[node] = truthtable.any_satisfied(instance_values, instance_present)
 
         # We remove the primary input variables and the auxiliary variables from the evaluation
         # such that we only retain the primary output variables.
@@ -233,19 +345,104 @@ class BLIFBenchmark(Benchmark, Loggable):
         """
         Returns a data flow graph of this BLIF benchmark.
         The leaf nodes are the primary input variables, and the root nodes are the output variables.
+        The data flow graph is constructed once, and must not be modified.
         """
-        graph = DiGraph()
-        for output_variable, names in self.functions.items():
-            graph.add_node(output_variable)
-            for input_variable in names.inputs:
-                graph.add_node(input_variable)
-                graph.add_edge(input_variable, output_variable)
-        return graph
+        if self._data_flow_graph is None:
+            nodes = []
+            edges = []
+            for output_variable, names in self.functions.items():
+                nodes.append(output_variable)
+                nodes.extend(names.inputs)
+                edges.extend((input_variable, output_variable) for input_variable in names.inputs)
+            graph = DiGraph()
+            graph.add_nodes_from(nodes)
+            graph.add_edges_from(edges)
+            self._data_flow_graph = graph
+        return self._data_flow_graph
+
+    def _compile(self):
+        """
+        Computes the topological order of the nodes of the data flow graph of this BLIF benchmark once, as an array
+        of integers. Based on this order, a table with the function of each node but the primary input variables
+        is constructed, such that the evaluation only needs to scan this table.
+        """
+        if self._topological_order is not None:
+            return
+
+        fanins = {output_variable: names.inputs for output_variable, names in self.functions.items()}
+        self._variables, self._topological_order = Benchmark._topological_sort(fanins)
+
+        input_variables = set(self.get_input_variables())
+        self._evaluation_table = []
+        for i in self._topological_order:
+            node = self._variables[i]
+            # If the node is a primary input variable, then we must not evaluate it.
+            if node in input_variables:
+                continue
+            self._evaluation_table.append((node, self.functions.get(node).inputs, self._truthtables.get(node)))
+
+    @staticmethod
+    def from_truthtable(model_name: str, input_variables: List[str], output_variables: List[str],
+                        truthtable: List[Tuple[List[str], List[str]]]) -> BLIFBenchmark:
+        """
+        Constructs a BLIF benchmark with a function per output variable from the lines of a multi-output truth table.
+        The function of an output variable consists of the lines in which the output variable is true.
+        :param model_name: The name of the model.
+        :param input_variables: The input variables, in the order of the columns of the input vectors.
+        :param output_variables: The output variables, in the order of the columns of the output vectors.
+        :param truthtable: A list of tuples of an input vector and an output vector.
+        :return: A BLIF benchmark.
+        """
+        blif = Blif()
+        blif.model = Model(model_name)
+        blif.inputs = Inputs(" ".join(input_variables))
+        blif.outputs = Outputs(" ".join(output_variables))
+        for i, output_variable in enumerate(output_variables):
+            names = Names(" ".join([*input_variables, output_variable]), False)
+            names.truthtable = [[*input_vector, '1'] for (input_vector, output_vector) in truthtable
+                                if output_vector[i] == '1']
+            blif.booleanfunctions.append(names)
+        return BLIFBenchmark(blif, name=model_name)
 
     def to_blif(self) -> BLIFBenchmark:
         return self
 
+    def to_pla_direct(self) -> Optional[PLABenchmark]:
+        """
+        Converts this BLIF benchmark into a PLA benchmark without ABC.
+        When the function of every output variable only depends on primary input variables and is given by its
+        on-set, the lines of these functions are taken together, with a don't care for each input variable
+        the function does not depend on. Otherwise, the truth table is enumerated if there are few input variables.
+        :return: A PLA benchmark, or None if this BLIF benchmark cannot be converted directly.
+        """
+        input_variables = self.blif.inputs.inputs
+        output_variables = self.blif.outputs.outputs
+        functions = [self.functions.get(output_variable) for output_variable in output_variables]
+
+        input_variable_set = set(input_variables)
+        if all(names is not None and not names.is_dontcare and input_variable_set.issuperset(names.inputs) and
+               all(line[-1] == '1' for line in names.truthtable) for names in functions):
+            columns = {input_variable: i for i, input_variable in enumerate(input_variables)}
+            truthtable = []
+            for k, names in enumerate(functions):
+                output_vector = ['0'] * len(output_variables)
+                output_vector[k] = '1'
+                for line in names.truthtable:
+                    input_vector = ['-'] * len(input_variables)
+                    for input_variable, value in zip(names.inputs, line):
+                        input_vector[columns[input_variable]] = value
+                    truthtable.append((input_vector, output_vector))
+        else:
+            truthtable = self._enumerate_truthtable(input_variables, output_variables)
+            if truthtable is None:
+                return None
+        return PLABenchmark.from_truthtable(input_variables, output_variables, truthtable, name=self.name)
+
     def to_pla(self) -> PLABenchmark:
+        pla_benchmark = self.to_pla_direct()
+        if pla_benchmark is not None:
+            return pla_benchmark
+
         self._abc_conversion("x.blif", "x.pla", "write_pla")
         pla_benchmark = PLABenchmark.read(config.abc_path.joinpath("x.pla"))
         abc_new_path = config.abc_path.joinpath("x.pla")
@@ -274,18 +471,40 @@ class PLABenchmark(Benchmark):
         """
         self.pla = pla
         super().__init__(file_path, name)
+        self._input_truthtable = TruthTable([input_vector for (input_vector, _) in pla.truthtable], len(pla.inputs))
+        self._output_truthtable = TruthTable([output_vector for (_, output_vector) in pla.truthtable],
+                                             len(pla.outputs))
+        self._input_variables = frozenset(pla.inputs)
+        self._output_variables = frozenset(pla.outputs)
 
     def get_file_extension(self) -> str:
         return "pla"
 
+    @staticmethod
+    def from_truthtable(input_variables: List[str], output_variables: List[str],
+                        truthtable: List[Tuple[List[str], List[str]]], name: str = None) -> PLABenchmark:
+        """
+        Constructs a PLA benchmark from the lines of a multi-output truth table.
+        :param input_variables: The input variables, in the order of the columns of the input vectors.
+        :param output_variables: The output variables, in the order of the columns of the output vectors.
+        :param truthtable: A list of tuples of an input vector and an output vector.
+        :param name: Optionally, a name for the benchmark.
+        :return: A PLA benchmark.
+        """
+        pla = PLA()
+        pla.inputs = list(input_variables)
+        pla.outputs = list(output_variables)
+        pla.truthtable = truthtable
+        return PLABenchmark(pla, name=name)
+
     def get_input_variables(self) -> Set[str]:
-        return set(self.pla.inputs)
+        return self._input_variables
 
     def get_output_variables(self) -> Set[str]:
-        return set(self.pla.outputs)
+        return self._output_variables
 
     def get_auxiliary_variables(self) -> Set[str]:
-        return set()
+        return frozenset()
 
     @staticmethod
     def from_string(content: str) -> BooleanFunction:
@@ -293,91 +512,35 @@ class PLABenchmark(Benchmark):
 
     @staticmethod
     def read(file_path: Path) -> PLABenchmark:
-        pla_parser = PLAParser(file_path)
-        pla = pla_parser.pla
+        pla = Benchmark._parse(PLABenchmark._parse_pla, file_path)
         return PLABenchmark(pla, file_path=file_path)
 
-    def to_string(self) -> str:
-        content = ""
-        content += ".i {}\n".format(len(self.get_input_variables()))
-        content += ".o {}\n".format(len(self.get_output_variables()))
-        content += ".ilb {}\n".format(" ".join(self.pla.inputs))
-        content += ".ob {}\n".format(" ".join(self.pla.outputs))
-        content += ".p {}\n".format(len(self.pla.truthtable))
-        for (input_vector, output_vector) in self.pla.truthtable:
-            content += "{} {}\n".format("".join(input_vector), "".join(output_vector))
-        content += ".e"
-        return content
-
-    def _satisfies(self, input_vector: List[str], instance: Dict[str, bool]) -> bool:
-        """
-        Auxiliary function for the evaluation of a PLA benchmark.
-        Returns true if and only if the given input vector satisfies the given instance.
-        An input vector satisfies the given instance when there is no conflict among the truth values.
-        A conflict arises when we have a pair of (True, False) or (False, True) for the input vector and the instance,
-        i.e. when input_variable_value != truth_table_value.
-        :param input_vector: The input vector of the truth table of this PLA benchmark.
-        :param instance: The given input vector.
-        :return:
-        """
-
-        # We iterate over each input variable
-        for i in range(len(self.pla.inputs)):
-            input_variable = self.pla.inputs[i]
-
-            # We get the truth value from the instance
-            input_variable_value = instance.get(input_variable)
-            # We get the truth value from the truth table of this PLA benchmark
-            raw_truthtable_value = input_vector[i]
-
-            if raw_truthtable_value == "~" or raw_truthtable_value == "-":
-                continue
-            elif raw_truthtable_value == "0":
-                truth_table_value = False
-            elif raw_truthtable_value == "1":
-                truth_table_value = True
-            else:
-                raise Exception("Unknown truth value for input variable {}".format(input_variable))
-
-            if input_variable_value != truth_table_value:
-                return False
-
-        return True
+    @staticmethod
+    def _parse_pla(file_path: str) -> PLA:
+        return PLAParser(Path(file_path)).pla
+
+    def _iter_string(self) -> Iterator[str]:
+        yield f".i {len(self.get_input_variables())}\n"
+        yield f".o {len(self.get_output_variables())}\n"
+        yield f".ilb {' '.join(self.pla.inputs)}\n"
+        yield f".ob {' '.join(self.pla.outputs)}\n"
+        yield f".p {len(self.pla.truthtable)}\n"
+        yield from (f"{''.join(input_vector)} {''.join(output_vector)}\n"
+                    for (input_vector, output_vector) in self.pla.truthtable)
+        yield ".e"
 
     def eval(self, instance: Dict[str, bool]) -> Dict[str, bool]:
-        evaluations = dict()
-
-        # Initially, every output variable is False
-        for output_variable in self.get_output_variables():
-            evaluations[output_variable] = False
-
-        # We iterate over the lines in the truth table
-        for line in self.pla.truthtable:
-            input_vector, output_vector = line
-
-            # When the input vector of the line satisfies the given instance,
-            # then we will determine the evaluation of the output variables
-            # based on the corresponding output vector.
-            if self._satisfies(input_vector, instance):
-
-                # We iterate over the output variables in the line
-                for i in range(len(self.pla.outputs)):
-                    output_variable = self.pla.outputs[i]
-                    raw_truthtable_value = output_vector[i]
-
-                    # When we find that an output variable evaluates to true, we use it for the evaluation.
-                    # An output variable evaluating to True cannot be undone, i.e. when the entry is False,
-                    # we leave the evaluation untouched.
-                    if raw_truthtable_value == "~" or raw_truthtable_value == "-":
-                        continue
-                    elif raw_truthtable_value == "0":
-                        continue
-                    elif raw_truthtable_value == "1":
-                        evaluations[output_variable] = True
-                    else:
-                        raise Exception("Unknown truth value for input variable {}".format(output_variable))
-
-        return evaluations
+        # When the input vector of a line satisfies the given instance,
+        # then the output variables that are true in the corresponding output vector evaluate to true.
+        # An output variable evaluating to True cannot be undone, i.e. when the entry is False,
+        # we leave the evaluation untouched. Hence, we take the bitwise OR over the satisfied lines.
+        instance_values, instance_present = self._input_truthtable.pack_instance(
+            [instance.get(input_variable) for input_variable in self.pla.inputs])
+        output_values = TruthTable.unpack(
+            self._input_truthtable.reduce_satisfied(instance_values, instance_present, self._output_truthtable.values),
+            len(self.pla.outputs))
+        return {output_variable: bool(output_value)
+                for output_variable, output_value in zip(self.pla.outputs, output_values)}
 
     def to_blif(self) -> BLIFBenchmark:
         self._abc_conversion("x.pla", "x.blif", "write_blif")
@@ -411,6 +574,11 @@ class VerilogBenchmark(Benchmark):
         """
         super().__init__(file_path, name)
         self.verilog = verilog
+        # The topological order of the data flow graph and the evaluation table are constructed when they are needed.
+        # Derived benchmarks, e.g. by negation or collapsing, are new benchmarks with their own evaluation table.
+        self._variables = None
+        self._topological_order = None
+        self._evaluation_table = None
 
     @staticmethod
     def get_file_extension() -> str:
@@ -428,6 +596,31 @@ class VerilogBenchmark(Benchmark):
     def get_auxiliary_variables(self) -> Set[str]:
         return self.verilog.wires
 
+    @cached_property
+    def sorted_inputs(self) -> Tuple[str, ...]:
+        """
+        Returns the sorted input variables of this benchmark. They are sorted once, as the variables of a benchmark
+        do not change. Derived benchmarks, e.g. by negation or copying, are new benchmarks which sort their own.
+        :return: A tuple of the sorted input variables.
+        """
+        return tuple(sorted(self.get_input_variables()))
+
+    @cached_property
+    def sorted_outputs(self) -> Tuple[str, ...]:
+        """
+        Returns the sorted output variables of this benchmark.
+        :return: A tuple of the sorted output variables.
+        """
+        return tuple(sorted(self.get_output_variables()))
+
+    @cached_property
+    def sorted_auxiliaries(self) -> Tuple[str, ...]:
+        """
+        Returns the sorted auxiliary variables of this benchmark.
+        :return: A tuple of the sorted auxiliary variables.
+        """
+        return tuple(sorted(self.get_auxiliary_variables()))
+
     # TODO: Fix! This can be achieved using VerilogFix in aux folder.
     def fix(self, atom: str, positive: bool) -> VerilogBenchmark:
         raise NotImplementedError()
@@ -437,9 +630,10 @@ class VerilogBenchmark(Benchmark):
         Returns the negation of this benchmark.
         """
 
+        output_variables = self.get_output_variables()
         negated_functions = dict()
         for variable, formula in self.verilog.functions.items():
-            if variable in self.get_output_variables():
+            if variable in output_variables:
                 negated_formula = formula.negate()
                 negated_functions[variable] = negated_formula
             else:
@@ -447,7 +641,6 @@ class VerilogBenchmark(Benchmark):
 
         name = self.name + "_neg"
         input_variables = self.get_input_variables()
-        output_variables = self.get_output_variables()
         auxiliary_variables = self.get_auxiliary_variables()
         file_path = self.file_path
 
@@ -466,22 +659,20 @@ class VerilogBenchmark(Benchmark):
 
     @staticmethod
     def read(file_path: Path) -> VerilogBenchmark:
-        verilog_parser = VerilogParser(file_path)
-        verilog = verilog_parser.verilog_module
+        verilog = Benchmark._parse(VerilogBenchmark._parse_verilog, file_path)
         return VerilogBenchmark(verilog, file_path, verilog.module_name)
 
+    @staticmethod
+    def _parse_verilog(file_path: str) -> VerilogModule:
+        return VerilogParser(Path(file_path)).verilog_module
+
     def eval(self, instance: Dict[str, bool]) -> Dict[str, bool]:
         evaluations = dict()
         evaluations.update(instance)
 
-        graph = self._to_data_flow_graph()
-        for node in topological_sort(graph):
-            # If the node is a primary input variable, then we must not evaluate it.
-            if node in self.get_input_variables():
-                continue
-            else:
-                formula = self.verilog.functions.get(node)
-                evaluations[node] = formula.eval(evaluations).get(node)
+        self._compile()
+        for node, formula in self._evaluation_table:
+            evaluations[node] = formula.eval(evaluations).get(node)
 
         # We remove the primary input variables and the auxiliary variables from the evaluation
         # such that we only retain the primary output variables.
@@ -492,57 +683,67 @@ class VerilogBenchmark(Benchmark):
 
         return evaluations
 
-    def _to_data_flow_graph(self) -> DiGraph():
+    def _get_topological_order(self) -> List[str]:
         """
-        Returns a data flow graph of this Verilog benchmark.
-        The leaf nodes are the primary input variables, and the root nodes are the output variables.
+        Returns the nodes of the data flow graph of this Verilog benchmark in topological order.
+        :return: A list of the nodes in topological order.
         """
-        graph = DiGraph()
-        for output_variable, formula in self.verilog.functions.items():
-            graph.add_node(output_variable)
-            for input_variable in formula.get_input_variables():
-                graph.add_node(input_variable)
-                graph.add_edge(input_variable, output_variable)
-        return graph
+        self._compile()
+        return [self._variables[i] for i in self._topological_order]
 
-    def to_string(self) -> str:
-        input_variables = ", ".join(sorted(self.get_input_variables()))
-        output_variables = ", ".join(sorted(self.get_output_variables()))
-
-        content = "module {} (".format(self.verilog.module_name)
-        content += "\n"
-        content += "\t{}, {});".format(input_variables, output_variables)
-        content += "\n"
-        content += "\tinput {};".format(input_variables)
-        content += "\n"
-        content += "\toutput {};".format(output_variables)
-        content += "\n"
-        if len(self.get_auxiliary_variables()) > 0:
-            auxiliary_variables = ", ".join(sorted(self.get_auxiliary_variables()))
-            content += "\twire {};".format(auxiliary_variables)
-            content += "\n"
-        for function_name, formula in self.verilog.functions.items():
-            content += "\tassign {};".format(formula)
-            content += "\n"
-        content += "endmodule"
-        return content
+    def _compile(self):
+        """
+        Computes the topological order of the nodes of the data flow graph of this Verilog benchmark once, as an array
+        of integers. Based on this order, a table with the formula of each node but the primary input variables
+        is constructed, such that the evaluation only needs to scan this table.
+        """
+        if self._topological_order is not None:
+            return
+
+        fanins = {output_variable: formula.get_input_variables()
+                  for output_variable, formula in self.verilog.functions.items()}
+        self._variables, self._topological_order = Benchmark._topological_sort(fanins)
+
+        input_variables = set(self.get_input_variables())
+        self._evaluation_table = []
+        for i in self._topological_order:
+            node = self._variables[i]
+            # If the node is a primary input variable, then we must not evaluate it.
+            if node in input_variables:
+                continue
+            self._evaluation_table.append((node, self.verilog.functions.get(node)))
+
+    def _iter_string(self) -> Iterator[str]:
+        input_variables = ", ".join(self.sorted_inputs)
+        output_variables = ", ".join(self.sorted_outputs)
+
+        yield f"module {self.verilog.module_name} (\n"
+        yield f"\t{input_variables}, {output_variables});\n"
+        yield f"\tinput {input_variables};\n"
+        yield f"\toutput {output_variables};\n"
+        if len(self.sorted_auxiliaries) > 0:
+            auxiliary_variables = ", ".join(self.sorted_auxiliaries)
+            yield f"\twire {auxiliary_variables};\n"
+        yield from (f"\tassign {formula};\n" for formula in self.verilog.functions.values())
+        yield "endmodule"
 
     def collapse(self) -> VerilogBenchmark:
-        data_flow_graph = self._to_data_flow_graph()  # From primary input variable to output variable
         node_to_expression = dict()
-        for node in topological_sort(data_flow_graph):
-            if len(data_flow_graph.in_edges(node)) == 0:
+        # Each node has a single expression, hence the substitutions of all nodes can share a memo.
+        # Then, a negative literal over a node is substituted by the same negation of its expression in every formula.
+        memo = dict()
+        # The nodes are visited from the primary input variables to the output variables.
+        for node in self._get_topological_order():
+            formula = self.verilog.functions.get(node)
+            if formula is None:
+                # The literal of a primary input variable is constructed once, and shared by all its parents.
                 node_to_expression[node] = LITERAL(node, True)
             else:
-                formula = self.verilog.functions.get(node)
                 boolean_expression = formula.verilog.boolean_expression
-                # print("Node: {}".format(node))
-                # print(boolean_expression)
-                for (child_node, _) in data_flow_graph.in_edges(node):
-                    child_expression = node_to_expression.get(child_node)
-                    # print("\t{} -> \t{}".format(child_node, child_expression))
-                    boolean_expression = boolean_expression.substitute(LITERAL(child_node, True), child_expression)
-                node_to_expression[node] = boolean_expression
+                # All child nodes are substituted by their expressions in a single pass over the expression.
+                substitutions = {child_node: node_to_expression.get(child_node)
+                                 for child_node in formula.get_input_variables()}
+                node_to_expression[node] = boolean_expression.substitute_many(substitutions, memo)
 
         functions = dict()
         for output_variable in self.get_output_variables():
@@ -563,12 +764,21 @@ class VerilogBenchmark(Benchmark):
 
     def to_z3(self) -> Dict[str, Bool]:
         verilog_benchmark = self.collapse()
-        functions = dict()
-        for output_variable, formula in verilog_benchmark.verilog.functions.items():
-            functions[output_variable] = formula.verilog.boolean_expression.to_z3()
-        return functions
+        output_variables = list(verilog_benchmark.verilog.functions.keys())
+        # The collapsed expressions share the expressions of the auxiliary variables. In the flat form, every shared
+        # sub-expression is converted once, instead of once for each path to it.
+        ops, args, literals, roots = BooleanExpression.flatten_all(
+            formula.verilog.boolean_expression for formula in verilog_benchmark.verilog.functions.values())
+        z3_expressions = BooleanExpression.flat_to_z3(ops, args, literals)
+        return {output_variable: z3_expressions[root] for output_variable, root in zip(output_variables, roots)}
 
     def to_blif(self, collapse: bool = True) -> BLIFBenchmark:
+        # Small benchmarks are converted by enumerating their truth table instead of with ABC.
+        truthtable = self._enumerate_truthtable(self.verilog.inputs, self.verilog.outputs)
+        if truthtable is not None:
+            return BLIFBenchmark.from_truthtable(self.verilog.module_name, self.verilog.inputs, self.verilog.outputs,
+                                                 truthtable)
+
         self._abc_conversion("x.v", "x.blif", "write_blif")
         blif_benchmark = BLIFBenchmark.read(config.abc_path.joinpath("x.blif"))
         abc_new_path = config.abc_path.joinpath("x.blif")
@@ -576,6 +786,11 @@ class VerilogBenchmark(Benchmark):
         return blif_benchmark
 
     def to_pla(self) -> PLABenchmark:
+        # Small benchmarks are converted by enumerating their truth table instead of with ABC.
+        truthtable = self._enumerate_truthtable(self.verilog.inputs, self.verilog.outputs)
+        if truthtable is not None:
+            return PLABenchmark.from_truthtable(self.verilog.inputs, self.verilog.outputs, truthtable, name=self.name)
+
         self._abc_conversion("x.v", "x.pla", "write_pla")
         pla_benchmark = PLABenchmark.read(config.abc_path.joinpath("x.pla"))
         abc_new_path = config.abc_path.joinpath("x.pla")
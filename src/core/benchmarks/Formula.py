@@ -9,13 +9,17 @@ class Formula(BooleanFunction):
     def __init__(self, verilog: VerilogFormula):
         super().__init__()
         self.verilog = verilog
+        # The input variables are determined when they are needed.
+        self._input_variables = None
 
     @staticmethod
     def get_file_extension() -> str:
         raise NotImplementedError()
 
     def get_input_variables(self) -> Set[str]:
-        return self.verilog.boolean_expression.get_input_variables()
+        if self._input_variables is None:
+            self._input_variables = frozenset(self.verilog.boolean_expression.get_input_variables())
+        return self._input_variables
 
     def get_output_variables(self) -> Set[str]:
         return set(self.verilog.output)
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from typing import Sequence, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _reduce_satisfied(values: np.ndarray, cares: np.ndarray, instance_values: np.ndarray,
+                      instance_present: np.ndarray, outputs: np.ndarray) -> np.ndarray:
+    """
+    Returns the bitwise OR of the rows of the given outputs for which the corresponding row of the truth table
+    is satisfied by the given instance. A row is no longer compared as soon as a conflict is found.
+    This function is compiled with Numba when available.
+    :param values: The packed values of the truth table.
+    :param cares: The packed cares of the truth table.
+    :param instance_values: The packed truth values of the instance.
+    :param instance_present: The packed mask of the variables present in the instance.
+    :param outputs: The packed outputs with a row per row of the truth table.
+    :return: A one-dimensional array of 64-bit words.
+    """
+    result = np.zeros(outputs.shape[1], dtype=np.uint64)
+    for r in range(values.shape[0]):
+        satisfied = True
+        for w in range(values.shape[1]):
+            if (((instance_values[w] ^ values[r, w]) | ~instance_present[w]) & cares[r, w]) != 0:
+                satisfied = False
+                break
+        if satisfied:
+            for w in range(outputs.shape[1]):
+                result[w] |= outputs[r, w]
+    return result
+
+
+if njit is not None:
+    _reduce_satisfied = njit(cache=True, boundscheck=False)(_reduce_satisfied)
+
+
+class TruthTable:
+    """
+    A class to represent a truth table as bit-packed masks.
+    Every row of the truth table is packed into 64-bit words, once for the values and once for the cares,
+    such that all rows can be compared with an instance at once using bitwise operations.
+    """
+
+    WORD_SIZE = 64
+
+    # The codes of the truth values.
+    DONT_CARE = 0
+    FALSE = 1
+    TRUE = 2
+
+    def __init__(self, rows: Sequence[Sequence[str]], width: int):
+        """
+        A truth table has rows of truth values and a width.
+        A truth value is '0', '1', or one of the don't cares '-' and '~'.
+        :param rows: The rows of the truth table.
+        :param width: The number of truth values in each row, i.e. the number of variables.
+        """
+        self.width = width
+
+        codes = TruthTable.encode(rows, width)
+        self.values = TruthTable.pack(codes == TruthTable.TRUE)
+        self.cares = TruthTable.pack(codes != TruthTable.DONT_CARE)
+        # A single output which is true for every row, to check whether any row is satisfied.
+        self._true_outputs = np.ones((len(rows), 1), dtype=np.uint64)
+
+    @staticmethod
+    def encode(rows: Sequence[Sequence[str]], width: int) -> np.ndarray:
+        """
+        Translates the truth values of the given rows into codes, i.e. DONT_CARE, FALSE or TRUE.
+        All rows are translated at once from a single buffer of bytes.
+        :param rows: The rows of the truth table.
+        :param width: The number of truth values in each row.
+        :return: A two-dimensional array of codes with a row per row of the truth table.
+        """
+        raw = np.frombuffer("".join("".join(row) for row in rows).encode(), dtype=np.uint8)
+        if raw.size != len(rows) * width:
+            raise Exception("The rows of the truth table do not have {} truth values.".format(width))
+        raw = raw.reshape(len(rows), width)
+
+        codes = np.full(raw.shape, TruthTable.DONT_CARE, dtype=np.uint8)
+        codes[raw == ord("0")] = TruthTable.FALSE
+        codes[raw == ord("1")] = TruthTable.TRUE
+        unknown = (codes == TruthTable.DONT_CARE) & (raw != ord("-")) & (raw != ord("~"))
+        if np.any(unknown):
+            raise Exception("Unknown truth value {} in truth table.".format(chr(raw[unknown][0])))
+        return codes
+
+    @staticmethod
+    def pack(bits: np.ndarray) -> np.ndarray:
+        """
+        Packs the given rows of bits into 64-bit words.
+        :param bits: A two-dimensional Boolean array with a row of bits per row of the truth table.
+        :return: A two-dimensional array of 64-bit words with a row of words per row of the truth table.
+        """
+        nr_rows, width = bits.shape
+        nr_words = max(1, -(-width // TruthTable.WORD_SIZE))
+        padded = np.zeros((nr_rows, nr_words * TruthTable.WORD_SIZE), dtype=bool)
+        padded[:, :width] = bits
+        return np.packbits(padded, axis=1, bitorder="little").view(np.uint64)
+
+    @staticmethod
+    def unpack(words: np.ndarray, width: int) -> np.ndarray:
+        """
+        Unpacks the given row of 64-bit words into bits.
+        :param words: A one-dimensional array of 64-bit words.
+        :param width: The number of bits to retain.
+        :return: A one-dimensional Boolean array of the given width.
+        """
+        return np.unpackbits(np.ascontiguousarray(words).view(np.uint8), bitorder="little")[:width].astype(bool)
+
+    def pack_instance(self, values: Sequence[bool]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Packs the given truth values of an instance into 64-bit words.
+        A truth value of None denotes that the variable is absent from the instance.
+        :param values: The truth values of the instance, in the order of the variables of this truth table.
+        :return: A tuple of the packed truth values and the packed mask of the present variables.
+        """
+        present = np.fromiter((value is not None for value in values), dtype=bool, count=self.width)
+        ones = np.fromiter((bool(value) for value in values), dtype=bool, count=self.width)
+        return TruthTable.pack(ones.reshape(1, -1))[0], TruthTable.pack(present.reshape(1, -1))[0]
+
+    def satisfies(self, instance_values: np.ndarray, instance_present: np.ndarray) -> np.ndarray:
+        """
+        Returns for each row of this truth table whether it is satisfied by the given packed instance.
+        A row is satisfied when there is no conflict among the truth values it cares about.
+        A conflict arises when the truth values differ, or when the variable is absent from the instance.
+        :param instance_values: The packed truth values of the instance.
+        :param instance_present: The packed mask of the variables present in the instance.
+        :return: A one-dimensional Boolean array with an entry per row.
+        """
+        conflicts = ((instance_values ^ self.values) | ~instance_present) & self.cares
+        return np.all(conflicts == 0, axis=1)
+
+    def reduce_satisfied(self, instance_values: np.ndarray, instance_present: np.ndarray,
+                         outputs: np.ndarray) -> np.ndarray:
+        """
+        Returns the bitwise OR of the rows of the given outputs for which the corresponding row of this truth table
+        is satisfied by the given packed instance.
+        When Numba is available, a compiled kernel is used. Otherwise, all rows are compared at once with NumPy.
+        :param instance_values: The packed truth values of the instance.
+        :param instance_present: The packed mask of the variables present in the instance.
+        :param outputs: A two-dimensional array of 64-bit words with a row per row of this truth table.
+        :return: A one-dimensional array of 64-bit words.
+        """
+        if njit is not None:
+            return _reduce_satisfied(self.values, self.cares, instance_values, instance_present, outputs)
+        return np.bitwise_or.reduce(outputs[self.satisfies(instance_values, instance_present)], axis=0)
+
+    def any_satisfied(self, instance_values: np.ndarray, instance_present: np.ndarray) -> bool:
+        """
+        Returns true if and only if any row of this truth table is satisfied by the given packed instance.
+        :param instance_values: The packed truth values of the instance.
+        :param instance_present: The packed mask of the variables present in the instance.
+        :return: True if a row is satisfied, False otherwise.
+        """
+        return bool(self.reduce_satisfied(instance_values, instance_present, self._true_outputs)[0])
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-import copy
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Set, Any
+from typing import Dict, List, Set, Any, Tuple, Iterator, TextIO
 
-from networkx import DiGraph, topological_sort, has_path
+import numpy as np
+from networkx import DiGraph, topological_sort
 
 from utils import config
 from utils.BDDParser import BDDParser
 from core.decision_diagrams.DD import DD
+from core.expressions.BooleanExpression import LITERAL
 
 
 class BDD(DD):
@@ -20,16 +22,26 @@ class BDD(DD):
     TRUE = "1"
     FALSE = "0"
 
-    def __init__(self, graph: DiGraph, variable_order: List[str], name: str = None):
+    def __init__(self, graph: DiGraph, variable_order: List[str], name: str = None, acyclic: bool = False):
         """
         A BDD is constructed from the given graph.
         :param graph: 
+        :param acyclic: Whether the given graph is known to be a DAG, such that it is not checked again.
         """
-        super().__init__(graph, name)
+        super().__init__(graph, name, acyclic)
         self.variable_order = variable_order
         self.positive_terminal_node = None
         self.negative_terminal_node = None
         self._set_root_and_terminal_nodes()
+        # The structure of arrays of the nodes is constructed when it is needed.
+        self._nodes = None
+        self._node_variables = None
+        self._positive_children = None
+        self._negative_children = None
+        self._root_indices = None
+        self._positive_terminal_index = None
+        self._negative_terminal_index = None
+        self._topological_order = None
         config.log.add_json(self.get_log())
 
     @staticmethod
@@ -84,6 +96,38 @@ class BDD(DD):
             elif variable == self.TRUE:
                 self.positive_terminal_node = node
 
+    def _compile(self):
+        """
+        Stores the nodes of this BDD as a structure of arrays. Node i is the i-th node of the DAG,
+        and the arrays hold its variable and the indices of its positive and negative child, or -1 if it has none.
+        The root nodes and the terminal nodes are stored by their indices as well, and so is a topological order of
+        the nodes, in which each node precedes its children.
+        The DAG of a BDD does not change once the BDD is constructed, hence the arrays are constructed once.
+        """
+        if self._nodes is not None:
+            return
+
+        nodes = list(self.dag.nodes)
+        indices = {node: i for i, node in enumerate(nodes)}
+        positive_children = np.full(len(nodes), -1, dtype=np.int64)
+        negative_children = np.full(len(nodes), -1, dtype=np.int64)
+        for (u, v, literal) in self.dag.edges(data="literal"):
+            if literal.positive:
+                positive_children[indices[u]] = indices[v]
+            else:
+                negative_children[indices[u]] = indices[v]
+
+        self._node_variables = [node_data["variable"] for (_, node_data) in self.dag.nodes(data=True)]
+        self._positive_children = positive_children
+        self._negative_children = negative_children
+        self._root_indices = [(root_node, indices[root_node]) for root_node in self.root_nodes]
+        # The index of a terminal node that is absent is -1, like the index of a child that is absent.
+        self._positive_terminal_index = indices.get(self.positive_terminal_node, -1)
+        self._negative_terminal_index = indices.get(self.negative_terminal_node, -1)
+        self._topological_order = np.fromiter((indices[node] for node in topological_sort(self.dag)), dtype=np.int64,
+                                              count=len(nodes))
+        self._nodes = nodes
+
     @staticmethod
     def read(file_path: Path) -> BDD:
         bdd_parser = BDDParser(file_path)
@@ -95,35 +139,67 @@ class BDD(DD):
         Returns a BDD description of this BDD.
         :return: A BDD description of this BDD.
         """
-        content = ""
-        content += ".model {}\n".format(self.get_name())
-        content += ".inputs {}\n".format(" ".join(self.get_input_variables()))
-        content += ".outputs {}\n".format(" ".join(self.get_output_variables()))
-        content += ".order {}\n".format(" ".join(self.variable_order))
-        content += ".bdd\n"
-        for (node, node_data) in self.dag.nodes(data=True):
-            successors = self.dag.successors(node)
-            positive_child = -1
-            negative_child = -1
-            for successor in successors:
-                edge_data = self.dag.get_edge_data(node, successor)
-                literal = edge_data.get("literal")
-                if literal.positive:
-                    positive_child = successor
-                else:
-                    negative_child = successor
-            if node_data["root"]:
-                output_variables = " ".join(node_data["output_variables"])
-                content += "{} {} {} {} {}\n".format(node, positive_child, negative_child, node_data["variable"],
-                                                     output_variables)
-            else:
-                content += "{} {} {} {}\n".format(node, positive_child, negative_child, node_data["variable"])
-        content += ".end\n"
-        return content
+        return "".join(self._iter_string(-1))
+
+    def write_to(self, fp: TextIO):
+        # The description is written part by part, such that the lines of the nodes are not joined into a single
+        # string first.
+        fp.writelines(self._iter_string(-1))
+
+    def prune_to_string(self) -> str:
+        """
+        Returns the BDD description of the pruned BDD of this BDD, without constructing the pruned BDD.
+        :return: A BDD description of the pruned BDD of this BDD.
+        """
+        self._compile()
+        return "".join(self._iter_string(self._negative_terminal_index))
+
+    def _iter_string(self, removed_index: int) -> Iterator[str]:
+        """
+        Returns a BDD description of this BDD in parts, in which the node with the given index is omitted.
+        An edge to the omitted node is described as an absent edge.
+        :param removed_index: The index of the omitted node, or -1 if no node is omitted.
+        :return: An iterator over the parts of the BDD description.
+        """
+        self._compile()
+        output_variables = set()
+        for i, (node, node_data) in enumerate(self.dag.nodes(data=True)):
+            if i != removed_index and "output_variables" in node_data:
+                output_variables.update(node_data["output_variables"])
+
+        parts = [
+            ".model {}\n".format(self.get_name()),
+            ".inputs {}\n".format(" ".join(self.get_input_variables())),
+            ".outputs {}\n".format(" ".join(output_variables)),
+            ".order {}\n".format(" ".join(self.variable_order)),
+            ".bdd\n"
+        ]
+
+        # The lines of the nodes are formatted column by column, with a single format string.
+        # A child refers to a node by its index. An absent child, or the omitted node, refers to the extra entry -1
+        # at the end of the column of nodes.
+        nodes = np.empty(len(self._nodes) + 1, dtype=object)
+        nodes[:-1] = self._nodes
+        nodes[-1] = -1
+
+        def describe(children: np.ndarray) -> List[Any]:
+            return nodes[np.where((children >= 0) & (children != removed_index), children, -1)].tolist()
+
+        columns = [
+            self._nodes,
+            describe(self._positive_children),
+            describe(self._negative_children),
+            self._node_variables,
+            [" " + " ".join(node_data["output_variables"]) if node_data["root"] else ""
+             for (_, node_data) in self.dag.nodes(data=True)]
+        ]
+        if removed_index >= 0:
+            columns = [column[:removed_index] + column[removed_index + 1:] for column in columns]
+        return chain(parts, map("{} {} {} {}{}\n".format, *columns), (".end\n",))
 
     @staticmethod
-    def from_string(content) -> BDD:
-        bdd_module = BDDParser.from_string(content)
+    def from_string(content, literals: Dict[Tuple[str, bool], LITERAL] = None) -> BDD:
+        bdd_module = BDDParser.from_string(content, literals)
         return BDD(bdd_module.dag, bdd_module.variable_order, bdd_module.module_name)
 
     def get_variable_order(self) -> List[str]:
@@ -159,7 +235,9 @@ class BDD(DD):
                 content += " -> "
         content += "; }\n"
         is_new_variable = True
-        for node in topological_sort(self.dag):
+        self._compile()
+        for i in self._topological_order:
+            node = self._nodes[i]
             node_data = self.dag.nodes[node]
             variable = node_data["variable"]
             if variable == self.FALSE or variable == self.TRUE:
@@ -203,29 +281,19 @@ class BDD(DD):
         :return: A dictionary mapping the output variables to a Boolean truth value (true/false).
         """
 
-        # First, we instantiate the BDD. This means that we remove edges from the BDD that evaluate to False such that
-        # only edges remain where the literal evaluates to the given truth value.
-        dag = copy.deepcopy(self.dag)  # self.dag.copy(as_view=False)
-        false_edges = set()
-        for (u, v) in dag.edges:
-            edge_data = dag.get_edge_data(u, v)
-            literal = edge_data.get("literal")
-            evaluation = literal.eval(instance)
-            if not evaluation:
-                false_edges.add((u, v))
-        dag.remove_edges_from(false_edges)
-
-        # Now, we try to find a path from root node to leaf node.
+        # From each root node, we follow the edge of which the literal evaluates to true, until a terminal node
+        # or a node without such an edge is reached. Instead of instantiating a copy of the DAG, the path is followed
+        # in the structure of arrays of this BDD.
+        self._compile()
         evaluations = dict()
-        for root_node in self.root_nodes:
-            true_path = False
-            false_path = False
-            if self.positive_terminal_node is not None:
-                if has_path(dag, root_node, self.positive_terminal_node):
-                    true_path = True
-            if self.negative_terminal_node is not None:
-                if has_path(dag, root_node, self.negative_terminal_node):
-                    false_path = True
+        for root_node, i in self._root_indices:
+            while i >= 0 and i != self._positive_terminal_index and i != self._negative_terminal_index:
+                if instance.get(self._node_variables[i]):
+                    i = self._positive_children[i]
+                else:
+                    i = self._negative_children[i]
+            true_path = bool(i >= 0 and i == self._positive_terminal_index)
+            false_path = bool(i >= 0 and i == self._negative_terminal_index)
 
             # There must exactly be one path between the root node and either the positive or
             # the negative terminal node.
@@ -234,7 +302,7 @@ class BDD(DD):
                                 "path from the root node to the negative terminal node.")
 
             # Converts the root node into the output variables
-            output_variables = dag.nodes[root_node]["output_variables"]
+            output_variables = self.dag.nodes[root_node]["output_variables"]
             for output_variable in output_variables:
                 evaluations[output_variable] = true_path
 
@@ -243,9 +311,50 @@ class BDD(DD):
     def prune(self) -> BDD:
         """
         Prunes this BDD. Pruning entails the removal of the negative terminal node.
+        The pruned BDD is kept, such that pruning this BDD or the pruned BDD again returns the pruned BDD.
+        A BDD without a negative terminal node is pruned already, hence it is its own pruned BDD.
         :return: A BDD without the negative terminal node of this BDD.
         """
+        if self._pruned is not None:
+            return self._pruned
+        if self.negative_terminal_node is None:
+            self._pruned = self
+            return self
+
         dag = self.dag.copy(as_view=False)
-        if self.negative_terminal_node is not None:
-            dag.remove_node(self.negative_terminal_node)
-        return BDD(dag, self.variable_order, self.name)
+        dag.remove_node(self.negative_terminal_node)
+        # Removing a node from a DAG results in a DAG.
+        bdd = BDD(dag, self.variable_order, self.name, acyclic=True)
+        if self._nodes is not None:
+            bdd._compile_without(self, self._negative_terminal_index)
+        bdd._pruned = bdd
+        self._pruned = bdd
+        return bdd
+
+    def _compile_without(self, bdd: BDD, removed_index: int):
+        """
+        Constructs the structure of arrays of this BDD from the structure of arrays of the given BDD,
+        of which this BDD is the subgraph without the node with the given index.
+        The remaining nodes are copied at once, and the children are renumbered with a single lookup.
+        :param bdd: The given BDD, of which the structure of arrays has been constructed.
+        :param removed_index: The index of the removed node in the given BDD.
+        """
+        kept = np.ones(len(bdd._nodes), dtype=bool)
+        kept[removed_index] = False
+        # The new index of each node of the given BDD, or -1 for the removed node.
+        new_indices = np.cumsum(kept, dtype=np.int64) - 1
+        new_indices[removed_index] = -1
+
+        def renumber(index: int) -> int:
+            return int(new_indices[index]) if index >= 0 else -1
+
+        self._node_variables = [variable for i, variable in enumerate(bdd._node_variables) if i != removed_index]
+        self._positive_children = np.where(bdd._positive_children >= 0, new_indices[bdd._positive_children], -1)[kept]
+        self._negative_children = np.where(bdd._negative_children >= 0, new_indices[bdd._negative_children], -1)[kept]
+        root_indices = dict(bdd._root_indices)
+        self._root_indices = [(root_node, renumber(root_indices[root_node])) for root_node in self.root_nodes]
+        self._positive_terminal_index = renumber(bdd._positive_terminal_index)
+        self._negative_terminal_index = renumber(bdd._negative_terminal_index)
+        # Removing a node from a topological order results in a topological order.
+        self._topological_order = new_indices[bdd._topological_order[bdd._topological_order != removed_index]]
+        self._nodes = [node for i, node in enumerate(bdd._nodes) if i != removed_index]
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List, Dict, Set, Any
+from typing import List, Dict, Set, Any, Iterable
 
 from core.decision_diagrams.BDD import BDD
 from core.decision_diagrams.DDCollection import DDCollection
@@ -9,7 +9,7 @@ from core.decision_diagrams.DDCollection import DDCollection
 
 class BDDCollection(DDCollection):
 
-    def __init__(self, bdds: Set[BDD] = None):
+    def __init__(self, bdds: Iterable[BDD] = None):
         super().__init__(bdds)
 
     def get_input_variables(self) -> Set[str]:
@@ -30,7 +30,8 @@ class BDDCollection(DDCollection):
 
     @staticmethod
     def read(file_path: Path) -> BDDCollection:
-        all_bdd_content = set()
+        # The content of the BDDs is kept in the order of the file.
+        all_bdd_content = dict()
         with open(file_path, 'r') as f:
             lines = f.readlines()
 
@@ -40,16 +41,15 @@ class BDDCollection(DDCollection):
                 if bdd_content is None:
                     bdd_content = line
                 else:
-                    all_bdd_content.add(bdd_content)
+                    all_bdd_content[bdd_content] = None
                     bdd_content = line
             else:
                 bdd_content += line
-        all_bdd_content.add(bdd_content)
+        all_bdd_content[bdd_content] = None
 
-        bdds = set()
-        for bdd_content in all_bdd_content:
-            bdd = BDD.from_string(bdd_content)
-            bdds.add(bdd)
+        # The BDDs of a collection are over the same variables, hence they share the literals of their edges.
+        literals = dict()
+        bdds = [BDD.from_string(bdd_content, literals) for bdd_content in all_bdd_content]
         return BDDCollection(bdds)
 
     def write(self, file_path: Path) -> Dict[str, Any]:
@@ -14,29 +14,23 @@ class BDDTopology(BooleanFunctionCollection, DrawInterface):
         super().__init__()
         self.topology = topology
         self.bdds = bdds
+        # The BDDs do not change once the topology is constructed. Hence, their variables are computed once and
+        # frozen, such that the same sets can be returned on every call without being copied.
+        self._input_variables = frozenset().union(*(bdd.get_input_variables() for bdd in bdds.values()))
+        self._output_variables = frozenset().union(*(bdd.get_output_variables() for bdd in bdds.values()))
+        self._boolean_functions = frozenset(bdds.values())
 
     def get_input_variables(self) -> Set[str]:
-        input_variables = set()
-        for node in self.topology:
-            assert isinstance(node, BDD)
-            input_variables.update(node.get_input_variables())
-        return input_variables
+        return self._input_variables
 
     def get_output_variables(self) -> Set[str]:
-        output_variables = set()
-        for node in self.topology:
-            assert isinstance(node, BDD)
-            output_variables.update(node.get_output_variables())
-        return output_variables
+        return self._output_variables
 
     def get_auxiliary_variables(self) -> Set[str]:
-        return set()
+        return frozenset()
 
     def get_boolean_functions(self) -> Set[BooleanFunction]:
-        bdds = set()
-        for bdd in self.bdds.values():
-            bdds.add(bdd)
-        return bdds
+        return self._boolean_functions
 
     def eval(self, instance: Dict[str, bool]) -> Dict[str, bool]:
         raise NotImplementedError()
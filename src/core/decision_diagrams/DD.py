@@ -9,12 +9,19 @@ from core.IOInterface import IOInterface
 
 class DD(BooleanFunction, IOInterface, DrawInterface, ABC):
 
-    def __init__(self, graph: DiGraph, name: str = None):
+    def __init__(self, graph: DiGraph, name: str = None, acyclic: bool = False):
+        """
+        A decision diagram is defined by its directed acyclic graph (DAG), and optionally a name.
+        :param graph: The DAG of the decision diagram.
+        :param name: Optionally, a name for the decision diagram.
+        :param acyclic: Whether the given graph is known to be a DAG, e.g. because it is a subgraph of the DAG of
+        another decision diagram. Then, it is not checked again.
+        """
         super().__init__(name)
         self.root_nodes = set()
 
         # The given graph must be a DAG.
-        if not is_directed_acyclic_graph(graph):
+        if not acyclic and not is_directed_acyclic_graph(graph):
             raise Exception("Given graph is not a DAG.")
 
         # The given graph must be weakly connected.
@@ -22,3 +29,13 @@ class DD(BooleanFunction, IOInterface, DrawInterface, ABC):
             raise Exception("Given graph is not weakly connected.")
 
         self.dag = graph
+        # The pruned decision diagram of this decision diagram, once it has been pruned.
+        # The DAG of a decision diagram does not change once it is constructed, hence it is pruned at most once.
+        self._pruned = None
+
+    def prune_to_string(self) -> str:
+        """
+        Returns the description of the pruned decision diagram of this decision diagram.
+        :return: A description of the pruned decision diagram.
+        """
+        return self.prune().to_string()
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Set
+from typing import Set, TextIO, Iterable
 
 from core.BooleanFunctionCollection import BooleanFunctionCollection
 from core.decision_diagrams.DD import DD
@@ -9,7 +9,7 @@ from core.decision_diagrams.DD import DD
 
 class DDCollection(BooleanFunctionCollection):
 
-    def __init__(self, dds: Set[DD] = None):
+    def __init__(self, dds: Iterable[DD] = None):
         super().__init__(dds)
 
     def get_input_variables(self) -> Set[str]:
@@ -26,17 +26,49 @@ class DDCollection(BooleanFunctionCollection):
         raise NotImplementedError()
 
     def to_string(self) -> str:
-        content = ""
+        return "".join(dd.to_string() for dd in self.boolean_functions)
+
+    def write_to(self, fp: TextIO):
+        # The decision diagrams are written one at a time, such that the content of the collection
+        # is not held in memory at once.
         for dd in self.boolean_functions:
-            content += dd.to_string()
-        return content
+            dd.write_to(fp)
+
+    def prune_to_string(self) -> str:
+        """
+        Returns the description of the pruned collection of this collection, without constructing
+        the pruned decision diagrams.
+        :return: A description of the pruned collection.
+        """
+        return "".join(dd.prune_to_string() for dd in self.boolean_functions)
 
     def add(self, dd: DD):
         super().add(dd)
 
     def prune(self) -> DDCollection:
-        new_dd_collection = DDCollection()
+        """
+        Prunes each decision diagram of this collection.
+        Decision diagrams that have been pruned before, e.g. because this collection has been pruned before,
+        are not pruned again.
+        :return: A collection of the same type with the pruned decision diagrams, or this collection if all of its
+        decision diagrams are pruned already.
+        """
+        if all(dd._pruned is dd for dd in self.boolean_functions):
+            return self
+
         for dd in self.boolean_functions:
-            new_dd = dd.prune()
-            new_dd_collection.add(new_dd)
-        return new_dd_collection
+            if dd._pruned is None:
+                new_dd = dd.prune()
+                new_dd._pruned = new_dd
+                dd._pruned = new_dd
+        return type(self)(dd._pruned for dd in self.boolean_functions)
+
+    def prune_inplace(self) -> DDCollection:
+        """
+        Prunes each decision diagram of this collection, and replaces the decision diagrams of this collection with
+        the pruned decision diagrams. The original decision diagrams can be garbage collected afterwards, unless they
+        are referenced elsewhere.
+        :return: This collection.
+        """
+        self.boolean_functions = self.prune().boolean_functions
+        return self
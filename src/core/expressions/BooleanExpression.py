@@ -2,13 +2,27 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from functools import reduce
-from typing import Dict, Set
+from typing import Dict, Set, List, Tuple, Optional, Iterable
 
 from z3 import Bool, Not, Xor, Or, And, If
 
 
 class BooleanExpression(ABC):
 
+    # Subclasses that are instantiated in bulk, e.g. per memristor of a crossbar, declare their slots.
+    __slots__ = ()
+
+    # The operators of the flat form of a Boolean expression.
+    FLAT_LITERAL = 0
+    FLAT_NEGATIVE_LITERAL = 1
+    FLAT_TRUE = 2
+    FLAT_FALSE = 3
+    FLAT_AND = 4
+    FLAT_OR = 5
+    FLAT_NOT = 6
+    FLAT_XOR = 7
+    FLAT_IF = 8
+
     @staticmethod
     def _tree_to_boolean_expression(lst) -> BooleanExpression:
         """
@@ -133,6 +147,127 @@ class BooleanExpression(ABC):
     def substitute(self, original: LITERAL, replacement: BooleanExpression) -> BooleanExpression:
         pass
 
+    def substitute_many(self, substitutions: Dict[str, BooleanExpression],
+                        memo: Dict[int, BooleanExpression] = None) -> BooleanExpression:
+        """
+        Substitutes each literal over an atom of the given substitutions by the replacement of that atom.
+        A negative literal is substituted by the negation of the replacement.
+        Contrary to substitute, all atoms are substituted in a single pass over this Boolean expression.
+        Sub-expressions that are shared are substituted once, such that their substitutions are shared as well.
+        The negation of a replacement is constructed once as well.
+        :param substitutions: A dictionary mapping an atom to its replacement.
+        :param memo: Optionally, the memo of previous substitutions, to share the substitutions among several
+        Boolean expressions. The atoms must then have the same replacements in each substitution.
+        :return: The Boolean expression after substitution.
+        """
+        if memo is None:
+            memo = dict()
+        return self._substitute_many(substitutions, memo)
+
+    def _substitute_many(self, substitutions: Dict[str, BooleanExpression],
+                         memo: Dict[int, BooleanExpression]) -> BooleanExpression:
+        """
+        Auxiliary function for substitute_many.
+        :param substitutions: A dictionary mapping an atom to its replacement.
+        :param memo: A dictionary mapping the id of each sub-expression that has been substituted to its substitution.
+        :return: The Boolean expression after substitution.
+        """
+        if id(self) not in memo:
+            memo[id(self)] = self._substitute_children(substitutions, memo)
+        return memo[id(self)]
+
+    @abstractmethod
+    def _substitute_children(self, substitutions: Dict[str, BooleanExpression],
+                             memo: Dict[int, BooleanExpression]) -> BooleanExpression:
+        pass
+
+    def flatten(self) -> Tuple[List[int], List[Tuple[int, ...]], List[Optional[str]]]:
+        """
+        Returns the flat form of this Boolean expression, i.e. its sub-expressions in post-order.
+        The sub-expression in slot i has operator ops[i], its child sub-expressions in the slots args[i],
+        and, if it is a literal, the atom literals[i]. Sub-expressions that are shared occupy a single slot.
+        :return: A tuple of the operators, the arguments, and the atoms of the slots.
+        """
+        ops, args, literals, _ = BooleanExpression.flatten_all([self])
+        return ops, args, literals
+
+    @staticmethod
+    def flatten_all(expressions: Iterable[BooleanExpression]) -> Tuple[List[int], List[Tuple[int, ...]],
+                                                                       List[Optional[str]], List[int]]:
+        """
+        Returns the flat form of the given Boolean expressions, in which the sub-expressions they share occupy
+        a single slot. The sub-expressions are visited iteratively, such that deep expressions do not exceed
+        the recursion limit.
+        :param expressions: The given Boolean expressions.
+        :return: A tuple of the operators, the arguments, the atoms of the slots, and the slot of each given
+        Boolean expression.
+        """
+        ops = []
+        args = []
+        literals = []
+        slots = dict()
+        roots = []
+        for expression in expressions:
+            stack = [(expression, False)]
+            while stack:
+                sub_expression, visited = stack.pop()
+                if id(sub_expression) in slots:
+                    continue
+                op, children, literal = sub_expression._get_flat_node()
+                if visited:
+                    slots[id(sub_expression)] = len(ops)
+                    ops.append(op)
+                    args.append(tuple(slots[id(child)] for child in children))
+                    literals.append(literal)
+                else:
+                    stack.append((sub_expression, True))
+                    stack.extend((child, False) for child in children if id(child) not in slots)
+            roots.append(slots[id(expression)])
+        return ops, args, literals, roots
+
+    @staticmethod
+    def flat_to_z3(ops: List[int], args: List[Tuple[int, ...]], literals: List[Optional[str]]) -> List[Bool]:
+        """
+        Converts the slots of a flat form into Z3 expressions with a single linear scan.
+        :param ops: The operators of the slots.
+        :param args: The arguments of the slots.
+        :param literals: The atoms of the slots.
+        :return: A list with the Z3 expression of each slot.
+        """
+        z3_expressions = []
+        for op, arg, literal in zip(ops, args, literals):
+            children = [z3_expressions[i] for i in arg]
+            if op == BooleanExpression.FLAT_LITERAL:
+                z3_expression = Bool(literal)
+            elif op == BooleanExpression.FLAT_NEGATIVE_LITERAL:
+                z3_expression = Not(Bool(literal))
+            elif op == BooleanExpression.FLAT_TRUE:
+                z3_expression = True
+            elif op == BooleanExpression.FLAT_FALSE:
+                z3_expression = False
+            elif op == BooleanExpression.FLAT_AND:
+                z3_expression = And(*children)
+            elif op == BooleanExpression.FLAT_OR:
+                z3_expression = Or(*children)
+            elif op == BooleanExpression.FLAT_NOT:
+                z3_expression = Not(*children)
+            elif op == BooleanExpression.FLAT_XOR:
+                z3_expression = Xor(*children)
+            elif op == BooleanExpression.FLAT_IF:
+                z3_expression = If(*children)
+            else:
+                raise Exception("Unknown operator {} in flat form.".format(op))
+            z3_expressions.append(z3_expression)
+        return z3_expressions
+
+    @abstractmethod
+    def _get_flat_node(self) -> Tuple[int, Tuple[BooleanExpression, ...], Optional[str]]:
+        """
+        Returns the operator, the child sub-expressions, and the atom of this Boolean expression in the flat form.
+        :return: A tuple of the operator, the child sub-expressions, and the atom (or None).
+        """
+        pass
+
     @abstractmethod
     def simplify(self) -> BooleanExpression:
         pass
@@ -174,6 +309,13 @@ class AND(BooleanExpression):
             expressions.add(expression.substitute(original, replacement))
         return AND(expressions)
 
+    def _substitute_children(self, substitutions: Dict[str, BooleanExpression],
+                             memo: Dict[int, BooleanExpression]) -> BooleanExpression:
+        return AND({expression._substitute_many(substitutions, memo) for expression in self.expressions})
+
+    def _get_flat_node(self) -> Tuple[int, Tuple[BooleanExpression, ...], Optional[str]]:
+        return BooleanExpression.FLAT_AND, tuple(self.expressions), None
+
     def simplify(self) -> BooleanExpression:
         """
         TODO: Flatten a conjunction of conjunctions
@@ -225,6 +367,13 @@ class OR(BooleanExpression):
             expressions.add(expression.substitute(original, replacement))
         return OR(expressions)
 
+    def _substitute_children(self, substitutions: Dict[str, BooleanExpression],
+                             memo: Dict[int, BooleanExpression]) -> BooleanExpression:
+        return OR({expression._substitute_many(substitutions, memo) for expression in self.expressions})
+
+    def _get_flat_node(self) -> Tuple[int, Tuple[BooleanExpression, ...], Optional[str]]:
+        return BooleanExpression.FLAT_OR, tuple(self.expressions), None
+
     def simplify(self) -> BooleanExpression:
         self.expressions = set(map(lambda e: e.simplify(), self.expressions))
         if TRUE() in self.expressions:
@@ -269,6 +418,13 @@ class NOT(BooleanExpression):
     def substitute(self, original: LITERAL, replacement: BooleanExpression) -> BooleanExpression:
         return NOT(self.expression.substitute(original, replacement))
 
+    def _substitute_children(self, substitutions: Dict[str, BooleanExpression],
+                             memo: Dict[int, BooleanExpression]) -> BooleanExpression:
+        return NOT(self.expression._substitute_many(substitutions, memo))
+
+    def _get_flat_node(self) -> Tuple[int, Tuple[BooleanExpression, ...], Optional[str]]:
+        return BooleanExpression.FLAT_NOT, (self.expression,), None
+
     def simplify(self) -> BooleanExpression:
         return self.expression.negate()
 
@@ -303,6 +459,13 @@ class XOR(BooleanExpression):
             expressions.add(expression.substitute(original, replacement))
         return XOR(expressions)
 
+    def _substitute_children(self, substitutions: Dict[str, BooleanExpression],
+                             memo: Dict[int, BooleanExpression]) -> BooleanExpression:
+        return XOR({expression._substitute_many(substitutions, memo) for expression in self.expressions})
+
+    def _get_flat_node(self) -> Tuple[int, Tuple[BooleanExpression, ...], Optional[str]]:
+        return BooleanExpression.FLAT_XOR, tuple(self.expressions), None
+
     def simplify(self) -> BooleanExpression:
         """
         To simplify a XOR operations over a set of sub-expressions, we do the following after [1]:
@@ -366,6 +529,16 @@ class IF(BooleanExpression):
         false_expression = self.false_expression.substitute(original, replacement)
         return IF(condition, true_expression, false_expression)
 
+    def _substitute_children(self, substitutions: Dict[str, BooleanExpression],
+                             memo: Dict[int, BooleanExpression]) -> BooleanExpression:
+        condition = self.condition._substitute_many(substitutions, memo)
+        true_expression = self.true_expression._substitute_many(substitutions, memo)
+        false_expression = self.false_expression._substitute_many(substitutions, memo)
+        return IF(condition, true_expression, false_expression)
+
+    def _get_flat_node(self) -> Tuple[int, Tuple[BooleanExpression, ...], Optional[str]]:
+        return BooleanExpression.FLAT_IF, (self.condition, self.true_expression, self.false_expression), None
+
     def simplify(self) -> BooleanExpression:
         raise NotImplementedError()
 
@@ -377,6 +550,8 @@ class IF(BooleanExpression):
 
 class LITERAL(BooleanExpression):
 
+    __slots__ = ("atom", "positive")
+
     def __init__(self, name: str, positive: bool = True):
         super().__init__()
         self.atom = name
@@ -439,6 +614,24 @@ class LITERAL(BooleanExpression):
             return NOT(replacement)
         return self.copy()
 
+    def _substitute_children(self, substitutions: Dict[str, BooleanExpression],
+                             memo: Dict[int, BooleanExpression]) -> BooleanExpression:
+        replacement = substitutions.get(self.atom)
+        if replacement is not None:
+            if self.positive:
+                return replacement
+            # The negation of a replacement is memoized by the complement of the id of the replacement,
+            # which cannot collide with the id of a sub-expression.
+            if ~id(replacement) not in memo:
+                memo[~id(replacement)] = NOT(replacement)
+            return memo[~id(replacement)]
+        return self.copy()
+
+    def _get_flat_node(self) -> Tuple[int, Tuple[BooleanExpression, ...], Optional[str]]:
+        if self.positive:
+            return BooleanExpression.FLAT_LITERAL, (), self.atom
+        return BooleanExpression.FLAT_NEGATIVE_LITERAL, (), self.atom
+
     def simplify(self) -> BooleanExpression:
         return self
 
@@ -462,6 +655,8 @@ class LITERAL(BooleanExpression):
 
 class TRUE(LITERAL):
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("True", True)
 
@@ -489,6 +684,13 @@ class TRUE(LITERAL):
     def substitute(self, original: LITERAL, replacement: BooleanExpression) -> BooleanExpression:
         return self
 
+    def _substitute_children(self, substitutions: Dict[str, BooleanExpression],
+                             memo: Dict[int, BooleanExpression]) -> BooleanExpression:
+        return self
+
+    def _get_flat_node(self) -> Tuple[int, Tuple[BooleanExpression, ...], Optional[str]]:
+        return BooleanExpression.FLAT_TRUE, (), None
+
     def simplify(self) -> BooleanExpression:
         return self
 
@@ -498,6 +700,8 @@ class TRUE(LITERAL):
 
 class FALSE(LITERAL):
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("False", False)
 
@@ -525,8 +729,21 @@ class FALSE(LITERAL):
     def substitute(self, original: LITERAL, replacement: BooleanExpression) -> BooleanExpression:
         return self
 
+    def _substitute_children(self, substitutions: Dict[str, BooleanExpression],
+                             memo: Dict[int, BooleanExpression]) -> BooleanExpression:
+        return self
+
+    def _get_flat_node(self) -> Tuple[int, Tuple[BooleanExpression, ...], Optional[str]]:
+        return BooleanExpression.FLAT_FALSE, (), None
+
     def simplify(self) -> BooleanExpression:
         return self
 
     def eval(self, instance: Dict[str, bool]) -> bool:
         return False
+
+
+# The literals of the constants, shared by all modules such that they are not constructed per use. Literals are not
+# modified in place, and hence may be shared.
+TRUE_LITERAL = LITERAL("True", True)
+FALSE_LITERAL = LITERAL("False", False)
@@ -1,10 +1,8 @@
-from abc import ABC
-
 from core.BooleanFunction import BooleanFunction
 from core.DrawInterface import DrawInterface
 from core.IOInterface import IOInterface
 
 
-class Component(BooleanFunction, IOInterface, DrawInterface, ABC):
+class Component(BooleanFunction, IOInterface, DrawInterface):
 
     pass
@@ -1,18 +1,224 @@
 from __future__ import annotations
 
-import copy
 import re
+from functools import lru_cache
 from abc import abstractmethod, ABC
 from pathlib import Path
-from typing import Dict, Tuple, Set, Any, List
+from typing import Dict, Tuple, Set, Any, List, Iterator, TextIO, Sequence, Union
 
 import numpy as np
-from networkx import Graph, set_node_attributes, connected_components, has_path
+from networkx import Graph, set_node_attributes, connected_components, node_connected_component
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 from core.BooleanFunction import BooleanFunction
+from core.benchmarks.TruthTable import TruthTable
 from core.hardware.Component import Component
 from core.hardware.Memristor import Memristor
-from core.expressions.BooleanExpression import LITERAL, FALSE, TRUE
+from core.expressions.BooleanExpression import LITERAL, FALSE, TRUE, TRUE_LITERAL, FALSE_LITERAL
+
+# The constants are shared by all crossbars, such that they are not constructed per memristor. Literals are not
+# modified in place, and hence may be shared.
+_TRUE = TRUE()
+_FALSE = FALSE()
+
+# The styles of the nodes in the dot representation of a crossbar, i.e. of the memristors and of the labels.
+_DOT_FALSE_STYLE = 'color="#000000", fillcolor="#eeeeee", style="filled,solid"'
+_DOT_TRUE_STYLE = 'color="#000000", fillcolor="#cadfb8", style="filled,solid"'
+_DOT_LITERAL_STYLE = 'color="#000000", fillcolor="#b4c7e7", style="filled,solid"'
+_DOT_LABEL_STYLE = 'color="#ffffff", fillcolor="#ffffff", style="filled,solid"'
+
+# A token of a memristor in the content of a crossbar, i.e. a constant or a (negated) atom.
+_TOKEN_RE = re.compile(r'(-|0|1|[\[\]a-z0-9]+|~[\[\]a-z0-9]+)')
+
+
+def _parse_token(element: str) -> LITERAL:
+    """
+    Returns the literal of the given memristor in the content of a crossbar.
+    The constants are recognized directly, other elements are matched with the token expression.
+    :param element: The content of the memristor, possibly with surrounding whitespace.
+    :return: The literal of the memristor.
+    """
+    element = element.strip()
+    if element == '0':
+        return FALSE_LITERAL
+    elif element == '1':
+        return TRUE_LITERAL
+    match = _TOKEN_RE.search(element)
+    if match is None:
+        raise Exception("Unknown memristor \"{}\" in crossbar.".format(element))
+    raw_literal = match.group(0)
+    if raw_literal == '0':
+        return FALSE_LITERAL
+    elif raw_literal == '1':
+        return TRUE_LITERAL
+    elif raw_literal[0] == '~':
+        return LITERAL(raw_literal[1:], False)
+    else:
+        return LITERAL(raw_literal, True)
+
+
+def _split_content(lines: List[str]) -> Tuple[List[str], List[str]]:
+    """
+    Splits the lines of the content of a crossbar into the lines of its header, i.e. before .xbar, and the lines of
+    its rows, i.e. between .xbar and .end.
+    :param lines: The lines of the content of a crossbar.
+    :return: A tuple of the header lines and the row lines.
+    """
+    for i, line in enumerate(lines):
+        if line.startswith(".xbar"):
+            for j in range(i + 1, len(lines)):
+                if lines[j].startswith(".end"):
+                    return lines[:i], lines[i + 1:j]
+            return lines[:i], lines[i + 1:]
+    return lines, []
+
+
+def _read_header(lines: List[str]) -> Dict[str, List[List[str]]]:
+    """
+    Returns the values of the given header lines of the content of a crossbar, grouped by their keyword.
+    :param lines: The header lines of the content of a crossbar.
+    :return: A dictionary mapping each keyword, e.g. '.rows', to the values of its lines, in order.
+    """
+    header = dict()
+    for line in lines:
+        raw_values = line.split()
+        if raw_values:
+            header.setdefault(raw_values[0], []).append(raw_values)
+    return header
+
+
+def _read_size(header: Dict[str, List[List[str]]], keyword: str) -> int:
+    """
+    Returns the size of a crossbar, i.e. its rows or columns, in the given header. The last occurrence takes precedence.
+    :param header: The values of the header lines, grouped by their keyword.
+    :param keyword: The keyword of the size, i.e. '.rows' or '.columns'.
+    :return: The size, or 0 if it is absent.
+    """
+    if keyword not in header:
+        return 0
+    (_, raw_value) = header[keyword][-1]
+    return int(raw_value)
+
+
+@lru_cache(maxsize=64)
+def _get_nanowire_names(layers: int, nanowires: int) -> Tuple[Tuple[str, ...], ...]:
+    """
+    Returns the names of the nanowires in the graph of a crossbar, i.e. "L<layer>_<index>". The names are formatted
+    once per shape, and shared by all crossbars of that shape.
+    :param layers: The number of layers of nanowires.
+    :param nanowires: The number of nanowires in each layer.
+    :return: A tuple with a tuple of names per layer of nanowires.
+    """
+    return tuple(tuple(f"L{layer}_{i}" for i in range(nanowires)) for layer in range(layers))
+
+
+def _reach(mask: np.ndarray, layer: int, nanowire: int) -> np.ndarray:
+    """
+    Returns the nanowires of a crossbar that are connected to the given nanowire by the marked memristors, with a
+    breadth-first search over the mask of the memristors. A nanowire in an even layer is a row, and a nanowire in an
+    odd layer is a column. The memristors of layer l connect the nanowires of layers l and l + 1.
+    This function is compiled with Numba when available.
+    :param mask: A three-dimensional Boolean array marking the memristors of each layer that conduct.
+    :param layer: The layer of the given nanowire.
+    :param nanowire: The index of the given nanowire in its layer.
+    :return: A two-dimensional Boolean array marking the connected nanowires, with a row per layer of nanowires.
+    """
+    layers, rows, columns = mask.shape
+    size = max(rows, columns)
+    reached = np.zeros((layers + 1, size), dtype=np.bool_)
+    queue_layers = np.empty((layers + 1) * size, dtype=np.int64)
+    queue_nanowires = np.empty((layers + 1) * size, dtype=np.int64)
+    reached[layer, nanowire] = True
+    queue_layers[0] = layer
+    queue_nanowires[0] = nanowire
+    head = 0
+    tail = 1
+    while head < tail:
+        k = queue_layers[head]
+        i = queue_nanowires[head]
+        head += 1
+        # The memristors below (layer k - 1) and above (layer k) the nanowire, if any.
+        for l in range(max(k - 1, 0), min(k + 1, layers)):
+            other = 2 * l + 1 - k
+            if k % 2 == 0:
+                for c in range(columns):
+                    if mask[l, i, c] and not reached[other, c]:
+                        reached[other, c] = True
+                        queue_layers[tail] = other
+                        queue_nanowires[tail] = c
+                        tail += 1
+            else:
+                for r in range(rows):
+                    if mask[l, r, i] and not reached[other, r]:
+                        reached[other, r] = True
+                        queue_layers[tail] = other
+                        queue_nanowires[tail] = r
+                        tail += 1
+    return reached
+
+
+if njit is not None:
+    _reach = njit(cache=True, boundscheck=False)(_reach)
+
+
+def _reach_batch(conducting: np.ndarray, layer: int, nanowire: int) -> np.ndarray:
+    """
+    Returns for a batch of instances the nanowires of a crossbar that are connected to the given nanowire. Every bit
+    of a 64-bit word denotes an instance, such that 64 instances are propagated at once. The reached nanowires are
+    propagated over the memristors of each layer, in both directions, until no nanowire is reached anymore.
+    :param conducting: A four-dimensional array of 64-bit words, with the layer, the row and the column of a memristor
+    as the first three dimensions, marking per instance the memristors that conduct.
+    :param layer: The layer of the given nanowire.
+    :param nanowire: The index of the given nanowire in its layer.
+    :return: A three-dimensional array of 64-bit words, with the layer and the index of a nanowire as the first two
+    dimensions, marking per instance the connected nanowires.
+    """
+    layers, rows, columns, words = conducting.shape
+    reached = np.zeros((layers + 1, max(rows, columns), words), dtype=np.uint64)
+    reached[layer, nanowire] = ~np.uint64(0)
+    changed = True
+    while changed:
+        changed = False
+        for l in range(layers):
+            # The memristors of layer l connect the nanowires of layers l and l + 1, of which the even one has rows.
+            row_layer, column_layer = (l, l + 1) if l % 2 == 0 else (l + 1, l)
+            row_reached = reached[row_layer, :rows]
+            column_reached = reached[column_layer, :columns]
+            new_column_reached = column_reached | np.bitwise_or.reduce(row_reached[:, None] & conducting[l], axis=0)
+            new_row_reached = row_reached | np.bitwise_or.reduce(new_column_reached[None, :] & conducting[l], axis=1)
+            if not (np.array_equal(new_row_reached, row_reached) and np.array_equal(new_column_reached,
+                                                                                    column_reached)):
+                reached[row_layer, :rows] = new_row_reached
+                reached[column_layer, :columns] = new_column_reached
+                changed = True
+    return reached
+
+
+@lru_cache(maxsize=64)
+def _get_nanowires(layers: int, rows: int, columns: int) -> Tuple[Tuple[int, int], ...]:
+    """
+    Returns the nanowires of a crossbar with the given shape, each a tuple of its layer and its index, in the order in
+    which they occur in the graph of the crossbar.
+    :param layers: The number of layers of memristors.
+    :param rows: The number of rows.
+    :param columns: The number of columns.
+    :return: A tuple of nanowires.
+    """
+    if rows == 0 or columns == 0:
+        return ()
+    nanowires = dict()
+    for layer in range(layers):
+        if layer % 2 == 0:
+            nanowires.update(dict.fromkeys([(layer, 0)] + [(layer + 1, c) for c in range(columns)] +
+                                           [(layer, r) for r in range(1, rows)]))
+        else:
+            nanowires.update(dict.fromkeys([(layer, 0), (layer + 1, 0)] + [(layer, c) for c in range(1, columns)] +
+                                           [(layer + 1, r) for r in range(1, rows)]))
+    return tuple(nanowires)
 
 
 class Crossbar(Component, ABC):
@@ -34,17 +240,99 @@ class Crossbar(Component, ABC):
         self.layers = layers
         self.input_nanowires = dict()
         self.output_nanowires = dict()
-        self.matrix = [[[Memristor(r, c, FALSE(), l) for c in range(self.columns)] for r in range(self.rows)] for l in range(self.layers)]
+        # Instead of a memristor object per memristor, the literals of the memristors are stored as indices in a
+        # table of literals. Index 0 refers to FALSE, which is the literal of a memristor that is not assigned.
+        self.literal_table = [_FALSE]
+        self._literal_table_indices = {(FALSE, "False", False): 0}
+        self.literal_matrix = np.zeros((self.layers, self.rows, self.columns), dtype=np.int32)
+        # The graphs of this crossbar, by the representation of their edges, its input variables and the memristors
+        # that may conduct, once they are gathered. They are discarded on any modification.
+        self._graphs = dict()
+        self._input_variables = None
+        self._cells = None
 
     @staticmethod
     def get_file_extension() -> str:
         return "xbar"
 
+    def _get_literal_index(self, literal: LITERAL) -> int:
+        """
+        Returns the index of the given literal in the table of literals of this crossbar.
+        The literal is added to the table if it does not occur in it yet. Literals of different types, e.g. FALSE and
+        LITERAL('False', False), are kept apart, as they are not interchangeable.
+        :param literal: The given literal.
+        :return: The index of the literal in the table of literals.
+        """
+        key = (type(literal), literal.atom, literal.positive)
+        index = self._literal_table_indices.get(key)
+        if index is None:
+            index = self._literal_table_indices[key] = len(self.literal_table)
+            self.literal_table.append(literal)
+        return index
+
+    def _copy_literal_table(self, crossbar: Crossbar):
+        """
+        Copies the table of literals of the given crossbar to this crossbar, such that the indices in the matrix of
+        the given crossbar refer to the same literals in this crossbar.
+        :param crossbar: The given crossbar.
+        """
+        self.literal_table = crossbar.literal_table.copy()
+        self._literal_table_indices = crossbar._literal_table_indices.copy()
+
+    def _get_assigned_literal_indices(self) -> List[int]:
+        """
+        Returns the indices of the literals of the table that are assigned to at least one memristor of this crossbar.
+        The literals are counted in a single pass over the matrix, instead of sorting the matrix.
+        :return: A list of indices in the table of literals, in increasing order.
+        """
+        counts = np.bincount(self.literal_matrix.ravel(), minlength=len(self.literal_table))
+        return np.flatnonzero(counts).tolist()
+
+    def _copy_literals(self) -> Crossbar:
+        """
+        Returns a copy of this crossbar of which the memristors can be assigned without changing this crossbar.
+        In contrast to a deep copy, only the matrix, the table of literals and the nanowires are copied, and the other
+        attributes are shared. The literals are shared as well, as a literal does not change once it is constructed.
+        :return: A copy of this crossbar.
+        """
+        crossbar = type(self).__new__(type(self))
+        crossbar.__dict__.update(self.__dict__)
+        crossbar._copy_literal_table(self)
+        crossbar.literal_matrix = self.literal_matrix.copy()
+        crossbar.input_nanowires = self.input_nanowires.copy()
+        crossbar.output_nanowires = self.output_nanowires.copy()
+        crossbar._graphs = dict()
+        crossbar._input_variables = None
+        crossbar._cells = None
+        return crossbar
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Crossbar:
+        # The literals are shared instead of copied recursively, as a literal does not change once it is constructed.
+        crossbar = self._copy_literals()
+        memo[id(self)] = crossbar
+        return crossbar
+
+    def __getstate__(self):
+        # The graphs are not pickled, e.g. when a crossbar is sent to or from a worker process.
+        state = self.__dict__.copy()
+        state["_graphs"] = dict()
+        return state
+
+    def _invalidate_caches(self):
+        """
+        Discards the graphs, the input variables and the memristors that may conduct of this crossbar, such that they
+        are gathered again after a modification.
+        """
+        if self._graphs:
+            self._graphs = dict()
+        self._input_variables = None
+        self._cells = None
+
     @staticmethod
     def _literal_representation(literal: LITERAL):
-        if literal == LITERAL("True", True):
+        if literal == TRUE_LITERAL:
             return 1
-        elif literal == LITERAL("False", False):
+        elif literal == FALSE_LITERAL:
             return 0
         else:
             return literal
@@ -62,12 +350,193 @@ class Crossbar(Component, ABC):
                     raise Exception("Unknown crossbar type.")
         raise Exception("No crossbar type defined.")
 
+    def _read_interface(self, header: Dict[str, List[List[str]]]):
+        """
+        Assigns the input variables, the input nanowires and the output nanowires of this crossbar from the given
+        header of its content.
+        :param header: The values of the header lines, grouped by their keyword.
+        """
+        self.input_variables = None
+        for raw_values in header.get(".inputs", []):
+            self.input_variables = set(raw_values[1:])
+        self.input_nanowires = Crossbar._read_nanowires(header.get(".i", []))
+        self.output_nanowires = Crossbar._read_nanowires(header.get(".o", []))
+
+    @staticmethod
+    def _read_nanowires(lines_values: List[List[str]]) -> Dict[str, Tuple[int, int]]:
+        """
+        Returns the nanowires of the given values of the .i or .o header lines. A nanowire without a layer is a row.
+        :param lines_values: The values of the header lines.
+        :return: A dictionary mapping each variable to its nanowire.
+        """
+        nanowires = dict()
+        for raw_values in lines_values:
+            if len(raw_values) == 3:
+                nanowires[raw_values[1]] = (0, int(raw_values[2]))
+            elif len(raw_values) == 4:
+                nanowires[raw_values[1]] = (int(raw_values[2]), int(raw_values[3]))
+            else:
+                raise Exception("Length incorrect.")
+        return nanowires
+
+    def _read_literal_matrix(self, lines: List[str]):
+        """
+        Assigns the memristors of the first layer of this crossbar from the lines of its content between .xbar and
+        .end, a line per row. Every distinct element is parsed once, the other occurrences are looked up.
+        :param lines: The row lines of the content of this crossbar.
+        """
+        element_indices = dict()
+        for r, line in enumerate(lines):
+            elements = line.rstrip("\r\n").split("\t")
+            # Most rows only hold elements that occurred before, such that the row is looked up at once. A row with a
+            # new element is looked up again after parsing its new elements, in order of occurrence.
+            try:
+                row = [element_indices[element] for element in elements]
+            except KeyError:
+                for element in elements:
+                    if element not in element_indices:
+                        element_indices[element] = self._get_literal_index(_parse_token(element))
+                row = [element_indices[element] for element in elements]
+            self.literal_matrix[0, r, :len(row)] = row
+
     @staticmethod
     def read(file_path: Path) -> BooleanFunction:
         with open(file_path, 'r') as f:
             content = f.read()
             return Crossbar.from_string(content)
 
+    def to_string(self) -> str:
+        return "".join(self._iter_string())
+
+    def write_to(self, fp: TextIO):
+        # The content is written line by line, such that the rows of a large crossbar are not joined first.
+        fp.writelines(self._iter_string())
+
+    @abstractmethod
+    def _iter_string(self) -> Iterator[str]:
+        """
+        Returns the content of this crossbar, in its file format, line by line.
+        :return: An iterator over the lines of the content.
+        """
+        pass
+
+    def _iter_nanowires(self) -> Iterator[str]:
+        """
+        Returns the lines describing the input nanowires and the output nanowires of this crossbar.
+        A nanowire in layer 0 is described by its index only.
+        :return: An iterator over the lines of the nanowires.
+        """
+        for (input_variable, (layer, nanowire)) in self.get_input_nanowires().items():
+            if layer == 0:
+                yield ".i {} {}\n".format(input_variable, nanowire)
+            else:
+                yield ".i {} {} {}\n".format(input_variable, layer, nanowire)
+        for (output_variable, (layer, nanowire)) in self.get_output_nanowires().items():
+            if layer == 0:
+                yield ".o {} {}\n".format(output_variable, nanowire)
+            else:
+                yield ".o {} {} {}\n".format(output_variable, layer, nanowire)
+
+    def _iter_matrix(self) -> Iterator[str]:
+        """
+        Returns the lines describing the memristors of the first layer of this crossbar, a line per row.
+        The representation of each literal of the table of literals is formatted once.
+        :return: An iterator over the lines of the rows.
+        """
+        representations = [str(self._literal_representation(literal)) for literal in self.literal_table]
+        for row in self.literal_matrix[0].tolist():
+            yield "\t".join([representations[i] for i in row]) + "\r\n"
+
+    @staticmethod
+    def _get_dot_header(name: str) -> List[str]:
+        """
+        Returns the lines that open the dot representation of a crossbar with the given name.
+        :param name: The name of the crossbar.
+        :return: A list of lines.
+        """
+        return [
+            f'graph {name} {{\n',
+            '\tgraph [nodesep="0.2", ranksep="0.2"];\n',
+            '\tcharset="UTF-8";\n',
+            '\tratio=fill;\n',
+            '\tsplines=polyline;\n',
+            '\toverlap=scale;\n',
+            '\tnode [shape=circle, fixedsize=true, width=0.4, fontsize=8];\n',
+            '\n'
+        ]
+
+    def _get_dot_memristors(self, layer: int) -> List[str]:
+        """
+        Returns the lines describing the memristors of the given layer in the dot representation of this crossbar,
+        column by column. The label and the style of each literal of the table of literals are formatted once.
+        :param layer: The given layer of memristors.
+        :return: A list of lines.
+        """
+        attributes = []
+        for literal in self.literal_table:
+            if literal.atom == 'False':
+                attributes.append(f'[label="0" {_DOT_FALSE_STYLE}]\n')
+            elif literal.atom == 'True':
+                attributes.append(f'[label="1" {_DOT_TRUE_STYLE}]\n')
+            elif not literal.positive:
+                attributes.append(f'[label="¬{literal.atom}" {_DOT_LITERAL_STYLE}]\n')
+            else:
+                attributes.append(f'[label="{literal.atom}" {_DOT_LITERAL_STYLE}]\n')
+
+        parts = ['\n\t// Memristors\n']
+        for c, column in enumerate(self.literal_matrix[layer].T.tolist(), 1):
+            parts.extend([f'\tm{r}_{c} {attributes[i]}' for r, i in enumerate(column, 1)])
+        return parts
+
+    def _get_dot_input_labels(self) -> Dict[int, str]:
+        """
+        Returns the labels of the input nanowires in the dot representation of this crossbar.
+        If several input functions share a nanowire, the last one is shown.
+        :return: A dictionary mapping the index of an input nanowire to its label.
+        """
+        return {row: f'Vin<SUB>{input_function}</SUB>'
+                for (input_function, (_, row)) in self.get_input_nanowires().items()}
+
+    def _get_dot_outputs_and_grid(self, layer: int) -> List[str]:
+        """
+        Returns the lines describing the output functions of the given layer, and the grid of nanowires, in the dot
+        representation of this crossbar.
+        :param layer: The given layer of memristors.
+        :return: A list of lines.
+        """
+        parts = ['\n\t// Outputs (right y-axis)\n']
+        # Outputs
+        output_variables = dict()
+        for (o, (l, r)) in self.output_nanowires.items():
+            output_variables.setdefault((l, r), []).append(o)
+        for ((l, r), os) in output_variables.items():
+            if layer == l:
+                for v in os:
+                    parts.append(f'\tm{r + 1}_{self.columns + 1} [label="{v}" {_DOT_LABEL_STYLE}];\n')
+
+        parts.append('\n\t// Crossbar\n')
+        # Important: The description of the grid is transposed when being rendered -> rows and columns are switched
+        # The input rows are gathered once. Only the first edge of a row depends on them, as the edge from the label
+        # of a row that is not an input nanowire is invisible.
+        input_rows = frozenset(row for (_, row) in self.get_input_nanowires().values())
+        for r in range(self.rows):
+            parts.append('\trank=same {\n')
+            if self.columns > 0:
+                if r not in input_rows:
+                    parts.append(f'\t\tm{r + 1}_0 -- m{r + 1}_1 [style=invis];\n')
+                else:
+                    parts.append(f'\t\tm{r + 1}_0 -- m{r + 1}_1;\n')
+            parts.extend([f'\t\tm{r + 1}_{c} -- m{r + 1}_{c + 1};\n' for c in range(1, self.columns)])
+
+            # TODO: Change layer
+            if (0, r) in output_variables:
+                parts.append(f'\t\tm{r + 1}_{self.columns} -- m{r + 1}_{self.columns + 1};\n')
+            parts.append('\t}\n')
+
+        for c in range(self.columns):
+            parts.append('\t' + ' -- '.join([f"m{r + 1}_{c + 1}" for r in range(self.rows)]) + '\n')
+        return parts
+
     @abstractmethod
     def instantiate(self, instance: Dict) -> Crossbar:
         pass
@@ -105,9 +574,97 @@ class Crossbar(Component, ABC):
 
     def set_input_nanowire(self, input_function: str, nanowire: int, layer: int = 0):
         self.input_nanowires[input_function] = (layer, nanowire)
+        self._invalidate_caches()
 
     def set_output_nanowire(self, output_function: str, nanowire: int, layer: int = 0):
         self.output_nanowires[output_function] = (layer, nanowire)
+        self._invalidate_caches()
+
+    def _get_true_literals(self) -> np.ndarray:
+        """
+        Returns for each literal of the table of literals of this crossbar whether it is TRUE.
+        :return: A one-dimensional Boolean array with an entry per literal of the table.
+        """
+        return np.fromiter((literal.atom == "True" and literal.positive for literal in self.literal_table),
+                           dtype=bool, count=len(self.literal_table))
+
+    def _get_true_graph(self, is_true: np.ndarray) -> Graph:
+        """
+        Returns the graph of the nanowires of this crossbar, connected by the memristors of which the literal is true.
+        A nanowire is denoted by a tuple of its layer and its index. Every nanowire is a node, also if it is not
+        connected, and the nanowires are added in the order in which they occur in graph(). Hence, the connected
+        components are found in the same order.
+        :param is_true: A Boolean array with an entry per literal of the table of literals.
+        :return: A graph of nanowires.
+        """
+        graph = Graph()
+        graph.add_nodes_from(_get_nanowires(self.layers, self.rows, self.columns))
+        # Only the edges of the memristors of which the literal is true are added. These are selected from the
+        # memristors that may conduct, which are the same for every instance.
+        coordinates, literal_indices = self._get_cells()
+        graph.add_edges_from(((layer, r), (layer + 1, c)) if layer % 2 == 0 else ((layer, c), (layer + 1, r))
+                             for layer, r, c in coordinates[is_true[literal_indices]].tolist())
+        return graph
+
+    def _get_cells(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the memristors of this crossbar that may conduct, i.e. of which the literal is not over atom 'False'.
+        They are gathered once, and kept until this crossbar is modified, such that the memristors of which the literal
+        is true in an instance are selected without scanning the whole literal matrix.
+        :return: A tuple of the coordinates (layer, row, column) of the memristors, and the indices of their literals.
+        """
+        if self._cells is None:
+            may_conduct = np.fromiter((literal.atom != "False" for literal in self.literal_table), dtype=bool,
+                                      count=len(self.literal_table))
+            coordinates = np.argwhere(may_conduct[self.literal_matrix])
+            self._cells = (coordinates, self.literal_matrix[tuple(coordinates.T)])
+        return self._cells
+
+    def _is_nanowire(self, layer: int, index: int) -> bool:
+        """
+        Returns true if and only if the given nanowire is a nanowire of this crossbar.
+        :param layer: The layer of the nanowire.
+        :param index: The index of the nanowire in its layer.
+        :return: True if the nanowire is in this crossbar, False otherwise.
+        """
+        return 0 <= layer <= self.layers and 0 <= index < (self.rows if layer % 2 == 0 else self.columns)
+
+    def _get_reachable_outputs(self, is_true: np.ndarray, input_function: str) -> Dict[str, bool]:
+        """
+        Returns for each output function of this crossbar whether its output nanowire is connected to the input
+        nanowire of the given input function by the memristors of which the literal is true. The nanowires connected
+        to the input nanowire are found once, instead of searching a path per output function.
+        When Numba is available, a compiled breadth-first search over the literal matrix is used. Otherwise, the
+        connected component is found in a graph of the nanowires with NetworkX.
+        :param is_true: A Boolean array with an entry per literal of the table of literals.
+        :param input_function: The given input function.
+        :return: A dictionary mapping each output function to True if it is connected, and False otherwise.
+        """
+        output_nanowires = self.get_output_nanowires()
+        if not output_nanowires:
+            return dict()
+        input_layer, input_nanowire = self.get_input_nanowire(input_function)
+        if not self._is_nanowire(input_layer, input_nanowire):
+            raise Exception("The input nanowire of input function {} is not in the crossbar.".format(input_function))
+
+        if njit is not None:
+            reached = _reach(is_true[self.literal_matrix], input_layer, input_nanowire)
+            return {output_variable: self._is_nanowire(layer, index) and bool(reached[layer, index])
+                    for (output_variable, (layer, index)) in output_nanowires.items()}
+        reachable = node_connected_component(self._get_true_graph(is_true), (input_layer, input_nanowire))
+        return {output_variable: output_nanowire in reachable
+                for (output_variable, output_nanowire) in output_nanowires.items()}
+
+    def _get_nanowire_name(self, layer: int, index: int) -> str:
+        """
+        Returns the name of the given nanowire in the graph of this crossbar.
+        :param layer: The layer of the nanowire.
+        :param index: The index of the nanowire in its layer.
+        :return: The name of the nanowire.
+        """
+        if 0 <= layer <= self.layers and 0 <= index < max(self.rows, self.columns):
+            return _get_nanowire_names(self.layers + 1, max(self.rows, self.columns))[layer][index]
+        return "L{}_{}".format(layer, index)
 
     def graph(self, boolean_expression_representation: bool = False) -> Graph:
         """
@@ -115,44 +672,43 @@ class Crossbar(Component, ABC):
         The resulting bipartite_graph is a multi-layered bipartite_graph. More specifically, the bipartite_graph is k-layered and bipartite.
         :param boolean_expression_representation: If true, the edge will be represented as a Boolean expression.
         Otherwise, as an atom and a truth value.
+        The graph is built once and shared until this crossbar is modified. Hence, it must be copied before it is
+        modified.
         :return: A k-layered bipartite bipartite_graph.
         """
+        graph = self._graphs.get(boolean_expression_representation)
+        if graph is not None:
+            return graph
         graph = Graph()
+        # The names of the nanowires are formatted once per shape, and the attributes of the edges once per literal.
+        # The edges of a layer are then added at once.
+        names = _get_nanowire_names(self.layers + 1, max(self.rows, self.columns))
+        if boolean_expression_representation:
+            edge_attributes = [{"boolean_expression": literal} for literal in self.literal_table]
+        else:
+            edge_attributes = [{"atom": literal.atom, "positive": literal.positive} for literal in self.literal_table]
         for layer in range(self.layers):
-            for r in range(self.rows):
-                for c in range(self.columns):
-                    memristor = self.get_memristor(r, c, layer=layer)
-                    if layer % 2 == 0:
-                        if boolean_expression_representation:
-                            graph.add_edge("L{}_{}".format(layer, r), "L{}_{}".format(layer + 1, c),
-                                           boolean_expression=memristor.literal)
-                        else:
-                            graph.add_edge("L{}_{}".format(layer, r), "L{}_{}".format(layer + 1, c),
-                                           atom=memristor.literal.atom,
-                                           positive=memristor.literal.positive)
-                    else:
-                        if boolean_expression_representation:
-                            graph.add_edge("L{}_{}".format(layer, c), "L{}_{}".format(layer + 1, r),
-                                           boolean_expression=memristor.literal)
-                        else:
-                            graph.add_edge("L{}_{}".format(layer, c), "L{}_{}".format(layer + 1, r),
-                                           atom=memristor.literal.atom,
-                                           positive=memristor.literal.positive)
+            lower_names = names[layer]
+            upper_names = names[layer + 1]
+            literal_matrix = self.literal_matrix[layer].tolist()
+            if layer % 2 == 0:
+                graph.add_edges_from((lower_names[r], upper_names[c], edge_attributes[i])
+                                     for r, row in enumerate(literal_matrix) for c, i in enumerate(row))
+            else:
+                graph.add_edges_from((lower_names[c], upper_names[r], edge_attributes[i])
+                                     for r, row in enumerate(literal_matrix) for c, i in enumerate(row))
 
+        # The functions are grouped by nanowire first, such that the name of each nanowire is looked up once.
         attributes = dict()
-        for input_function, (layer, index) in self.get_input_nanowires().items():
-            if "L{}_{}".format(layer, index) not in attributes:
-                attributes["L{}_{}".format(layer, index)] = dict()
-            attributes["L{}_{}".format(layer, index)]["input_function"] = input_function
-        for output_function, (layer, index) in self.get_output_nanowires().items():
-            if "L{}_{}".format(layer, index) not in attributes:
-                attributes["L{}_{}".format(layer, index)] = dict()
-            if "output_functions" not in attributes["L{}_{}".format(layer, index)]:
-                attributes["L{}_{}".format(layer, index)]["output_functions"] = set()
-            attributes["L{}_{}".format(layer, index)]["output_functions"].add(output_function)
-
-        set_node_attributes(graph, attributes)
+        for input_function, nanowire in self.get_input_nanowires().items():
+            attributes.setdefault(nanowire, dict())["input_function"] = input_function
+        for output_function, nanowire in self.get_output_nanowires().items():
+            attributes.setdefault(nanowire, dict()).setdefault("output_functions", set()).add(output_function)
 
+        set_node_attributes(graph, {self._get_nanowire_name(layer, index): node_attributes
+                                    for (layer, index), node_attributes in attributes.items()})
+
+        self._graphs[boolean_expression_representation] = graph
         return graph
 
     def find(self, literal: LITERAL) -> Set[Tuple[int, int, int]]:
@@ -161,13 +717,13 @@ class Crossbar(Component, ABC):
         :param literal: The given literal to find in this crossbar.
         :return: A list of positions (tuples) at which the literal occurs.
         """
-        positions = set()
-        for l in range(self.layers):
-            for r in range(self.rows):
-                for c in range(self.columns):
-                    if self.get_memristor(r, c, layer=l).literal == literal:
-                        positions.add((l, r, c))
-        return positions
+        # The literals of the table that are equal to the given literal are marked once. A memristor is then marked by
+        # looking up the mark of its literal.
+        is_equal = np.fromiter((table_literal == literal for table_literal in self.literal_table), dtype=bool,
+                               count=len(self.literal_table))
+        if not is_equal.any():
+            return set()
+        return set(map(tuple, np.argwhere(is_equal[self.literal_matrix]).tolist()))
 
     def get_rows(self) -> int:
         """
@@ -227,7 +783,20 @@ class Crossbar(Component, ABC):
         :param layer: The given layer in this crossbar.
         :return: The memristor at the given row and column.
         """
-        return self.matrix[layer][row][column]
+        return Memristor(row, column, self.literal_table[self.literal_matrix[layer, row, column]], layer)
+
+    def get_assigned_memristors(self) -> List[Tuple[int, int, int, LITERAL]]:
+        """
+        Returns the memristors of this crossbar of which the literal is not FALSE, in the order of their layer, row
+        and column. The memristors are selected from the literal matrix at once, instead of per row and column.
+        :return: A list of tuples of the layer, the row, the column and the literal of each memristor.
+        """
+        assigned = np.fromiter((literal != FALSE_LITERAL for literal in self.literal_table), dtype=bool,
+                               count=len(self.literal_table))
+        coordinates = np.argwhere(assigned[self.literal_matrix])
+        literal_indices = self.literal_matrix[tuple(coordinates.T)].tolist()
+        return [(layer, row, column, self.literal_table[i])
+                for ((layer, row, column), i) in zip(coordinates.tolist(), literal_indices)]
 
     def set_memristor(self, row: int, column: int, literal: LITERAL, layer: int = 0, stuck_at_fault: bool = False):
         """
@@ -239,40 +808,64 @@ class Crossbar(Component, ABC):
         :param stuck_at_fault:
         :return:
         """
-        memristor = Memristor(row, column, literal, layer)
-        self.matrix[layer][row][column] = memristor
+        self.literal_matrix[layer, row, column] = self._get_literal_index(literal)
+        self._invalidate_caches()
 
-    def flip_horizontal(self, layer: int = 0):
+    def set_memristors(self, rows: Sequence[int], columns: Sequence[int], literals: Sequence[LITERAL],
+                       layer: Union[int, Sequence[int]] = 0):
+        """
+        Assigns the given literals to the memristors at the given rows and columns, e.g. after a synthesis method has
+        gathered all of its assignments. The matrix is assigned at once, and the caches are discarded only once.
+        As with repeated calls to set_memristor, the last literal is assigned to a memristor that occurs more than once.
+        :param rows: The given rows in this crossbar.
+        :param columns: The given columns in this crossbar, one per row.
+        :param literals: The given literals to be assigned, one per row.
+        :param layer: The given layer in this crossbar, or the given layers, one per row.
+        """
+        get_literal_index = self._get_literal_index
+        indices = np.fromiter((get_literal_index(literal) for literal in literals), dtype=self.literal_matrix.dtype,
+                              count=len(literals))
+        layers = np.broadcast_to(np.asarray(layer, dtype=np.intp), indices.shape)
+        positions = np.ravel_multi_index((layers, np.asarray(rows, dtype=np.intp), np.asarray(columns, dtype=np.intp)),
+                                         self.literal_matrix.shape)
+        # The first occurrence of each memristor in the reversed positions is its last assignment.
+        _, last = np.unique(positions[::-1], return_index=True)
+        last = len(positions) - 1 - last
+        self.literal_matrix.flat[positions[last]] = indices[last]
+        self._invalidate_caches()
+
+    def flip_horizontal(self):
         """
         Flips the nanowire over its axis parallel to the nanowires in its layer (i.e. mirrors).
+        The rows of all layers are reversed at once, such that the nanowires in the even layers are mirrored.
         :return:
         """
-        self.matrix.reverse()
-
-        for r in range(self.rows):
-            for c in range(self.columns):
-                memristor = self.get_memristor(r, c, layer=layer)
-                self.set_memristor(r, c, memristor.literal, layer)
-
-        outputs = dict()
-        for (output_variable, (layer, row)) in self.get_output_nanowires().items():
-            outputs[output_variable] = self.rows - 1 - row
-        self.output_nanowires = outputs
+        self.literal_matrix = np.ascontiguousarray(self.literal_matrix[:, ::-1, :])
+        self._mirror_nanowires(0, self.rows)
 
     def flip_vertical(self):
         """
         Flips the nanowire of its axis parallel to the nanowires in its layer (i.e. mirrors).
+        The columns of all layers are reversed at once, such that the nanowires in the odd layers are mirrored.
         :param layer:
         :return:
         """
-        for layer in range(self.layers):
-            for r in range(self.rows):
-                old_row = self.matrix[layer][r]
-                new_row = old_row[::-1]
-                for c in range(self.columns):
-                    literal = new_row[c].literal
-                    new_row[c] = Memristor(r, c, literal, layer)
-                self.matrix[layer][r] = new_row
+        self.literal_matrix = np.ascontiguousarray(self.literal_matrix[:, :, ::-1])
+        self._mirror_nanowires(1, self.columns)
+
+    def _mirror_nanowires(self, parity: int, size: int):
+        """
+        Mirrors the input and output nanowires in the layers of the given parity, after a flip of this crossbar.
+        :param parity: The parity of the layers of nanowires that are mirrored, i.e. 0 for rows and 1 for columns.
+        :param size: The number of nanowires in each of these layers.
+        """
+        def mirror(nanowires: Dict[str, Tuple[int, int]]) -> Dict[str, Tuple[int, int]]:
+            return {function: (layer, size - 1 - nanowire if layer % 2 == parity else nanowire)
+                    for function, (layer, nanowire) in nanowires.items()}
+
+        self.input_nanowires = mirror(self.input_nanowires)
+        self.output_nanowires = mirror(self.output_nanowires)
+        self._invalidate_caches()
 
 
 class MemristorCrossbar(Crossbar):
@@ -295,15 +888,11 @@ class MemristorCrossbar(Crossbar):
         super(MemristorCrossbar, self).__init__(rows, columns, layers, name)
 
     def get_input_variables(self) -> Set[str]:
-        input_variables = set()
-        for l in range(self.layers):
-            for r in range(self.rows):
-                for c in range(self.columns):
-                    memristor = self.get_memristor(r, c, l)
-                    literal = memristor.literal
-                    if literal != TRUE() and literal != FALSE():
-                        input_variables.add(literal.atom)
-        return input_variables
+        # The input variables are gathered from the literals that are assigned, and kept until a modification.
+        if self._input_variables is None:
+            self._input_variables = frozenset(self.literal_table[i].atom for i in self._get_assigned_literal_indices()
+                                              if self.literal_table[i] != _TRUE and self.literal_table[i] != _FALSE)
+        return set(self._input_variables)
 
     def get_output_variables(self) -> Set[str]:
         return set(self.output_nanowires.keys())
@@ -312,7 +901,17 @@ class MemristorCrossbar(Crossbar):
         return set()
 
     def get_log(self) -> Dict[str, Any]:
-        graph = self.graph()
+        # The statistics of the graph are counted from the literal matrix in a single pass, instead of building the
+        # graph and filtering its edges per statistic. Every nanowire is a node, and every memristor is an edge.
+        counts = np.bincount(self.literal_matrix.ravel(), minlength=len(self.literal_table)).tolist()
+        literals = on = off = 0
+        for literal, count in zip(self.literal_table, counts):
+            if literal.atom != "False" and literal.atom != "True":
+                literals += count
+            elif literal.atom == "True" and literal.positive:
+                on += count
+            elif literal.atom == "False" and not literal.positive:
+                off += count
         return {
             "type": self.__class__.__name__,
             "rows": self.rows,
@@ -322,117 +921,35 @@ class MemristorCrossbar(Crossbar):
             "output_nanowires": len(self.output_nanowires.items()),
             "bipartite_graph":
                 {
-                    "nodes": len(list(graph.nodes)),
-                    "edges": len(list(graph.edges)),
-                    "literals": len(list(filter(lambda e: graph.get_edge_data(e[0], e[1]).get("atom") != "False" and graph.get_edge_data(e[0], e[1]).get("atom") != "True", graph.edges))),
-                    "on": len(list(filter(lambda e: graph.get_edge_data(e[0], e[1]).get("atom") == "True" and graph.get_edge_data(e[0], e[1]).get("positive") == True, graph.edges))),
-                    "off": len(list(filter(lambda e: graph.get_edge_data(e[0], e[1]).get("atom") == "False" and graph.get_edge_data(e[0], e[1]).get("positive") == False, graph.edges))),
+                    "nodes": len(_get_nanowires(self.layers, self.rows, self.columns)),
+                    "edges": self.literal_matrix.size,
+                    "literals": literals,
+                    "on": on,
+                    "off": off,
                 }
         }
 
     @staticmethod
     def from_string(content: str) -> BooleanFunction:
-        rows = 0
-        columns = 0
-        input_variables = None
-        input_nanowires = dict()
-        output_nanowires = dict()
-
-        lines = content.splitlines(keepends=True)
-
-        for line in lines:
-
-            if line.startswith(".rows "):
-                (_, raw_value) = line.split()
-                rows = int(raw_value)
-
-            elif line.startswith(".columns "):
-                (_, raw_value) = line.split()
-                columns = int(raw_value)
-
-            elif line.startswith(".inputs "):
-                raw_values = line.split()
-                input_variables = set(raw_values[1:])
-
-            elif line.startswith(".i "):
-                raw_values = line.split()
-                if len(raw_values) == 3:
-                    input_nanowires[raw_values[1]] = (0, int(raw_values[2]))
-                elif len(raw_values) == 4:
-                    input_nanowires[raw_values[1]] = (int(raw_values[2]), int(raw_values[3]))
-                else:
-                    raise Exception("Length incorrect.")
-
-            elif line.startswith(".o "):
-                raw_values = line.split()
-                if len(raw_values) == 3:
-                    output_nanowires[raw_values[1]] = (0, int(raw_values[2]))
-                elif len(raw_values) == 4:
-                    output_nanowires[raw_values[1]] = (int(raw_values[2]), int(raw_values[3]))
-                else:
-                    raise Exception("Length incorrect.")
-
-        crossbar = MemristorCrossbar(rows, columns)
-        crossbar.input_variables = input_variables
-        crossbar.input_nanowires = input_nanowires
-        crossbar.output_nanowires = output_nanowires
-
-        r = 0
-        c = 0
-        read = False
-        for line in lines:
-
-            if line.startswith(".end"):
-                read = False
-
-            if read:
-                for element in line.split("\t"):
-                    raw_literal = re.findall(r'(-|0|1|[\[\]a-z0-9]+|~[\[\]a-z0-9]+)', element)[0]
-                    if raw_literal == '0':
-                        crossbar.set_memristor(r, c, LITERAL('False', False))
-                    elif raw_literal == '1':
-                        crossbar.set_memristor(r, c, LITERAL('True', True))
-                    elif raw_literal[0] == '~':
-                        crossbar.set_memristor(r, c, LITERAL(raw_literal[1:], False))
-                    else:
-                        crossbar.set_memristor(r, c, LITERAL(raw_literal, True))
-                    c += 1
-                c = 0
-                r += 1
-
-            if line.startswith(".xbar"):
-                read = True
+        header_lines, row_lines = _split_content(content.splitlines())
+        header = _read_header(header_lines)
 
+        crossbar = MemristorCrossbar(_read_size(header, ".rows"), _read_size(header, ".columns"))
+        crossbar._read_interface(header)
+        crossbar._read_literal_matrix(row_lines)
         return crossbar
 
-    def to_string(self) -> str:
-        content = ""
-        content += ".model {}\n".format(self.get_name())
-        content += ".type memristor\n"
-        content += ".inputs {}\n".format(' '.join(self.get_input_variables()))
-        content += ".outputs {}\n".format(' '.join(self.get_output_variables()))
-        content += ".rows {}\n".format(self.rows)
-        content += ".columns {}\n".format(self.columns)
-        for (input_variable, (layer, nanowire)) in self.get_input_nanowires().items():
-            if layer == 0:
-                content += ".i {} {}\n".format(input_variable, nanowire)
-            else:
-                content += ".i {} {} {}\n".format(input_variable, layer, nanowire)
-        for (output_variable, (layer, nanowire)) in self.get_output_nanowires().items():
-            if layer == 0:
-                content += ".o {} {}\n".format(output_variable, nanowire)
-            else:
-                content += ".o {} {} {}\n".format(output_variable, layer, nanowire)
-        content += ".xbar\n"
-        for r in range(self.rows):
-            for c in range(self.columns):
-                literal = self._literal_representation(self.get_memristor(r, c).literal)
-                if c < self.columns - 1:
-                    content += "{}\t".format(literal)
-                else:
-                    content += "{}\r\n".format(literal)
-        content += ".end\n"
-        return content
+    def _iter_string(self) -> Iterator[str]:
+        yield ".model {}\n".format(self.get_name())
+        yield ".type memristor\n"
+        yield ".inputs {}\n".format(' '.join(self.get_input_variables()))
+        yield ".outputs {}\n".format(' '.join(self.get_output_variables()))
+        yield ".rows {}\n".format(self.rows)
+        yield ".columns {}\n".format(self.columns)
+        yield from self._iter_nanowires()
+        yield ".xbar\n"
+        yield from self._iter_matrix()
+        yield ".end\n"
 
     def to_dot(self) -> str:
 
@@ -443,121 +960,67 @@ class MemristorCrossbar(Crossbar):
 
         # Grid after https://graphviz.org/Gallery/undirected/grid.html
         # Node distance after https://newbedev.com/how-to-manage-distance-between-nodes-in-graphviz
-        content = ''
-        content += 'graph {} {{\n'.format(self.name)
-        content += '\tgraph [nodesep="0.2", ranksep="0.2"];\n'
-        content += '\tcharset="UTF-8";\n'
-        content += '\tratio=fill;\n'
-        content += '\tsplines=polyline;\n'
-        content += '\toverlap=scale;\n'
-        content += '\tnode [shape=circle, fixedsize=true, width=0.4, fontsize=8];\n'
-        content += '\n'
-
-        content += '\n\t// Memristors\n'
-        for c in range(self.columns):
-            for r in range(self.rows):
-                if self.get_memristor(r, c, layer).literal.atom == 'False':
-                    v = '0'
-                    style = 'color="#000000", fillcolor="#eeeeee", style="filled,solid"'
-                elif self.get_memristor(r, c, layer).literal.atom == 'True':
-                    v = '1'
-                    style = 'color="#000000", fillcolor="#cadfb8", style="filled,solid"'
-                else:
-                    if not self.get_memristor(r, c, layer).literal.positive:
-                        v = '¬' + self.get_memristor(r, c, layer).literal.atom
-                    else:
-                        v = self.get_memristor(r, c, layer).literal.atom
-                    style = 'color="#000000", fillcolor="#b4c7e7", style="filled,solid"'
-                content += '\tm{}_{} [label="{}" {}]\n'.format(r + 1, c + 1, v, style)
-
-        content += '\n\t// Functions (left y-axis)\n'
+        parts = self._get_dot_header(self.name)
+        parts.extend(self._get_dot_memristors(layer))
+
+        parts.append('\n\t// Functions (left y-axis)\n')
         # Functions
+        input_labels = self._get_dot_input_labels()
         for r in range(self.rows):
-            input_rows = list(map(lambda i: i[1], self.get_input_nanowires().values()))
-            style = 'color="#ffffff", fillcolor="#ffffff", style="filled,solid"'
-            if r not in input_rows:
+            if r not in input_labels:
                 v = ''  # '{}'.format(self.wordlines[r][0])
-                content += '\tm{}_{} [label="{}" {}]\n'.format(r + 1, 0, v, style)
-            else:
-                v = ''
-                for (input_function, (layer, row)) in self.get_input_nanowires().items():
-                    if r == row:
-                        v = 'Vin<SUB>{}</SUB>'.format(input_function)
-                content += '\tm{}_{} [label=<{}> {}]\n'.format(r + 1, 0, v, style)
-
-        content += '\n\t// Outputs (right y-axis)\n'
-        # Outputs
-        output_variables = dict()
-        for (o, (l, r)) in self.output_nanowires.items():
-            if (l, r) in output_variables:
-                output_variables[(l, r)].append(o)
+                parts.append(f'\tm{r + 1}_0 [label="{v}" {_DOT_LABEL_STYLE}]\n')
             else:
-                output_variables[(l, r)] = [o]
-        for ((l, r), os) in output_variables.items():
-            if layer == l:
-                for i in range(len(os)):
-                    v = os[i]
-                    style = 'color="#ffffff", fillcolor="#ffffff", style="filled,solid"'
-                    content += '\tm{}_{} [label="{}" {}];\n'.format(r + 1, self.columns + 1, v, style)
+                parts.append(f'\tm{r + 1}_0 [label=<{input_labels[r]}> {_DOT_LABEL_STYLE}]\n')
 
-        content += '\n\t// Crossbar\n'
-        # Important: The description of the grid is transposed when being rendered -> rows and columns are switched
-        for r in range(self.rows):
-            input_rows = list(map(lambda i: i[1], self.get_input_nanowires().values()))
-            content += '\trank=same {\n'
-            for c in range(self.columns):
-                if r not in input_rows and c == 0:
-                    content += '\t\tm{}_{} -- m{}_{} [style=invis];\n'.format(r + 1, c, r + 1, c + 1)
-                else:
-                    content += '\t\tm{}_{} -- m{}_{};\n'.format(r + 1, c, r + 1, c + 1)
+        parts.extend(self._get_dot_outputs_and_grid(layer))
 
-            # TODO: Change layer
-            if (0, r) in output_variables:
-                content += '\t\tm{}_{} -- m{}_{};\n'.format(r + 1, self.columns, r + 1, self.columns + 1)
-            content += '\t}\n'
-
-        for c in range(self.columns):
-            content += '\t' + ' -- '.join(["m{}_{}".format(r + 1, c + 1) for r in range(self.rows)]) + '\n'
-
-        content += '}'
-        return content
+        parts.append('}')
+        return ''.join(parts)
 
     def __copy__(self):
         crossbar = MemristorCrossbar(self.rows, self.columns, self.layers)
-        crossbar.matrix = copy.deepcopy(self.matrix)
-        crossbar.input_nanowires = self.input_nanowires
+        crossbar._copy_literal_table(self)
+        crossbar.literal_matrix = self.literal_matrix.copy()
+        crossbar.input_nanowires = self.input_nanowires.copy()
         crossbar.output_nanowires = self.output_nanowires.copy()
         return crossbar
 
     def fix(self, atom: str, positive: bool) -> MemristorCrossbar:
-        crossbar = copy.deepcopy(self)
-        for l in range(self.layers):
-            for r in range(self.rows):
-                for c in range(self.columns):
-                    memristor = self.get_memristor(r, c, l)
-                    literal = memristor.literal
-                    crossbar.set_memristor(r, c, literal.fix(atom, positive), l)
+        crossbar = self._copy_literals()
+        # Each literal of the table is fixed once, and the memristors are assigned the fixed literals at once. If no
+        # literal of the table is over the given atom, the copy is returned as is.
+        fixed_indices = np.arange(len(self.literal_table), dtype=np.int32)
+        fixed = False
+        for i, literal in enumerate(self.literal_table):
+            fixed_literal = literal.fix(atom, positive)
+            if fixed_literal is not literal:
+                fixed_indices[i] = crossbar._get_literal_index(fixed_literal)
+                fixed = True
+        if fixed:
+            crossbar.literal_matrix = fixed_indices[self.literal_matrix]
         return crossbar
 
-    def find_equivalent_components(self) -> List:
-        graph = self.graph()
-        o_non_one_edges = [(u, v) for u, v, d in graph.edges(data=True) if
-                           not (d['atom'] == 'True' and d['positive'])]
-        graph.remove_edges_from(o_non_one_edges)
-
+    def find_equivalent_components(self) -> List[List[Tuple[int, int]]]:
+        """
+        Returns the sets of nanowires that are connected by memristors assigned TRUE.
+        A nanowire is denoted by a tuple of its layer and its index, such that no names are formatted or parsed.
+        :return: A list of connected components, each a list of nanowires.
+        """
+        graph = self._get_true_graph(self._get_true_literals())
         equivalent = [list(f) for f in connected_components(graph)]
         return equivalent
 
     @staticmethod
-    def _find_equivalent_row_or_column(equivalent: List, layer: int) -> List[List[int]]:
+    def _find_equivalent_row_or_column(equivalent: List[List[Tuple[int, int]]], layer: int) -> List[List[int]]:
         """
-        The axis 0 denotes one axis, and the axis 1 denotes the perpendicular axis of nanowires.
-        :param equivalent:
-        :param axis:
-        :return:
+        Returns the indices of the nanowires in the given layer of each of the given connected components.
+        :param equivalent: The connected components of nanowires.
+        :param layer: The given layer of nanowires, i.e. 0 for the rows and 1 for the columns.
+        :return: A list with a list of indices per connected component.
         """
-        f = [list(map(lambda w: int(w[3:]), filter(lambda x: x[1] == str(layer), equivalent_subset))) for equivalent_subset in equivalent]
-        return f
+        return [[index for (nanowire_layer, index) in equivalent_subset if nanowire_layer == layer]
+                for equivalent_subset in equivalent]
 
     def get_equivalent_rows(self) -> List[List[int]]:
         equivalent = self.find_equivalent_components()
@@ -569,20 +1032,18 @@ class MemristorCrossbar(Crossbar):
 
     def get_ternary_matrix(self, layer: int = 0) -> np.ndarray:
         """
-        TODO: Adapt to handle all layers, currently only handles one layer (layer 0)
-        :param layer:
-        :return:
+        Returns the ternary matrix of the given layer of this crossbar. An entry is 1 if the memristor is assigned
+        TRUE, -1 if it is assigned FALSE, and 0 otherwise.
+        Each literal of the table of literals is compared once, after which the matrix is looked up at once.
+        :param layer: The given layer of memristors. By default, the first layer.
+        :return: A two-dimensional array with the ternary value of each memristor of the layer.
         """
-        ternary_matrix = np.empty((self.rows, self.columns))
-        for r in range(self.rows):
-            for c in range(self.columns):
-                if self.get_memristor(r, c).literal == TRUE():
-                    ternary_matrix[r, c] = 1
-                elif self.get_memristor(r, c).literal == FALSE():
-                    ternary_matrix[r, c] = -1
-                else:
-                    ternary_matrix[r, c] = 0
-        return ternary_matrix
+        is_true = np.fromiter((literal == _TRUE for literal in self.literal_table), dtype=bool,
+                              count=len(self.literal_table))
+        is_false = np.fromiter((literal == _FALSE for literal in self.literal_table), dtype=bool,
+                               count=len(self.literal_table))
+        ternary_values = np.select([is_true, is_false], [1.0, -1.0], 0.0)
+        return ternary_values[self.literal_matrix[layer]]
 
     def compress(self) -> MemristorCrossbar:
         ternary_matrix = self.get_ternary_matrix()
@@ -597,99 +1058,94 @@ class MemristorCrossbar(Crossbar):
     @staticmethod
     def nd_array_to_crossbar(nd_array: np.ndarray, equivalent_dimension: List[List[int]]) -> MemristorCrossbar:
         crossbar = MemristorCrossbar(nd_array.shape[0], nd_array.shape[1])
-        for r in range(nd_array.shape[0]):
-            for c in range(nd_array.shape[1]):
-                if nd_array[r, c] == 1:
-                    crossbar.set_memristor(r, c, TRUE())
-                elif nd_array[r, c] == -1:
-                    crossbar.set_memristor(r, c, FALSE())
-                else:
-                    # TODO: Fix
-                    crossbar.set_memristor(r, c, LITERAL("x", True))
+        true_index = crossbar._get_literal_index(_TRUE)
+        false_index = crossbar._get_literal_index(_FALSE)
+        # TODO: Fix
+        other_index = crossbar._get_literal_index(LITERAL("x", True))
+        crossbar.literal_matrix[0] = np.where(nd_array == 1, true_index, np.where(nd_array == -1, false_index,
+                                                                                   other_index))
         return crossbar
 
+    @staticmethod
+    def _compress_equivalent(ternary_matrix: np.ndarray, equivalent: List[List[int]], axis: int) -> np.ndarray:
+        """
+        Compresses each nonempty group of equivalent nanowires along the given axis of the ternary matrix into one
+        nanowire, i.e. the maximum of the group. The groups are gathered at once, and reduced in a single pass.
+        :param ternary_matrix: The given ternary matrix.
+        :param equivalent: The groups of equivalent rows or columns.
+        :param axis: The axis 0 for the rows, and the axis 1 for the columns.
+        :return: The compressed ternary matrix, or the given ternary matrix if there are no nonempty groups.
+        """
+        groups = [group for group in equivalent if len(group) > 0]
+        if not groups:
+            return ternary_matrix
+        indices = np.concatenate(groups)
+        bounds = np.cumsum([0] + [len(group) for group in groups[:-1]])
+        return np.maximum.reduceat(np.take(ternary_matrix, indices, axis=axis), bounds, axis=axis)
+
     @staticmethod
     def _compress_equivalent_rows(ternary_matrix: np.ndarray, equivalent_rows: List) -> np.ndarray:
-        rows = []
-        for group in equivalent_rows:
-            if len(group) > 0:
-                a = np.amax(np.array(list(map(lambda x: ternary_matrix[x, :], group))), axis=0)
-                rows.append([a])
-        if rows:
-            n = np.concatenate(rows)
-        else:
-            n = ternary_matrix
-        return n
+        return MemristorCrossbar._compress_equivalent(ternary_matrix, equivalent_rows, 0)
 
     @staticmethod
     def _compress_equivalent_columns(ternary_matrix, equivalent_columns: List) -> np.ndarray:
-        cols = []
-        for group in equivalent_columns:
-            if len(group) > 0:
-                a = np.amax(np.array(list(map(lambda x: ternary_matrix[:, x], group))), axis=0)
-                cols.append([a])
-        if cols:
-            n = np.concatenate(cols).transpose()
-        else:
-            n = ternary_matrix
-        return n
+        return MemristorCrossbar._compress_equivalent(ternary_matrix, equivalent_columns, 1)
 
     def transpose(self) -> MemristorCrossbar:
         crossbar = MemristorCrossbar(self.columns, self.rows)
-        for r in range(self.rows):
-            for c in range(self.columns):
-                crossbar.set_memristor(c, r, self.get_memristor(r, c).literal)
+        crossbar._copy_literal_table(self)
+        crossbar.literal_matrix[0] = self.literal_matrix[0].T
 
-        crossbar.input_nanowires = self.get_input_nanowires()
-        crossbar.output_nanowires = self.get_output_nanowires()
+        crossbar.input_nanowires = self.get_input_nanowires().copy()
+        crossbar.output_nanowires = self.get_output_nanowires().copy()
         return crossbar
 
     def instantiate(self, instance: dict) -> MemristorCrossbar:
-        for layer in range(self.layers):
-            for r in range(self.rows):
-                for c in range(self.columns):
-                    memristor = self.get_memristor(r, c, layer)
-                    literal = memristor.literal
-                    variable_name = literal.atom
-                    positive = literal.positive
-                    if variable_name != "True" and variable_name != "False":
-                        if not memristor.stuck_at_fault:
-                            if positive:
-                                if instance[variable_name]:
-                                    literal = LITERAL('True', True)
-                                else:
-                                    literal = LITERAL('False', False)
-                            else:
-                                if instance[variable_name]:
-                                    literal = LITERAL('False', False)
-                                else:
-                                    literal = LITERAL('True', True)
-                            self.set_memristor(r, c, literal, layer=layer)
+        # Each literal that is assigned to a memristor is instantiated once, and the memristors are assigned the
+        # instantiated literals at once.
+        true_index = self._get_literal_index(TRUE_LITERAL)
+        false_index = self._get_literal_index(FALSE_LITERAL)
+        instantiated_indices = np.arange(len(self.literal_table), dtype=np.int32)
+        for i in self._get_assigned_literal_indices():
+            literal = self.literal_table[i]
+            variable_name = literal.atom
+            if variable_name != "True" and variable_name != "False":
+                # A positive literal is true if its variable is true, and a negative literal if its variable is false.
+                if bool(instance[variable_name]) == literal.positive:
+                    instantiated_indices[i] = true_index
+                else:
+                    instantiated_indices[i] = false_index
+        self.literal_matrix = instantiated_indices[self.literal_matrix]
+        self._invalidate_caches()
         return self
 
     def eval(self, instance: Dict[str, bool], input_function: str = "1") -> Dict[str, bool]:
         # For all input nanowires different from a different input function than the given input function,
         # we set the selectorlines False to avoid any loops through these nanowires.
+        false_index = self._get_literal_index(_FALSE)
         for (other_input_function, (layer, input_nanowire)) in self.get_input_nanowires().items():
-            if input_function != other_input_function:
-                for c in range(self.columns):
-                    self.set_memristor(input_nanowire, c, FALSE(), layer=layer)
-
-        crossbar_copy = self.__copy__()
-        crossbar_instance = crossbar_copy.instantiate(instance)
-        graph = crossbar_instance.graph()
-        true_edges = [(u, v) for u, v, d in graph.edges(data=True) if
-                              not (d['atom'] == 'True' and d['positive'])]
-        graph.remove_edges_from(true_edges)
+            if input_function != other_input_function and np.any(self.literal_matrix[layer, input_nanowire, :]
+                                                                 != false_index):
+                self.literal_matrix[layer, input_nanowire, :] = false_index
+                self._invalidate_caches()
 
-        evaluation = dict()
-        for (output_variable, (output_layer, output_nanowire)) in crossbar_instance.get_output_nanowires().items():
-            source = "L{}_{}".format(output_layer, output_nanowire)
-            input_layer, input_nanowire = crossbar_instance.get_input_nanowire(input_function)
-            sink = "L{}_{}".format(input_layer, input_nanowire)
-            evaluation[output_variable] = has_path(graph, source, sink)
+        # Instead of instantiating a copy of this crossbar and building its full graph, the literals of the table are
+        # instantiated once, and only the memristors of which the literal is true are traversed.
+        return self._get_reachable_outputs(self._get_instantiated_literals(instance), input_function)
 
-        return evaluation
+    def _get_instantiated_literals(self, instance: Dict[str, bool]) -> np.ndarray:
+        """
+        Returns for each literal of the table of literals of this crossbar whether it is true in the given instance,
+        i.e. the literals that would be TRUE after instantiate().
+        :param instance: The given instance, mapping each input variable to a truth value.
+        :return: A one-dimensional Boolean array with an entry per literal of the table.
+        """
+        is_true = self._get_true_literals()
+        for i in self._get_assigned_literal_indices():
+            literal = self.literal_table[i]
+            if literal.atom != "True" and literal.atom != "False":
+                is_true[i] = bool(instance[literal.atom]) == literal.positive
+        return is_true
 
 
 class SelectorCrossbar(Crossbar):
@@ -702,18 +1158,25 @@ class SelectorCrossbar(Crossbar):
         self.wordlines = []  # Nodes in BDD
         self.selectorlines = []  # Edges in BDD
 
+    @property
+    def selectorlines(self) -> List:
+        return self._selectorlines
+
+    @selectorlines.setter
+    def selectorlines(self, selectorlines: List):
+        # The input variables depend on the selectorlines. Hence, they are gathered again when the selectorlines are
+        # assigned. Hence, the selectorlines are assigned as a whole rather than changed in place.
+        self._selectorlines = selectorlines
+        self._selector_input_variables = None
+
     def get_input_variables(self) -> Set[str]:
-        input_variables = set()
-        for selectorline in self.selectorlines:
-            if isinstance(selectorline, LITERAL):
-                input_variables.add(selectorline.atom)
-        return input_variables
+        if self._selector_input_variables is None:
+            self._selector_input_variables = frozenset(selectorline.atom for selectorline in self.selectorlines
+                                                       if isinstance(selectorline, LITERAL))
+        return set(self._selector_input_variables)
 
     def get_output_variables(self) -> Set[str]:
-        output_variables = set()
-        for output_variable in self.get_output_nanowires().keys():
-            output_variables.add(output_variable)
-        return output_variables
+        return set(self.get_output_nanowires().keys())
 
     def get_auxiliary_variables(self) -> Set[str]:
         return set()
@@ -738,124 +1201,41 @@ class SelectorCrossbar(Crossbar):
 
     @staticmethod
     def from_string(content: str) -> BooleanFunction:
-        rows = 0
-        columns = 0
-        input_variables = None
-        input_nanowires = dict()
-        output_nanowires = dict()
-        selectorlines = []
-
-        lines = content.splitlines(keepends=True)
-
-        for line in lines:
-
-            if line.startswith(".rows "):
-                (_, raw_value) = line.split()
-                rows = int(raw_value)
+        header_lines, row_lines = _split_content(content.splitlines())
+        header = _read_header(header_lines)
 
-            elif line.startswith(".columns "):
-                (_, raw_value) = line.split()
-                columns = int(raw_value)
-
-            elif line.startswith(".inputs "):
-                raw_values = line.split()
-                input_variables = set(raw_values[1:])
-
-            elif line.startswith(".i "):
-                raw_values = line.split()
-                if len(raw_values) == 3:
-                    input_nanowires[raw_values[1]] = (0, int(raw_values[2]))
-                elif len(raw_values) == 4:
-                    input_nanowires[raw_values[1]] = (int(raw_values[2]), int(raw_values[3]))
-                else:
-                    raise Exception("Length incorrect.")
-
-            elif line.startswith(".o "):
-                raw_values = line.split()
-                if len(raw_values) == 3:
-                    output_nanowires[raw_values[1]] = (0, int(raw_values[2]))
-                elif len(raw_values) == 4:
-                    output_nanowires[raw_values[1]] = (int(raw_values[2]), int(raw_values[3]))
-                else:
-                    raise Exception("Length incorrect.")
-
-            elif line.startswith(".s "):
-                raw_values = line.split()
-                if len(raw_values) == 3:
-                    raw_literal = raw_values[2]
-                    if raw_literal.startswith("~"):
-                        literal = LITERAL(raw_literal[1:], False)
-                    else:
-                        literal = LITERAL(raw_literal, True)
-                    selectorlines.append(literal)
+        selectorlines = []
+        for raw_values in header.get(".s", []):
+            if len(raw_values) == 3:
+                raw_literal = raw_values[2]
+                if raw_literal.startswith("~"):
+                    literal = LITERAL(raw_literal[1:], False)
                 else:
-                    raise Exception("Length incorrect.")
+                    literal = LITERAL(raw_literal, True)
+                selectorlines.append(literal)
+            else:
+                raise Exception("Length incorrect.")
 
-        crossbar = SelectorCrossbar(rows, columns)
+        crossbar = SelectorCrossbar(_read_size(header, ".rows"), _read_size(header, ".columns"))
         crossbar.selectorlines = selectorlines
-        crossbar.input_variables = input_variables
-        crossbar.input_nanowires = input_nanowires
-        crossbar.output_nanowires = output_nanowires
-
-        r = 0
-        c = 0
-        read = False
-        for line in lines:
-
-            if line.startswith(".end"):
-                read = False
-
-            if read:
-                for element in line.split("\t"):
-                    raw_literal = re.findall(r'(-|0|1|[\[\]a-z0-9]+|~[\[\]a-z0-9]+)', element)[0]
-                    if raw_literal == '0':
-                        crossbar.set_memristor(r, c, LITERAL('False', False))
-                    elif raw_literal == '1':
-                        crossbar.set_memristor(r, c, LITERAL('True', True))
-                    elif raw_literal[0] == '~':
-                        crossbar.set_memristor(r, c, LITERAL(raw_literal[1:], False))
-                    else:
-                        crossbar.set_memristor(r, c, LITERAL(raw_literal, True))
-                    c += 1
-                c = 0
-                r += 1
-
-            if line.startswith(".xbar"):
-                read = True
-
+        crossbar._read_interface(header)
+        crossbar._read_literal_matrix(row_lines)
         return crossbar
 
-    def to_string(self) -> str:
-        content = ""
-        content += ".model {}\n".format(self.get_name())
-        content += ".type selector\n"
-        content += ".inputs {}\n".format(' '.join(self.get_input_variables()))
-        content += ".outputs {}\n".format(' '.join(self.get_output_variables()))
-        content += ".rows {}\n".format(self.rows)
-        content += ".columns {}\n".format(self.columns)
-        for (input_variable, (layer, nanowire)) in self.get_input_nanowires().items():
-            if layer == 0:
-                content += ".i {} {}\n".format(input_variable, nanowire)
-            else:
-                content += ".i {} {} {}\n".format(input_variable, layer, nanowire)
-        for (output_variable, (layer, nanowire)) in self.get_output_nanowires().items():
-            if layer == 0:
-                content += ".o {} {}\n".format(output_variable, nanowire)
-            else:
-                content += ".o {} {} {}\n".format(output_variable, layer, nanowire)
+    def _iter_string(self) -> Iterator[str]:
+        yield ".model {}\n".format(self.get_name())
+        yield ".type selector\n"
+        yield ".inputs {}\n".format(' '.join(self.get_input_variables()))
+        yield ".outputs {}\n".format(' '.join(self.get_output_variables()))
+        yield ".rows {}\n".format(self.rows)
+        yield ".columns {}\n".format(self.columns)
+        yield from self._iter_nanowires()
         for i in range(len(self.selectorlines)):
             literal = self.selectorlines[i]
-            content += ".s {} {}\n".format(i, self._literal_representation(literal))
-        content += ".xbar\n"
-        for r in range(self.rows):
-            for c in range(self.columns):
-                literal = self._literal_representation(self.get_memristor(r, c).literal)
-                if c < self.columns - 1:
-                    content += "{}\t".format(literal)
-                else:
-                    content += "{}\r\n".format(literal)
-        content += ".end\n"
-        return content
+            yield ".s {} {}\n".format(i, self._literal_representation(literal))
+        yield ".xbar\n"
+        yield from self._iter_matrix()
+        yield ".end\n"
 
     def to_dot(self) -> str:
         # Grid after https://graphviz.org/Gallery/undirected/grid.html
@@ -866,102 +1246,34 @@ class SelectorCrossbar(Crossbar):
             raise Exception("Only single memristor layer supported.")
 
         layer = 0
-        content = ''
-        content += 'graph {} {{\n'.format(name)
-        content += '\tgraph [nodesep="0.2", ranksep="0.2"];\n'
-        content += '\tcharset="UTF-8";\n'
-        content += '\tratio=fill;\n'
-        content += '\tsplines=polyline;\n'
-        content += '\toverlap=scale;\n'
-        content += '\tnode [shape=circle, fixedsize=true, width=0.4, fontsize=8];\n'
-        content += '\n'
-
-        content += '\n\t// Memristors\n'
-        for c in range(self.columns):
-            for r in range(self.rows):
-                if self.get_memristor(r, c, layer).literal.atom == 'False':
-                    v = '0'
-                    style = 'color="#000000", fillcolor="#eeeeee", style="filled,solid"'
-                elif self.get_memristor(r, c, layer).literal.atom == 'True':
-                    v = '1'
-                    style = 'color="#000000", fillcolor="#cadfb8", style="filled,solid"'
-                else:
-                    if not self.get_memristor(r, c, layer).literal.positive:
-                        v = '¬' + self.get_memristor(r, c, layer).literal.atom
-                    else:
-                        v = self.get_memristor(r, c, layer).literal.atom
-                    style = 'color="#000000", fillcolor="#b4c7e7", style="filled,solid"'
-                content += '\tm{}_{} [label="{}" {}]\n'.format(r + 1, c + 1, v, style)
-
-        content += '\n\t// Functions (left y-axis)\n'
+        parts = self._get_dot_header(name)
+        parts.extend(self._get_dot_memristors(layer))
+
+        parts.append('\n\t// Functions (left y-axis)\n')
         # Functions
+        input_labels = self._get_dot_input_labels()
         for r in range(len(self.wordlines)):
-            input_rows = list(map(lambda i: i[1], self.get_input_nanowires().values()))
-            style = 'color="#ffffff", fillcolor="#ffffff", style="filled,solid"'
-            if r not in input_rows:
-                v = '{}'.format(self.wordlines[r])
-                content += '\tm{}_{} [label="{}" {}]\n'.format(r + 1, 0, v, style)
+            if r not in input_labels:
+                parts.append(f'\tm{r + 1}_0 [label="{self.wordlines[r]}" {_DOT_LABEL_STYLE}]\n')
             else:
-                v = ''
-                for (input_function, (layer, row)) in self.get_input_nanowires().items():
-                    if r == row:
-                        v = 'Vin<SUB>{}</SUB>'.format(input_function)
-                content += '\tm{}_{} [label=<{}> {}]\n'.format(r + 1, 0, v, style)
+                parts.append(f'\tm{r + 1}_0 [label=<{input_labels[r]}> {_DOT_LABEL_STYLE}]\n')
         for r in range(len(self.wordlines), self.rows):
-            style = 'color="#ffffff", fillcolor="#ffffff", style="filled,solid"'
-            v = ''
-            content += '\tm{}_{} [label="{}" {}]\n'.format(r + 1, 0, v, style)
-
-        content += '\n\t// Outputs (right y-axis)\n'
-        # Outputs
-        output_variables = dict()
-        for (o, (l, r)) in self.output_nanowires.items():
-            if (l, r) in output_variables:
-                output_variables[(l, r)].append(o)
-            else:
-                output_variables[(l, r)] = [o]
-        for ((l, r), os) in output_variables.items():
-            if layer == l:
-                for i in range(len(os)):
-                    v = os[i]
-                    style = 'color="#ffffff", fillcolor="#ffffff", style="filled,solid"'
-                    content += '\tm{}_{} [label="{}" {}];\n'.format(r + 1, self.columns + 1, v, style)
-
-        content += '\n\t// Crossbar\n'
-        # Important: The description of the grid is transposed when being rendered -> rows and columns are switched
-        for r in range(self.rows):
-            input_rows = list(map(lambda i: i[1], self.get_input_nanowires().values()))
-            content += '\trank=same {\n'
-            for c in range(self.columns):
-                if r not in input_rows and c == 0:
-                    content += '\t\tm{}_{} -- m{}_{} [style=invis];\n'.format(r + 1, c, r + 1, c + 1)
-                else:
-                    content += '\t\tm{}_{} -- m{}_{};\n'.format(r + 1, c, r + 1, c + 1)
+            parts.append(f'\tm{r + 1}_0 [label="" {_DOT_LABEL_STYLE}]\n')
 
-            # TODO: Change layer
-            if (0, r) in output_variables:
-                content += '\t\tm{}_{} -- m{}_{};\n'.format(r + 1, self.columns, r + 1, self.columns + 1)
-            content += '\t}\n'
+        parts.extend(self._get_dot_outputs_and_grid(layer))
 
-        for c in range(self.columns):
-            content += '\t' + ' -- '.join(["m{}_{}".format(r + 1, c + 1) for r in range(self.rows)]) + '\n'
-
-        content += '\n\t// Literals (bottom x-axis)\n'
-        # content += '\tedge [style=invis];\n'
+        parts.append('\n\t// Literals (bottom x-axis)\n')
+        # parts.append('\tedge [style=invis];\n')
         # Literals
         for c in range(len(self.selectorlines)):
-            v = '{}'.format(str(self.selectorlines[c]).replace("\\+", "¬"))
-            style = 'color="#ffffff", fillcolor="#ffffff", style="filled,solid"'
-            content += '\tm{}_{} [label="{}" {}];\n'.format(self.rows + 1, c + 1, v, style)
-            content += '\tm{}_{} -- m{}_{};\n'.format(self.rows, c + 1, self.rows + 1, c + 1)
+            v = str(self.selectorlines[c]).replace("\\+", "¬")
+            parts.append(f'\tm{self.rows + 1}_{c + 1} [label="{v}" {_DOT_LABEL_STYLE}];\n')
+            parts.append(f'\tm{self.rows}_{c + 1} -- m{self.rows + 1}_{c + 1};\n')
 
         for c in range(len(self.selectorlines), self.columns):
-            style = 'color="#ffffff", fillcolor="#ffffff", style="filled,solid"'
-            v = '—'
-            content += '\tm{}_{} [label="{}" {}];\n'.format(self.rows + 1, c + 1, v, style)
-            content += '\tm{}_{} -- m{}_{};\n'.format(self.rows, c + 1, self.rows + 1, c + 1)
-        content += '\trank=same {' + ' '.join(
-            ["m{}_{}".format(self.rows + 1, c + 1) for c in range(self.columns)]) + '}\n'
+            parts.append(f'\tm{self.rows + 1}_{c + 1} [label="—" {_DOT_LABEL_STYLE}];\n')
+            parts.append(f'\tm{self.rows}_{c + 1} -- m{self.rows + 1}_{c + 1};\n')
+        parts.append('\trank=same {' + ' '.join([f"m{self.rows + 1}_{c + 1}" for c in range(self.columns)]) + '}\n')
 
         # # Outputs
         # output_variables = dict()
@@ -979,57 +1291,90 @@ class SelectorCrossbar(Crossbar):
         #         content += '\t m{}_{} -- m{}_{};\n'.format(r, self.columns + 1, r, self.columns + 2)
         # content += '\\draw (n%d_%d) -- (n%d_%d);\n' % (self.columns, self.rows - r, self.columns + 1, self.rows - r)
 
-        content += '}'
-        return content
+        parts.append('}')
+        return ''.join(parts)
 
     def get_functions(self):
-        functions = []
-        for (node, _) in self.wordlines:
-            functions.append(node)
-        return functions
+        return [node for (node, _) in self.wordlines]
 
     def __copy__(self):
         crossbar = SelectorCrossbar(self.rows, self.columns)
-        for r in range(self.rows):
-            for c in range(self.columns):
-                crossbar.set_memristor(r, c, self.get_memristor(r, c).literal)
+        crossbar._copy_literal_table(self)
+        crossbar.literal_matrix[0] = self.literal_matrix[0]
         crossbar.input_nanowires = self.input_nanowires.copy()
         crossbar.output_nanowires = self.output_nanowires.copy()
         return crossbar
 
-    def instantiate(self, instance: Dict[str, bool]) -> SelectorCrossbar:
-        crossbar = copy.deepcopy(self)
+    def __deepcopy__(self, memo: Dict[int, Any]) -> SelectorCrossbar:
+        crossbar = super().__deepcopy__(memo)
+        crossbar.wordlines = list(self.wordlines)
+        crossbar.selectorlines = list(self.selectorlines)
+        return crossbar
 
-        for c in range(len(self.selectorlines)):
-            literal = self.selectorlines[c]
-            if literal == LITERAL("False", False):
-                for r in range(crossbar.rows):
-                    crossbar.set_memristor(r, c, LITERAL("False", False))
-            elif literal == LITERAL("True", True):
+    def instantiate(self, instance: Dict[str, bool]) -> SelectorCrossbar:
+        crossbar = self._copy_literals()
+
+        # The columns are grouped by their selectorline first, such that each distinct selectorline is decided once.
+        # The columns of the selectorlines that are false in the given instance are then assigned FALSE at once.
+        selectorline_columns = dict()
+        for c, literal in enumerate(self.selectorlines):
+            selectorline_columns.setdefault((literal.atom, literal.positive), []).append(c)
+        false_columns = []
+        for (atom, positive), columns in selectorline_columns.items():
+            if atom == "False" and not positive:
+                false_columns.extend(columns)
+            elif atom == "True" and positive:
                 continue
-            else:
-                if not instance[literal.atom] and literal.positive:
-                    for r in range(crossbar.rows):
-                        crossbar.set_memristor(r, c, LITERAL("False", False))
-                elif instance[literal.atom] and not literal.positive:
-                    for r in range(crossbar.rows):
-                        crossbar.set_memristor(r, c, LITERAL("False", False))
+            elif bool(instance[atom]) != positive:
+                false_columns.extend(columns)
+        if false_columns:
+            crossbar.literal_matrix[0, :, false_columns] = crossbar._get_literal_index(FALSE_LITERAL)
         return crossbar
 
     def eval(self, instance: Dict[str, bool], input_function: str = "1") -> Dict[str, bool]:
         crossbar_instance = self.instantiate(instance)
-        graph = crossbar_instance.graph().copy()
-        not_stuck_on_edges = [(u, v) for u, v, d in graph.edges(data=True) if
-                              not (d['atom'] == 'True' and d['positive'])]
-        graph.remove_edges_from(not_stuck_on_edges)
+        return crossbar_instance._get_reachable_outputs(crossbar_instance._get_true_literals(), input_function)
 
-        evaluation = dict()
-        for (output_variable, (output_layer, output_nanowire)) in self.output_nanowires.items():
-            source = "L{}_{}".format(output_layer, output_nanowire)
-            input_layer, input_nanowire = crossbar_instance.get_input_nanowire(input_function)
-            sink = "L{}_{}".format(input_layer, input_nanowire)
-
-            is_true = has_path(graph, source, sink)
-            evaluation[output_variable] = is_true
-
-        return evaluation
+    def eval_batch(self, input_variables: List[str], instances: np.ndarray,
+                   input_function: str = "1") -> Dict[str, np.ndarray]:
+        """
+        Evaluates this crossbar for a batch of instances at once, such that eval() is not invoked per instance.
+        The instances are packed into 64-bit words, a bit per instance, and a memristor conducts in an instance if it
+        is TRUE and its selectorline is true in the instance, i.e. as after instantiate().
+        :param input_variables: The input variables, in the order of the columns of the instances.
+        :param instances: A two-dimensional Boolean array with a row per instance.
+        :param input_function: The given input function.
+        :return: A dictionary mapping each output function to a one-dimensional Boolean array with an entry per
+        instance, which is True if the output nanowire is connected to the input nanowire in that instance.
+        """
+        nr_instances = instances.shape[0]
+        packed = TruthTable.pack(np.asarray(instances, dtype=bool).T)
+        variable_words = dict(zip(input_variables, packed))
+        ones = np.full(packed.shape[1], ~np.uint64(0), dtype=np.uint64)
+        zeros = np.zeros(packed.shape[1], dtype=np.uint64)
+
+        conducting = np.where(self._get_true_literals()[self.literal_matrix][..., None], ones, zeros)
+        for c, literal in enumerate(self.selectorlines):
+            if literal.atom == "False" and not literal.positive:
+                conducting[0, :, c] = zeros
+            elif literal.atom == "True" and literal.positive:
+                continue
+            elif literal.positive:
+                conducting[0, :, c] &= variable_words[literal.atom]
+            else:
+                conducting[0, :, c] &= ~variable_words[literal.atom]
+
+        output_nanowires = self.get_output_nanowires()
+        if not output_nanowires:
+            return dict()
+        input_layer, input_nanowire = self.get_input_nanowire(input_function)
+        if not self._is_nanowire(input_layer, input_nanowire):
+            raise Exception("The input nanowire of input function {} is not in the crossbar.".format(input_function))
+        reached = _reach_batch(conducting, input_layer, input_nanowire)
+        evaluations = dict()
+        for (output_variable, (layer, index)) in output_nanowires.items():
+            if self._is_nanowire(layer, index):
+                evaluations[output_variable] = TruthTable.unpack(reached[layer, index], nr_instances)
+            else:
+                evaluations[output_variable] = np.zeros(nr_instances, dtype=bool)
+        return evaluations
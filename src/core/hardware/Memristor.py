@@ -1,4 +1,4 @@
-from typing import Dict, Set
+from typing import Dict, Set, Tuple, Optional
 
 from z3 import Bool
 
@@ -12,6 +12,8 @@ class Memristor(BooleanExpression):
     low resistive state (ON/True/1) or a high resistive state (OFF/False/0).
     """
 
+    __slots__ = ("row", "column", "layer", "literal", "stuck_at_fault")
+
     def __init__(self, row: int, column: int, literal: LITERAL, layer: int = 0, stuck_at_fault: LITERAL = None):
         """
         Constructs a memristor object for given literal at the given row, column, and layer.
@@ -55,6 +57,13 @@ class Memristor(BooleanExpression):
     def substitute(self, original: LITERAL, replacement: BooleanExpression) -> BooleanExpression:
         raise NotImplementedError()
 
+    def _substitute_children(self, substitutions: Dict[str, BooleanExpression],
+                             memo: Dict[int, BooleanExpression]) -> BooleanExpression:
+        raise NotImplementedError()
+
+    def _get_flat_node(self) -> Tuple[int, Tuple[BooleanExpression, ...], Optional[str]]:
+        raise NotImplementedError()
+
     def simplify(self) -> BooleanExpression:
         raise NotImplementedError()
 
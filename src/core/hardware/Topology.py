@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import re
 from pathlib import Path
-from typing import Dict, Set
+from typing import Dict, Set, Iterator, TextIO, List
 
 from networkx import MultiDiGraph, topological_sort, dag_longest_path
 
@@ -31,33 +31,21 @@ class TopologyParser(Parser):
 
         graph = MultiDiGraph()
 
-        xbar_start_lines = []
+        # The content is read in a single pass. The content of a crossbar starts at the last .model before its .xbar,
+        # and stops at the first .end after its .xbar.
         lines = self.content.splitlines(keepends=True)
-        for i in range(len(lines)):
-            line = lines[i]
-            if line.startswith(".xbar"):
-                xbar_start_lines.append(i)
-
-        for i in xbar_start_lines:
-            xbar_model_start = 0
-            xbar_model_end = 0
-
-            for j in range(i, -1, -1):
-                line = lines[j]
-                if line.startswith(".model"):
-                    xbar_model_start = j
-                    break
-            for j in range(i + 1, len(lines), 1):
-                line = lines[j]
-                if line.startswith(".end"):
-                    xbar_model_end = j
-                    break
-
-            sub_content = "".join(lines[xbar_model_start:xbar_model_end])
-
-            xbar = Crossbar.from_string(sub_content)
-
-            graph.add_node(xbar)
+        xbar_model_start = 0
+        in_xbar = False
+        for i, line in enumerate(lines):
+            if line.startswith(".model"):
+                if not in_xbar:
+                    xbar_model_start = i
+            elif line.startswith(".xbar"):
+                in_xbar = True
+            elif line.startswith(".end") and in_xbar:
+                xbar = Crossbar.from_string("".join(lines[xbar_model_start:i]))
+                graph.add_node(xbar)
+                in_xbar = False
 
         topology = Topology(graph)
 
@@ -81,6 +69,26 @@ class Topology(Component):
         self.file_path = file_path
         self.graph = graph
 
+    @property
+    def graph(self) -> MultiDiGraph:
+        return self._graph
+
+    @graph.setter
+    def graph(self, graph: MultiDiGraph):
+        # The order of evaluation depends on the graph. Hence, it is sorted again when the graph is assigned.
+        self._graph = graph
+        self._topological_order = None
+
+    def _get_topological_order(self) -> List:
+        """
+        Returns the nodes of this topology in topological order. The order is sorted once and kept until the graph is
+        assigned.
+        :return: A list of the nodes of the graph.
+        """
+        if self._topological_order is None:
+            self._topological_order = list(topological_sort(self.graph))
+        return self._topological_order
+
     @staticmethod
     def get_file_extension() -> str:
         return "topo"
@@ -116,16 +124,25 @@ class Topology(Component):
         return topology
 
     def to_string(self) -> str:
-        content = ""
-        content += ".model {}\n".format(self.get_name())
-        content += ".inputs {}\n".format(' '.join(self.get_input_variables()))
-        content += ".outputs {}\n".format(' '.join(self.get_output_variables()))
-        content += ".topo\n"
+        return "".join(self._iter_string())
+
+    def write_to(self, fp: TextIO):
+        # The content is written crossbar by crossbar, such that the crossbars are not joined first.
+        fp.writelines(self._iter_string())
+
+    def _iter_string(self) -> Iterator[str]:
+        """
+        Returns the content of this topology, in its file format, part by part.
+        :return: An iterator over the parts of the content.
+        """
+        yield ".model {}\n".format(self.get_name())
+        yield ".inputs {}\n".format(' '.join(self.get_input_variables()))
+        yield ".outputs {}\n".format(' '.join(self.get_output_variables()))
+        yield ".topo\n"
         for node in self.graph.nodes:
             assert isinstance(node, Crossbar)
-            content += node.to_string()
-        content += ".end\n"
-        return content
+            yield node.to_string()
+        yield ".end\n"
 
     def to_json(self) -> Dict:
         return {
@@ -139,91 +156,67 @@ class Topology(Component):
         }
 
     def to_dot(self) -> str:
-        content = ""
-        content += 'graph {} {{\n'.format(self.get_name())
-        content += '\trankdir=TB;\n'
-        content += '\tcompound=true;\n'
-        content += '\tgraph [nodesep="0.2", ranksep="0.2"];\n'
-        content += '\tcharset="UTF-8";\n'
-        content += '\tratio=fill;\n'
-        content += '\tsplines=ortho;\n'
-        content += '\toverlap=scale;\n'
-        content += '\tnode [shape=circle, fixedsize=true, width=0.4, fontsize=4];\n'
-        content += '\n'
+        parts = [
+            f'graph {self.get_name()} {{\n',
+            '\trankdir=TB;\n',
+            '\tcompound=true;\n',
+            '\tgraph [nodesep="0.2", ranksep="0.2"];\n',
+            '\tcharset="UTF-8";\n',
+            '\tratio=fill;\n',
+            '\tsplines=ortho;\n',
+            '\toverlap=scale;\n',
+            '\tnode [shape=circle, fixedsize=true, width=0.4, fontsize=4];\n',
+            '\n'
+        ]
 
         node_to_nr = dict()
         for node in topological_sort(self.graph):
             for sub_content in node.draw():
                 i = node.get_name()
                 node_to_nr[node] = i
-                import re
                 subgraph = re.sub(r'(m\d+)', r's{}\1'.format(i), sub_content)
                 subgraph = subgraph.splitlines()
                 subgraph = subgraph[1:-1]
                 subgraph = "\n".join(subgraph)
-                content += '\tsubgraph cluster{} {{\n'.format(i)
-                content += '\t\tlabel="{}"\n'.format(i)
-                content += subgraph
-                content += '\n\t}\n\n'
+                parts.append(f'\tsubgraph cluster{i} {{\n')
+                parts.append(f'\t\tlabel="{i}"\n')
+                parts.append(subgraph)
+                parts.append('\n\t}\n\n')
 
         # TODO: Change isinstance(x0, CLASS) <-> ugly
         for (node0, node1, ei) in self.graph.edges:
+            edge_data = self.graph.get_edge_data(node0, node1, ei)
             if isinstance(node0, Crossbar):
-                edge_data = self.graph.get_edge_data(node0, node1, ei)
                 x0 = node0
                 x1 = node1
-                l0 = edge_data.get("l0")
-                i0 = edge_data.get("i0")
-                l1 = edge_data.get("l1")
-                i1 = edge_data.get("i1")
-                nr0 = node_to_nr.get(x0)
-                nr1 = node_to_nr.get(x1)
-
-                if l0 == 0:  # Row
-                    r0 = i0 + 1
-                    c0 = x0.columns
-                else:  # Column
-                    r0 = x0.rows + 1
-                    c0 = i0 + 1
-
-                if l1 == 0:  # Row
-                    r1 = i1 + 1
-                    c1 = 0
-                else:  # Column
-                    r1 = x1.rows + 1
-                    c1 = i1 + 1
-
-                content += '\ts{}m{}_{}:e -- s{}m{}_{}:s [style = dashed, penwidth = 1, color="#000000", splines=ortho, constraint=false];\n'.format(nr0, r0, c0, nr1, r1, c1)
             else:
-                edge_data = self.graph.get_edge_data(node0, node1, ei)
-                s0 = node0
-                s1 = node1
-                x0 = s0.get_crossbars()[-1]
-                x1 = s1.get_crossbars()[0]
-                l0 = edge_data.get("l0")
-                i0 = edge_data.get("i0")
-                l1 = edge_data.get("l1")
-                i1 = edge_data.get("i1")
-                nr0 = node_to_nr.get(x0)
-                nr1 = node_to_nr.get(x1)
-
-                if l0 == 0:  # Row
-                    r0 = i0 + 1
-                    c0 = x0.columns
-                else:  # Column
-                    r0 = x0.rows + 1
-                    c0 = i0 + 1
-
-                if l1 == 0:  # Row
-                    r1 = i1 + 1
-                    c1 = 0
-                else:  # Column
-                    r1 = x1.rows + 1
-                    c1 = i1 + 1
-
-                content += '\ts{}m{}_{}:e -- s{}m{}_{}:s [style = dashed, penwidth = 1, color="#000000", splines=ortho, constraint=false];\n'.format(nr0, r0, c0, nr1, r1, c1)
-        content += '}'
-        return content
+                x0 = node0.get_crossbars()[-1]
+                x1 = node1.get_crossbars()[0]
+            l0 = edge_data.get("l0")
+            i0 = edge_data.get("i0")
+            l1 = edge_data.get("l1")
+            i1 = edge_data.get("i1")
+            nr0 = node_to_nr.get(x0)
+            nr1 = node_to_nr.get(x1)
+
+            if l0 == 0:  # Row
+                r0 = i0 + 1
+                c0 = x0.columns
+            else:  # Column
+                r0 = x0.rows + 1
+                c0 = i0 + 1
+
+            if l1 == 0:  # Row
+                r1 = i1 + 1
+                c1 = 0
+            else:  # Column
+                r1 = x1.rows + 1
+                c1 = i1 + 1
+
+            parts.append(f'\ts{nr0}m{r0}_{c0}:e -- s{nr1}m{r1}_{c1}:s [style = dashed, penwidth = 1, color="#000000", '
+                         f'splines=ortho, constraint=false];\n')
+        parts.append('}')
+        return ''.join(parts)
 
     def get_log(self) -> Dict:
         return {
@@ -246,17 +239,11 @@ class Topology(Component):
         evaluations = {input_function: True}
         evaluations.update(instance)
 
-        i = 0
-        for node in topological_sort(self.graph):
-            for input_function in node.get_input_nanowires().keys():
-                if evaluations.get(input_function):
-                    evaluation = node.eval(evaluations, input_function)
-                    for key, value in evaluation.items():
-                        if key in evaluations:
-                            current_value = evaluations.get(key)
-                            if not current_value:
-                                evaluations[key] = value
-                        else:
+        for node in self._get_topological_order():
+            for node_input_function in node.get_input_nanowires():
+                if evaluations.get(node_input_function):
+                    # An evaluation that is true is kept, the other evaluations are overwritten.
+                    for key, value in node.eval(evaluations, node_input_function).items():
+                        if not evaluations.get(key):
                             evaluations[key] = value
-            i += 1
         return evaluations
@@ -5,7 +5,7 @@ from typing import Any, Dict
 from utils import config
 from core.decision_diagrams.BDD import BDD
 from synth.SynthesisMethod import SynthesisMethod
-from core.expressions.BooleanExpression import LITERAL
+from core.expressions.BooleanExpression import LITERAL, TRUE_LITERAL
 from core.hardware.Crossbar import MemristorCrossbar
 
 
@@ -34,31 +34,32 @@ class ChakrabortyAutomatedSynthesis(SynthesisMethod):
 
         # We assign each node to a layer with the terminal node to the bottom-most nanowire
         # and the root node to the top-most nanowire
-        r = 0
+        node_layers = {node: r for (r, node) in enumerate(self.dd.dag.nodes)}
+
+        # The nodes and their out-edges are walked once. The successors are read from the adjacency of the graph
+        # directly, instead of through an edge view per node.
+        successors = self.dd.dag.adj
+        # The memristors are gathered first and assigned to the crossbar at once.
+        rows = []
+        columns = []
+        literals = []
         input_variables = set()
         input_nodes = dict()
         root_nodes = dict()
-        node_layers = dict()
+        c = 0
         for (current_node, node_data) in self.dd.dag.nodes(data=True):
-            input_variables.add(node_data["variable"])
+            r_current_node = node_layers[current_node]
+            variable = node_data["variable"]
+            input_variables.add(variable)
             if node_data["root"]:
-                output_variables = node_data["output_variables"]
-                for output_variable in output_variables:
-                    root_nodes[output_variable] = (0, r)
+                for output_variable in node_data["output_variables"]:
+                    root_nodes[output_variable] = (0, r_current_node)
             if node_data["terminal"]:
-                input_variable = node_data["variable"]
-                input_nodes[input_variable] = (0, r)
-            node_layers[current_node] = r
-            r += 1
-
-        c = 0
-        for (current_node, node_data) in self.dd.dag.nodes(data=True):
-            out_edges = self.dd.dag.edges(current_node, data=True)
-            variable = node_data['variable']
+                input_nodes[variable] = (0, r_current_node)
 
             positive_child_node = None
             negative_child_node = None
-            for (_, child_node, edge_data) in out_edges:
+            for (child_node, edge_data) in successors[current_node].items():
                 literal = edge_data.get("literal")
                 if literal.positive:
                     positive_child_node = child_node
@@ -66,17 +67,16 @@ class ChakrabortyAutomatedSynthesis(SynthesisMethod):
                     negative_child_node = child_node
 
             if positive_child_node is not None:
-                r_current_node = node_layers[current_node]
-                r_child_node = node_layers[positive_child_node]
-                crossbar.set_memristor(r_current_node, c, LITERAL(variable, True))
-                crossbar.set_memristor(r_child_node, c, LITERAL("True", True))
+                rows += (r_current_node, node_layers[positive_child_node])
+                columns += (c, c)
+                literals += (LITERAL(variable, True), TRUE_LITERAL)
                 c += 1
             if negative_child_node is not None:
-                r_current_node = node_layers[current_node]
-                r_child_node = node_layers[negative_child_node]
-                crossbar.set_memristor(r_current_node, c, LITERAL(variable, False))
-                crossbar.set_memristor(r_child_node, c, LITERAL("True", True))
+                rows += (r_current_node, node_layers[negative_child_node])
+                columns += (c, c)
+                literals += (LITERAL(variable, False), TRUE_LITERAL)
                 c += 1
+        crossbar.set_memristors(rows, columns, literals)
 
         crossbar.input_variables = list(input_variables)
         for (input_function, (layer, nanowire)) in input_nodes.items():
@@ -1,7 +1,7 @@
 from networkx import Graph
 
 from utils import config
-from core.expressions.BooleanExpression import LITERAL
+from core.expressions.BooleanExpression import TRUE_LITERAL
 from core.hardware.Crossbar import MemristorCrossbar
 
 
@@ -11,6 +11,9 @@ class CrossbarMapping2D:
         self.graph = graph
         self.vertical = []
         self.horizontal = []
+        # The positions of the nodes in the lists above, such that a node is looked up without a linear search.
+        self._vertical_indices = dict()
+        self._horizontal_indices = dict()
         self.crossbar = None
         self.log = ''
 
@@ -26,11 +29,15 @@ class CrossbarMapping2D:
     def _node_assignment(self, vh_labeling):
         for node in self.graph.nodes:
             if vh_labeling[node] == 1:
+                self._vertical_indices[node] = len(self.vertical)
                 self.vertical.append(node)
             elif vh_labeling[node] == -1:
+                self._horizontal_indices[node] = len(self.horizontal)
                 self.horizontal.append(node)
             else:
+                self._vertical_indices[node] = len(self.vertical)
                 self.vertical.append(node)
+                self._horizontal_indices[node] = len(self.horizontal)
                 self.horizontal.append(node)
         rows = len(self.horizontal)
         columns = len(self.vertical)
@@ -43,74 +50,81 @@ class CrossbarMapping2D:
         input_nodes = dict()
         root_nodes = dict()
         visited_nodes = set()
-        for node_a, node_b in self.graph.edges:
-            if not self.graph.nodes[node_a]["terminal"]:
-                input_variables.add(self.graph.nodes[node_a]["variable"])
-            if not self.graph.nodes[node_b]["terminal"]:
-                input_variables.add(self.graph.nodes[node_b]["variable"])
+        # The memristors are gathered first and assigned to the crossbar at once.
+        memristors = []
+        # The data of the nodes and the literals of the edges are read once per edge.
+        nodes = self.graph.nodes
+        for node_a, node_b, literal in self.graph.edges(data="literal"):
+            node_data_a = nodes[node_a]
+            node_data_b = nodes[node_b]
+            if not node_data_a["terminal"]:
+                input_variables.add(node_data_a["variable"])
+            if not node_data_b["terminal"]:
+                input_variables.add(node_data_b["variable"])
             visited_nodes.add(node_a)
             visited_nodes.add(node_b)
             if config.io_constraints:
-                if self.graph.nodes[node_a]["terminal"]:
-                    input_variable = self.graph.nodes[node_a]["variable"]
-                    input_nodes[input_variable] = self.horizontal.index(node_a)
-                if self.graph.nodes[node_b]["terminal"]:
-                    input_variable = self.graph.nodes[node_b]["variable"]
-                    input_nodes[input_variable] = self.horizontal.index(node_b)
-                if self.graph.nodes[node_a]["root"]:
-                    output_variables = self.graph.nodes[node_a]["output_variables"]
+                if node_data_a["terminal"]:
+                    input_variable = node_data_a["variable"]
+                    input_nodes[input_variable] = self._horizontal_indices[node_a]
+                if node_data_b["terminal"]:
+                    input_variable = node_data_b["variable"]
+                    input_nodes[input_variable] = self._horizontal_indices[node_b]
+                if node_data_a["root"]:
+                    output_variables = node_data_a["output_variables"]
                     for output_variable in output_variables:
-                        root_nodes[output_variable] = self.horizontal.index(node_a)
-                if self.graph.nodes[node_b]["root"]:
-                    output_variables = self.graph.nodes[node_b]["output_variables"]
+                        root_nodes[output_variable] = self._horizontal_indices[node_a]
+                if node_data_b["root"]:
+                    output_variables = node_data_b["output_variables"]
                     for output_variable in output_variables:
-                        root_nodes[output_variable] = self.horizontal.index(node_b)
+                        root_nodes[output_variable] = self._horizontal_indices[node_b]
 
-            edge_data = self.graph.get_edge_data(node_a, node_b)
-            literal = edge_data.get("literal")
             # if variable is not None and positive is not None:
             #     literal = LITERAL(variable, positive)
 
-            if node_a in self.horizontal and node_a in self.vertical:
-                if node_b in self.horizontal:
-                    r = self.horizontal.index(node_b)
-                    c = self.vertical.index(node_a)
+            if node_a in self._horizontal_indices and node_a in self._vertical_indices:
+                if node_b in self._horizontal_indices:
+                    r = self._horizontal_indices[node_b]
+                    c = self._vertical_indices[node_a]
                 else:
-                    r = self.horizontal.index(node_a)
-                    c = self.vertical.index(node_b)
-                self.crossbar.set_memristor(r, c, literal)
+                    r = self._horizontal_indices[node_a]
+                    c = self._vertical_indices[node_b]
+                memristors.append((r, c, literal))
 
-                r = self.horizontal.index(node_a)
-                c = self.vertical.index(node_a)
-                self.crossbar.set_memristor(r, c, LITERAL('True', True))
-            elif node_b in self.horizontal and node_b in self.vertical:
-                if node_a in self.horizontal:
-                    r = self.horizontal.index(node_a)
-                    c = self.vertical.index(node_b)
+                r = self._horizontal_indices[node_a]
+                c = self._vertical_indices[node_a]
+                memristors.append((r, c, TRUE_LITERAL))
+            elif node_b in self._horizontal_indices and node_b in self._vertical_indices:
+                if node_a in self._horizontal_indices:
+                    r = self._horizontal_indices[node_a]
+                    c = self._vertical_indices[node_b]
                 else:
-                    r = self.horizontal.index(node_b)
-                    c = self.vertical.index(node_a)
-                self.crossbar.set_memristor(r, c, literal)
+                    r = self._horizontal_indices[node_b]
+                    c = self._vertical_indices[node_a]
+                memristors.append((r, c, literal))
 
-                r = self.horizontal.index(node_b)
-                c = self.vertical.index(node_b)
-                self.crossbar.set_memristor(r, c, LITERAL('True', True))
-            elif node_a in self.horizontal and node_b in self.vertical:
-                r = self.horizontal.index(node_a)
-                c = self.vertical.index(node_b)
-                self.crossbar.set_memristor(r, c, literal)
+                r = self._horizontal_indices[node_b]
+                c = self._vertical_indices[node_b]
+                memristors.append((r, c, TRUE_LITERAL))
+            elif node_a in self._horizontal_indices and node_b in self._vertical_indices:
+                r = self._horizontal_indices[node_a]
+                c = self._vertical_indices[node_b]
+                memristors.append((r, c, literal))
             else:
-                r = self.horizontal.index(node_b)
-                c = self.vertical.index(node_a)
-                self.crossbar.set_memristor(r, c, literal)
+                r = self._horizontal_indices[node_b]
+                c = self._vertical_indices[node_a]
+                memristors.append((r, c, literal))
 
-        unvisited_nodes = set(self.graph.nodes) - visited_nodes
+        if memristors:
+            rows, columns, literals = zip(*memristors)
+            self.crossbar.set_memristors(rows, columns, literals)
 
-        for node in unvisited_nodes:
-            if self.graph.nodes[node]["root"]:
-                output_variables = self.graph.nodes[node]["output_variables"]
+        # The unvisited nodes are selected while walking the nodes, instead of building the difference of two sets.
+        for node, node_data in self.graph.nodes(data=True):
+            if node not in visited_nodes and node_data["root"]:
+                output_variables = node_data["output_variables"]
                 for output_variable in output_variables:
-                    root_nodes[output_variable] = self.horizontal.index(node)
+                    root_nodes[output_variable] = self._horizontal_indices[node]
 
         self.crossbar.input_variables = list(input_variables)
         for (input_function, nanowire) in input_nodes.items():
@@ -3,7 +3,7 @@ import math
 from networkx import Graph
 
 from utils import config
-from core.expressions.BooleanExpression import LITERAL
+from core.expressions.BooleanExpression import TRUE_LITERAL
 from core.hardware.Crossbar import MemristorCrossbar
 
 
@@ -31,20 +31,30 @@ class CrossbarMapping3D:
             for layer in layers:
                 q[layer].append(node)
 
+        # The positions of the nodes on the nanowires of each layer, such that a node is looked up without a search.
+        positions = [{node: i for (i, node) in enumerate(nodes)} for nodes in q]
+
         crossbar = MemristorCrossbar(rows, columns, layers=self.layers)
+        # The memristors are gathered first and assigned to the crossbar at once.
+        memristor_layers = []
+        memristor_rows = []
+        memristor_columns = []
+        memristor_literals = []
 
         for ((v0, v1), (l0, l1)) in edge_assignment.items():
             if l0 % 2 == 0:
                 l = min(l0, l1)
-                r = q[l0].index(v0)
-                c = q[l1].index(v1)
+                r = positions[l0][v0]
+                c = positions[l1][v1]
             else:
                 l = min(l0, l1)
-                c = q[l0].index(v0)
-                r = q[l1].index(v1)
+                c = positions[l0][v0]
+                r = positions[l1][v1]
             edge_data = self.graph.get_edge_data(v0, v1)
-            literal = edge_data["literal"]
-            crossbar.set_memristor(r, c, literal, layer=l)
+            memristor_layers.append(l)
+            memristor_rows.append(r)
+            memristor_columns.append(c)
+            memristor_literals.append(edge_data["literal"])
 
         # For each node v in layers (l, l+1), we introduce a True value.
         for (node, layers) in node_assignment.items():
@@ -54,29 +64,33 @@ class CrossbarMapping3D:
             if config.io_constraints:
                 if self.graph.nodes[node]["terminal"]:
                     input_variable = self.graph.nodes[node]["variable"]
-                    input_nodes[input_variable] = (0, q[0].index(node))
+                    input_nodes[input_variable] = (0, positions[0][node])
                 if self.graph.nodes[node]["root"]:
                     output_variables = self.graph.nodes[node]["output_variables"]
                     for output_variable in output_variables:
                         if config.output_layer is not None:
-                            root_nodes[output_variable] = (config.output_layer, q[config.output_layer].index(node))
+                            root_nodes[output_variable] = (config.output_layer, positions[config.output_layer][node])
                         else:
                             if self.layers % 2 == 0:
-                                root_nodes[output_variable] = (self.layers, q[self.layers].index(node))
+                                root_nodes[output_variable] = (self.layers, positions[self.layers][node])
                             else:
-                                root_nodes[output_variable] = (self.layers - 1, q[self.layers - 1].index(node))
+                                root_nodes[output_variable] = (self.layers - 1, positions[self.layers - 1][node])
 
             sorted(layers)
 
             for i in range(len(layers) - 1):
                 l = layers[i]
                 if l % 2 == 0:
-                    r = q[l].index(node)
-                    c = q[l+1].index(node)
+                    r = positions[l][node]
+                    c = positions[l+1][node]
                 else:
-                    c = q[l].index(node)
-                    r = q[l+1].index(node)
-                crossbar.set_memristor(r, c, LITERAL("True", True), layer=l)
+                    c = positions[l][node]
+                    r = positions[l+1][node]
+                memristor_layers.append(l)
+                memristor_rows.append(r)
+                memristor_columns.append(c)
+                memristor_literals.append(TRUE_LITERAL)
+        crossbar.set_memristors(memristor_rows, memristor_columns, memristor_literals, layer=memristor_layers)
 
         crossbar.input_variables = list(input_variables)
         for (input_function, (layer, nanowire)) in input_nodes.items():
@@ -1,7 +1,10 @@
 import time
+from collections import deque
+from itertools import accumulate
 from math import floor
+from typing import Tuple
 
-from networkx import weisfeiler_lehman_graph_hash, topological_generations, reverse
+from networkx import weisfeiler_lehman_graph_hash, topological_generations, reverse, DiGraph
 
 from utils import config
 from core.decision_diagrams.BDDTopology import BDDTopology
@@ -62,28 +65,37 @@ class ISO:
         self.start_time = None
         self.end_time = None
 
+    @staticmethod
+    def _get_structure(dag: DiGraph) -> Tuple[int, Tuple[Tuple[int, int], ...]]:
+        """
+        Returns the structure of the given DAG, i.e. its number of nodes and its edges between node positions.
+        DAGs with the same structure are isomorphic, and therefore have the same Weisfeiler-Lehman hash.
+        :param dag: The given DAG.
+        :return: A tuple of the number of nodes and the edges.
+        """
+        positions = {node: i for (i, node) in enumerate(dag.nodes)}
+        return len(positions), tuple((positions[u], positions[v]) for (u, v) in dag.edges)
+
     def find(self):
         self.start_time = time.time()
         root_node_to_hash = dict()
         bdd_patterns = dict()
+        # BDDs with the same structure have the same hash, hence the hash is only computed once per structure.
+        structure_to_hash = dict()
         for root_node, bdd in self.bdd_topology.bdds.items():
-            bdd_hash = weisfeiler_lehman_graph_hash(bdd.dag, digest_size=16)
+            structure = ISO._get_structure(bdd.dag)
+            bdd_hash = structure_to_hash.get(structure)
+            if bdd_hash is None:
+                bdd_hash = weisfeiler_lehman_graph_hash(bdd.dag, digest_size=16)
+                structure_to_hash[structure] = bdd_hash
             root_node_to_hash[root_node] = bdd_hash
-            if bdd_hash not in bdd_patterns:
-                bdd_patterns[bdd_hash] = set()
-            bdd_patterns[bdd_hash].add(bdd)
+            # Each root node has its own BDD, hence the BDDs of a pattern are kept in a list instead of a set.
+            bdd_patterns.setdefault(bdd_hash, []).append(bdd)
 
-        generations = list(topological_generations(reverse(self.bdd_topology.topology)))
-
-        # We remove the primary input variables
-        new_generations = []
-        for generation in generations:
-            new_generation = []
-            for node in generation:
-                if node in self.bdd_topology.bdds.keys():
-                    new_generation.append(node)
-            new_generations.append(new_generation)
-        generations = new_generations
+        # We remove the primary input variables while the generations are taken from the topology.
+        bdds = self.bdd_topology.bdds
+        generations = [[node for node in generation if node in bdds]
+                       for generation in topological_generations(reverse(self.bdd_topology.topology))]
 
         # for hash, bdds in bdd_patterns.items():
         #     bdd = list(bdds)[0]
@@ -98,7 +110,7 @@ class ISO:
         json_content["patterns"] = []
         bdd_pattern_stats = dict()
         for bdd_hash, bdds in bdd_patterns.items():
-            bdd = list(bdds)[0]
+            bdd = bdds[0]
             json_content["patterns"].append({
                 "hash": bdd_hash,
                 "nr_bdds": len(bdds),
@@ -115,7 +127,7 @@ class ISO:
         total_cols = 0
         total_semi = 0
         for bdds in bdd_patterns.values():
-            bdd = list(bdds)[0]
+            bdd = bdds[0]
             rows = len(bdd.dag.nodes)
             cols = len(bdd.dag.edges)
             total_rows += rows * len(bdds)
@@ -140,10 +152,13 @@ class ISO:
         }
 
         self.start_time = time.time()
+        get_hash = root_node_to_hash.get
         new_generations = []
+        # The generations are taken from and pushed down to the front, hence a double-ended queue is used.
+        generations = deque(generations)
         while len(generations) != 0:
-            root_node_generation = generations.pop(0)
-            hash_generation = list(filter(lambda y: y is not None, map(lambda x: root_node_to_hash.get(x), list(root_node_generation))))
+            root_node_generation = generations.popleft()
+            hash_generation = [bdd_hash for bdd_hash in map(get_hash, root_node_generation) if bdd_hash is not None]
             hash_to_nodes = dict()
             for i in range(len(hash_generation)):
                 bdd_hash = hash_generation[i]
@@ -165,7 +180,7 @@ class ISO:
                     pushed_down_nodes.extend(root_nodes[1:])
             new_generations.append(kept_nodes)
             if len(pushed_down_nodes) > 0:
-                generations.insert(0, pushed_down_nodes)
+                generations.appendleft(pushed_down_nodes)
         generations = new_generations  # Ordered from output -> input. For evaluation, the reverse is needed.
 
         # for generation in new_generations:
@@ -175,7 +190,7 @@ class ISO:
         total_cols = 0
         total_semi = 0
         for bdds in bdd_patterns.values():
-            bdd = list(bdds)[0]
+            bdd = bdds[0]
             rows = len(bdd.dag.nodes)
             cols = len(bdd.dag.edges)
             total_rows += rows
@@ -209,22 +224,30 @@ class ISO:
             sorted_bdd_pattern_keys = list(sorted_bdd_pattern_stats.keys())
             sorted_bdd_pattern_values = list(sorted_bdd_pattern_stats.values())
 
+            # The sums of the fixed BDDs and the maxima of the variable BDDs are accumulated once for every split,
+            # such that a step of the binary search only looks them up. The maxima are 0 when no BDD is variable.
+            rows_per_pattern = [x[1] for x in sorted_bdd_pattern_values]
+            columns_per_pattern = [x[2] for x in sorted_bdd_pattern_values]
+            prefix_rows = list(accumulate(rows_per_pattern, initial=0))
+            prefix_columns = list(accumulate(columns_per_pattern, initial=0))
+            suffix_max_rows = list(accumulate(reversed(rows_per_pattern), max, initial=0))[::-1]
+            suffix_max_columns = list(accumulate(reversed(columns_per_pattern), max, initial=0))[::-1]
+
+            def get_split(split: int) -> Tuple[int, int, int, int]:
+                # A negative split counts from the end, as in the slices of the patterns.
+                if split < 0:
+                    split += len(sorted_bdd_pattern_values)
+                return prefix_rows[split], prefix_columns[split], suffix_max_rows[split], suffix_max_columns[split]
+
             low = 0
             high = len(sorted_bdd_pattern_stats)
             mid = floor((low + high) / 2)
             while low <= high:
-                fixed_rows = sum(list(map(lambda x: x[1], sorted_bdd_pattern_values[:mid])))
-                fixed_columns = sum(list(map(lambda x: x[2], sorted_bdd_pattern_values[:mid])))
+                fixed_rows, fixed_columns, largest_variable_row, largest_variable_column = get_split(mid)
                 if fixed_rows > self.D or fixed_columns > self.D:
                     high = mid - 1
                     mid = floor((low + high) / 2)
                 else:
-                    if mid == len(sorted_bdd_pattern_values):
-                        largest_variable_row = 0
-                        largest_variable_column = 0
-                    else:
-                        largest_variable_row = max(list(map(lambda x: x[1], sorted_bdd_pattern_values[mid:])))
-                        largest_variable_column = max(list(map(lambda x: x[2], sorted_bdd_pattern_values[mid:])))
                     if fixed_rows + largest_variable_row > self.D or fixed_columns + largest_variable_column > self.D:
                         high = mid - 1
                         mid = floor((low + high) / 2)
@@ -232,14 +255,7 @@ class ISO:
                         low = mid + 1
                         mid = floor((low + high) / 2)
 
-            fixed_rows = sum(list(map(lambda x: x[1], sorted_bdd_pattern_values[:mid])))
-            fixed_columns = sum(list(map(lambda x: x[2], sorted_bdd_pattern_values[:mid])))
-            if mid == len(sorted_bdd_pattern_values):
-                largest_variable_row = 0
-                largest_variable_column = 0
-            else:
-                largest_variable_row = max(list(map(lambda x: x[1], sorted_bdd_pattern_values[mid:])))
-                largest_variable_column = max(list(map(lambda x: x[2], sorted_bdd_pattern_values[mid:])))
+            fixed_rows, fixed_columns, largest_variable_row, largest_variable_column = get_split(mid)
             print("Mid: {}".format(mid))
             print("Max rows: {}".format(fixed_rows + largest_variable_row))
             print("Max cols: {}".format(fixed_columns + largest_variable_column))
@@ -264,11 +280,11 @@ class ISO:
 
             for i in range(len(reversed_generations)):
                 generation = set(reversed_generations[i])
-                all_bdds = set(map(lambda r: root_node_to_hash.get(r), generation))
+                all_bdds = set(map(get_hash, generation))
 
                 evaluated_bdds = set()
                 for root_node in generation:
-                    bdd_hash = root_node_to_hash.get(root_node)
+                    bdd_hash = get_hash(root_node)
                     if bdd_hash in fixed_bdds:
                         evaluated_bdds.add(bdd_hash)
                     if bdd_hash == variable_bdd:
@@ -17,6 +17,9 @@ class PATH(SynthesisMethod):
     Implementation for the synthesis method PATH.
     """
 
+    # The nodes of a BDD without output variables share a single empty set of output variables.
+    _no_output_variables = frozenset()
+
     def __init__(self, bdd: BDD, partitioning_method_type: Type[PartitioningMethod]):
         """
         Given a BDD, a partitioning method and optional hardware constraints,
@@ -60,14 +63,12 @@ class PATH(SynthesisMethod):
             return B
 
         for u, node_data in dag.nodes(data=True):
-            if "output_variables" not in node_data:
-                node_data["output_variables"] = set()
-            B.add_node(u, bipartite=0, **node_data)
-
-        for u in dag.nodes:
-            for edge in dag.in_edges(u):
-                (v, _) = edge
-                edge_data = dag.get_edge_data(v, u)
+            B.add_node(u, bipartite=0, **{"output_variables": PATH._no_output_variables, **node_data})
+
+        # The incoming edges are walked through the adjacency of the predecessors, in the same order as in_edges.
+        for u, predecessors in dag.pred.items():
+            for v, edge_data in predecessors.items():
+                edge = (v, u)
                 B.add_node(edge, bipartite=1, literal=edge_data.get("literal"))
                 B.add_edge(u, edge)
                 B.add_edge(edge, v)
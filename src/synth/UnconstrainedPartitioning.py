@@ -8,7 +8,7 @@ from networkx.algorithms.bipartite import sets
 
 from core.hardware.Crossbar import SelectorCrossbar
 from core.hardware.Topology import Topology
-from core.expressions.BooleanExpression import LITERAL
+from core.expressions.BooleanExpression import TRUE_LITERAL
 from synth.PartitioningMethod import PartitioningMethod
 
 
@@ -48,33 +48,34 @@ class UnconstrainedPartitioning(PartitioningMethod):
         # We assign the nodes (nodes in the set U) and edges (nodes in the set V) of the BDD to the crossbar
         crossbar.selectorlines = list(self.V)
         crossbar.wordlines = list(self.U)
-
-        # We set the output(s) of the crossbar
-        node_output_variables = list(map(lambda u: (u, self.graph.nodes[u]["output_variables"]), filter(lambda u: self.graph.nodes[u]["root"] == True, self.U)))
-        for (node, output_variables) in node_output_variables:
-            row = crossbar.wordlines.index(node)
-            for output_variable in output_variables:
-                crossbar.set_output_nanowire(output_variable, row)
-
-        # We set the input(s) of the crossbar
-        node_input_variables = list(map(lambda u: (u, self.graph.nodes[u]["variable"]), filter(lambda u: self.graph.nodes[u]["terminal"] == True, self.U)))
-        for (node, input_variable) in node_input_variables:
-            row = crossbar.wordlines.index(node)
-            crossbar.set_input_nanowire(input_variable, row)
+        # The positions of the nodes on the nanowires, such that a node is looked up without a linear search.
+        wordline_indices = {node: i for (i, node) in enumerate(crossbar.wordlines)}
+        selectorline_indices = {node: i for (i, node) in enumerate(crossbar.selectorlines)}
+
+        # We set the output(s) and the input(s) of the crossbar in a single walk along the wordlines
+        nodes = self.graph.nodes
+        for (row, node) in enumerate(crossbar.wordlines):
+            node_data = nodes[node]
+            if node_data["root"]:
+                for output_variable in node_data["output_variables"]:
+                    crossbar.set_output_nanowire(output_variable, row)
+            if node_data["terminal"]:
+                crossbar.set_input_nanowire(node_data["variable"], row)
 
         # For each edge e=(u,v), we will program the respective memristor ON.
+        memristor_rows = []
+        memristor_columns = []
         for (u, v) in self.graph.edges:
-            if u in self.U:
-                r = crossbar.wordlines.index(u)
-                c = crossbar.selectorlines.index(v)
+            if u in wordline_indices:
+                memristor_rows.append(wordline_indices[u])
+                memristor_columns.append(selectorline_indices[v])
             else:
-                r = crossbar.wordlines.index(v)
-                c = crossbar.selectorlines.index(u)
-            crossbar.set_memristor(r, c, LITERAL("True", True))
+                memristor_rows.append(wordline_indices[v])
+                memristor_columns.append(selectorline_indices[u])
+        crossbar.set_memristors(memristor_rows, memristor_columns, [TRUE_LITERAL] * len(memristor_rows))
 
         # We replace the nodes assigned to the selectorlines with their respective literals.
-        for i in range(columns):
-            crossbar.selectorlines[i] = self.graph.nodes[crossbar.selectorlines[i]]["literal"]
+        crossbar.selectorlines = [self.graph.nodes[v]["literal"] for v in crossbar.selectorlines]
 
         self.end_time = time.time()
 
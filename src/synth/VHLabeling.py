@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import time
+from collections import Counter
 from datetime import datetime
 from typing import Dict, List, Any
 
-from networkx import Graph
-from pulp import LpVariable, LpProblem, LpMinimize, LpInteger, lpSum, LpStatus, LpStatusInfeasible, CPLEX_CMD
+from networkx import Graph, bfs_edges
+from pulp import LpVariable, LpProblem, LpMinimize, LpInteger, lpSum, LpStatus, LpStatusInfeasible, CPLEX_CMD, \
+    CPLEX_PY, HiGHS, LpSolver
 
 from Loggable import Loggable
 from utils import config
@@ -24,29 +26,68 @@ class VHLabeling(Loggable):
         self.stop_time = None
 
     def get_log(self) -> List[Dict[str, Any]] | Dict[str, Any]:
+        # The labels are counted in a single pass over the labeling.
+        label_counts = Counter(self.labeling.values())
         return {
             "labeling_method": self.__class__.__name__,
             "gamma": config.gamma,
             "solution": {
                 "objective": self.objective,
-                "V": len(dict(filter(lambda elem: elem[1] == 1, self.labeling.items()))),
-                "H": len(dict(filter(lambda elem: elem[1] == -1, self.labeling.items()))),
-                "VH": len(dict(filter(lambda elem: elem[1] == 0, self.labeling.items())))
+                "V": label_counts[1],
+                "H": label_counts[-1],
+                "VH": label_counts[0]
             }
         }
 
+    @staticmethod
+    def _get_solver() -> LpSolver:
+        """
+        Returns the ILP solver. The Python API of CPLEX is preferred, as it solves the model in-process, without
+        writing it to a file and spawning the executable of CPLEX. When CPLEX is not available at all, HiGHS is used.
+        :return: The ILP solver.
+        """
+        log_path = str(config.root.joinpath("cplex.log"))
+        cplex_cmd = CPLEX_CMD(path=config.cplex_path, msg=False, keepFiles=config.keep_files,
+                              timeLimit=config.time_limit, logPath=log_path, warmStart=True)
+        for solver in [CPLEX_PY(msg=False, timeLimit=config.time_limit, logPath=log_path, warmStart=True), cplex_cmd,
+                       HiGHS(msg=False, timeLimit=config.time_limit)]:
+            if solver.available():
+                return solver
+        # Without any solver available, the executable of CPLEX reports the error once the model is solved.
+        return cplex_cmd
+
+    def _get_initial_labeling(self) -> Dict[Any, int]:
+        """
+        Returns a feasible labeling to start the ILP solver from. The nodes are labeled V and H alternately along a
+        breadth-first search, after which one node of each edge of which both nodes have the same label is labeled VH.
+        When the I/O constraints apply, a root or terminal node that is labeled V is labeled VH as well.
+        :return: A dictionary mapping each node to 1 (V), -1 (H) or 0 (VH).
+        """
+        labeling = dict()
+        undirected_graph = self.g.to_undirected(as_view=True)
+        for source in self.g.nodes:
+            if source not in labeling:
+                labeling[source] = -1
+                for (u, v) in bfs_edges(undirected_graph, source):
+                    labeling[v] = -labeling[u]
+        for (u, v) in self.g.edges:
+            if labeling[u] != 0 and labeling[u] == labeling[v]:
+                labeling[v] = 0
+        if config.io_constraints:
+            for (v, d) in self.g.nodes(data=True):
+                if (d["root"] or d["terminal"]) and labeling[v] == 1:
+                    labeling[v] = 0
+        return labeling
+
     def label(self):
         self.start_time = time.time()
 
-        solver = CPLEX_CMD(path=config.cplex_path, msg=False, keepFiles=config.keep_files, timeLimit=config.time_limit,
-                           logPath=str(config.root.joinpath("cplex.log")))
+        solver = VHLabeling._get_solver()
 
         cmbs = ['V', 'H']
         # Variables
         # 0 <= v <= 1
         x_vars = LpVariable.dicts("x", (self.g.nodes, cmbs), 0, 1, LpInteger)
-        # -1 <= g <= 1
-        s_vars = LpVariable.dicts("s", self.g.edges, 0, 1, LpInteger)
 
         # Based on: https://stackoverflow.com/questions/65572617/absolute-value-formulation-for-an-optimization-problem-with-pulp
         S = LpVariable("S", 0, cat=LpInteger)
@@ -61,12 +102,20 @@ class VHLabeling(Loggable):
         lpvc += D >= R
         lpvc += D >= C
 
-        lpvc += R == sum([x_vars[v]['V'] for v in self.g.nodes])
-        lpvc += C == sum([x_vars[v]['H'] for v in self.g.nodes])
+        lpvc += R == lpSum(x_vars[v]['V'] for v in self.g.nodes)
+        lpvc += C == lpSum(x_vars[v]['H'] for v in self.g.nodes)
 
+        # An edge e=(u,v) requires that u is labeled V and v is labeled H, or that u is labeled H and v is labeled V.
+        # In conjunctive normal form, this is (uV or uH) and (uV or vV) and (uH or vH) and (vV or vH), such that no
+        # variable is needed for the direction of the edge. The clauses of the nodes are added once per node.
         for e in self.g.edges:
-            lpvc += lpSum(x_vars[e[0]]['V'] + x_vars[e[1]]['H']) >= 2 - 2 * s_vars[e]
-            lpvc += lpSum(x_vars[e[0]]['H'] + x_vars[e[1]]['V']) >= 2 - 2 * (1 - s_vars[e])
+            x_u = x_vars[e[0]]
+            x_v = x_vars[e[1]]
+            lpvc += x_u['V'] + x_v['V'] >= 1
+            lpvc += x_u['H'] + x_v['H'] >= 1
+        for v in self.g.nodes:
+            if self.g.degree(v) > 0:
+                lpvc += x_vars[v]['V'] + x_vars[v]['H'] >= 1
 
         # Required constraint: root node and leaf node must be given a label V
         if config.io_constraints:
@@ -76,42 +125,55 @@ class VHLabeling(Loggable):
                 if d["terminal"]:
                     lpvc += x_vars[v]['H'] == 1
 
-        print("\tStarted ILP solver")
-        print("\t{}".format(datetime.now()))
+        # The solver starts from a feasible labeling, such that it can prune with its objective from the start.
+        initial_labeling = self._get_initial_labeling()
+        for (v, label) in initial_labeling.items():
+            x_vars[v]['V'].setInitialValue(int(label >= 0))
+            x_vars[v]['H'].setInitialValue(int(label <= 0))
+        initial_R = sum(1 for label in initial_labeling.values() if label >= 0)
+        initial_C = sum(1 for label in initial_labeling.values() if label <= 0)
+        S.setInitialValue(initial_R + initial_C)
+        R.setInitialValue(initial_R)
+        C.setInitialValue(initial_C)
+        D.setInitialValue(max(initial_R, initial_C))
+
+        if config.verbose:
+            print("\tStarted ILP solver")
+            print("\t{}".format(datetime.now()))
         lpvc.solve(solver)
-        print("\tStopped ILP solver")
-        print("\t{}".format(datetime.now()))
+        if config.verbose:
+            print("\tStopped ILP solver")
+            print("\t{}".format(datetime.now()))
 
         if lpvc.status == LpStatusInfeasible:
             raise InfeasibleSolutionException("Infeasible solution.")
 
-        vertical = []
-        horizontal = []
+        # The numbers of labels are counted while the nodes are labeled, instead of from lists and their intersection.
+        vs = 0
+        hs = 0
+        vhs = 0
         for v in self.g.nodes:
-            self.labeling[v] = 0
-            if int(round(x_vars[v]['V'].varValue)) == 1:
-                vertical.append(v)
-                self.labeling[v] += 1
-            if int(round(x_vars[v]['H'].varValue)) == 1:
-                horizontal.append(v)
-                self.labeling[v] += -1
-
-        vertical_set = set(vertical)
-        horizontal_set = set(horizontal)
-        vhs = len(list(vertical_set.intersection(horizontal_set)))
-        vs = len(vertical) - vhs
-        hs = len(horizontal) - vhs
+            vertical = int(round(x_vars[v]['V'].varValue)) == 1
+            horizontal = int(round(x_vars[v]['H'].varValue)) == 1
+            self.labeling[v] = vertical - horizontal
+            if vertical and horizontal:
+                vhs += 1
+            elif vertical:
+                vs += 1
+            elif horizontal:
+                hs += 1
 
         self.stop_time = time.time()
 
-        print("Status: ", LpStatus[lpvc.status])
-        print("Objective: " + str(config.gamma * S.varValue + (1 - config.gamma) * D.varValue))
-        print("Label V: " + str(vs))
-        print("Label H: " + str(hs))
-        print("Label VH: " + str(vhs))
-
         self.objective = config.gamma * S.varValue + (1 - config.gamma) * D.varValue
 
+        if config.verbose:
+            print("Status: ", LpStatus[lpvc.status])
+            print("Objective: " + str(self.objective))
+            print("Label V: " + str(vs))
+            print("Label H: " + str(hs))
+            print("Label VH: " + str(vhs))
+
         # gap = 0
         # cplex_log_file_name = config.root.joinpath("cplex.log")
         # if cplex_log_file_name.is_file():
@@ -1,10 +1,89 @@
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
-from networkx import DiGraph, set_node_attributes
+import numpy as np
+from networkx import DiGraph
 
 from core.expressions.BooleanExpression import LITERAL
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _reduce(variables: np.ndarray, positive_children: np.ndarray,
+            negative_children: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Reduces a BDD in a single pass over its nodes, in which each node is visited after its children.
+    A node is redundant if its children are the same node, and it is then redirected to its child. Otherwise, it is
+    redirected to the first visited node with the same variable and children, if there is one. Afterwards, each node
+    is redirected to the duplicate with the lowest index instead, as when the BDD is reduced level by level.
+    This function is compiled with Numba when available.
+    :param variables: The index of the variable of each node.
+    :param positive_children: The index of the positive child of each node, or -1 if it has none.
+    :param negative_children: The index of the negative child of each node, or -1 if it has none.
+    :return: A tuple of the index of the node to which each node is redirected, and the redirected positive and
+    negative children of each node.
+    """
+    n = len(variables)
+    redirections = np.arange(n)
+    redundant = np.zeros(n, dtype=np.bool_)
+    # The state of each node: 0 if it is not visited, 1 if it is on the stack, and 2 if it is visited.
+    states = np.zeros(n, dtype=np.int8)
+    stack = np.empty(n, dtype=np.int64)
+    unique_table = dict()
+    for start in range(n):
+        if states[start] != 0:
+            continue
+        top = 0
+        stack[0] = start
+        states[start] = 1
+        while top >= 0:
+            u = stack[top]
+            positive_child = positive_children[u]
+            negative_child = negative_children[u]
+            if positive_child >= 0 and states[positive_child] == 0:
+                top += 1
+                stack[top] = positive_child
+                states[positive_child] = 1
+                continue
+            if negative_child >= 0 and states[negative_child] == 0:
+                top += 1
+                stack[top] = negative_child
+                states[negative_child] = 1
+                continue
+            top -= 1
+            states[u] = 2
+            if positive_child >= 0:
+                positive_child = redirections[positive_child]
+            if negative_child >= 0:
+                negative_child = redirections[negative_child]
+            if positive_child >= 0 and positive_child == negative_child:
+                redirections[u] = positive_child
+                redundant[u] = True
+            else:
+                key = (variables[u], positive_child, negative_child)
+                if key in unique_table:
+                    redirections[u] = unique_table[key]
+                else:
+                    unique_table[key] = u
+
+    # Every node is redirected to the first visited node of its duplicates, which becomes the duplicate with the
+    # lowest index.
+    lowest = np.arange(n)
+    for u in range(n - 1, -1, -1):
+        if not redundant[u]:
+            lowest[redirections[u]] = u
+    redirections = lowest[redirections]
+    positive_children = np.where(positive_children >= 0, redirections[np.maximum(positive_children, 0)], -1)
+    negative_children = np.where(negative_children >= 0, redirections[np.maximum(negative_children, 0)], -1)
+    return redirections, positive_children, negative_children
+
+
+if njit is not None:
+    _reduce = njit(cache=True)(_reduce)
+
 
 class BDDModule:
 
@@ -21,6 +100,9 @@ class BDDParser:
     A class to parse a BDD from a BDD file.
     """
 
+    # Most nodes of a BDD have no output variables. These nodes share a single empty set of output variables.
+    _no_output_variables = frozenset()
+
     def __init__(self, file_path: Path):
         super().__init__()
 
@@ -30,7 +112,13 @@ class BDDParser:
         self.bdd_module = self.from_string(content)
 
     @staticmethod
-    def from_string(content: str) -> BDDModule:
+    def from_string(content: str, literals: Dict[Tuple[str, bool], LITERAL] = None) -> BDDModule:
+        """
+        Parses the BDD of the given BDD description.
+        :param content: The BDD description.
+        :param literals: Optionally, a table of the literals of the edges, shared with other BDDs.
+        :return: The BDD module of the BDD.
+        """
         bdd_module = BDDModule()
 
         keywords = ["model", "inputs", "outputs", "order", "bdd"]
@@ -70,38 +158,157 @@ class BDDParser:
 
         lines = lines[components["bdd"][0]:]
 
-        node_attrs = dict()
-        dag = None
+        rows = []
         for i in range(len(lines)):
             line = lines[i]
-            if len(line) == 0:
+            if len(line) == 0 or line.startswith(".bdd"):
                 continue
-            elif line.startswith(".bdd"):
-                dag = DiGraph()
             elif line.startswith(".end"):
-                set_node_attributes(dag, node_attrs)
-                bdd_module.dag = dag
                 break
             else:
-                line_items = line.split()
+                rows.append(line.split())
 
-                if line_items[1] != '-1':
-                    dag.add_edge(line_items[0], line_items[1], literal=LITERAL(line_items[3], True))
-                if line_items[2] != '-1':
-                    dag.add_edge(line_items[0], line_items[2], literal=LITERAL(line_items[3], False))
+        bdd_module.dag = BDDParser._to_dag(rows, literals)
+        return bdd_module
 
-                output_variables = set()
-                for output_variable in line_items[4:]:
-                    output_variables.add(output_variable)
+    @staticmethod
+    def _redirect_redundant_nodes(positive_children: np.ndarray, negative_children: np.ndarray,
+                                  alive: np.ndarray) -> np.ndarray:
+        """
+        Returns for each node the node it is redirected to, after the removal of the redundant nodes.
+        A node is redundant if its positive child and its negative child are the same node. Then, it is redirected to
+        its child. Chains of redundant nodes are followed by pointer jumping, which halves their length in each pass.
+        :param positive_children: The index of the positive child of each node, or -1 if it has none.
+        :param negative_children: The index of the negative child of each node, or -1 if it has none.
+        :param alive: A mask of the nodes that have not been redirected before.
+        :return: An array with the index of the node to which each node is redirected.
+        """
+        redundant = (positive_children == negative_children) & (positive_children >= 0) & alive
+        redirections = np.arange(len(positive_children), dtype=np.int64)
+        redirections[redundant] = positive_children[redundant]
+        while np.any(redirections[redirections] != redirections):
+            redirections = redirections[redirections]
+        return redirections
 
-                node_attrs[line_items[0]] = {
-                    "terminal": line_items[3] == '1' or line_items[3] == '0',
-                    "root": len(output_variables) > 0,
-                    "variable": line_items[3],
-                    "output_variables": output_variables
-                }
+    @staticmethod
+    def _redirect_duplicate_nodes(variables: np.ndarray, positive_children: np.ndarray, negative_children: np.ndarray,
+                                  alive: np.ndarray) -> np.ndarray:
+        """
+        Returns for each node the node it is redirected to, after the merge of the duplicate nodes.
+        Nodes are duplicates if they have the same variable, positive child and negative child. Then, they are
+        redirected to the first of them. The nodes are grouped by a single sort, over keys in which the variable
+        and the children of a node are packed into 64 bits when they fit.
+        :param variables: The index of the variable of each node.
+        :param positive_children: The index of the positive child of each node, or -1 if it has none.
+        :param negative_children: The index of the negative child of each node, or -1 if it has none.
+        :param alive: A mask of the nodes that have not been redirected before. Only these nodes are merged.
+        :return: An array with the index of the node to which each node is redirected.
+        """
+        candidates = np.flatnonzero(alive)
+        if len(positive_children) < (1 << 22) - 1 and len(variables) > 0 and variables.max() < (1 << 20):
+            # The children are shifted by one such that an absent child (-1) is packed as 0.
+            keys = (variables[candidates].astype(np.uint64) << np.uint64(44)) | \
+                   ((positive_children[candidates] + 1).astype(np.uint64) << np.uint64(22)) | \
+                   (negative_children[candidates] + 1).astype(np.uint64)
+            _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        else:
+            keys = np.stack((variables[candidates], positive_children[candidates], negative_children[candidates]),
+                            axis=1)
+            _, first, inverse = np.unique(keys, return_index=True, return_inverse=True, axis=0)
+        redirections = np.arange(len(positive_children), dtype=np.int64)
+        redirections[candidates] = candidates[first[inverse.reshape(-1)]]
+        return redirections
 
-        return bdd_module
+    @staticmethod
+    def _reduce_by_level(variables: np.ndarray, positive_children: np.ndarray,
+                         negative_children: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Reduces a BDD level by level with NumPy, by removing the redundant nodes and merging the duplicate nodes
+        until neither is left.
+        :param variables: The index of the variable of each node.
+        :param positive_children: The index of the positive child of each node, or -1 if it has none.
+        :param negative_children: The index of the negative child of each node, or -1 if it has none.
+        :return: A tuple of the index of the node to which each node is redirected, and the redirected positive and
+        negative children of each node.
+        """
+        # Removing a redundant node or merging duplicate nodes changes the children of their parents, which may then
+        # become redundant or duplicates in turn. Hence, both rules are applied, level by level, until neither applies.
+        identity = np.arange(len(variables), dtype=np.int64)
+        redirections = identity
+        while True:
+            alive = redirections == identity
+            step = BDDParser._redirect_redundant_nodes(positive_children, negative_children, alive)
+            if np.array_equal(step, identity):
+                step = BDDParser._redirect_duplicate_nodes(variables, positive_children, negative_children, alive)
+                if np.array_equal(step, identity):
+                    break
+            redirections = step[redirections]
+            positive_children = np.where(positive_children >= 0, step[positive_children], -1)
+            negative_children = np.where(negative_children >= 0, step[negative_children], -1)
+        return redirections, positive_children, negative_children
+
+    @staticmethod
+    def _to_dag(rows: List[List[str]], literals: Dict[Tuple[str, bool], LITERAL] = None) -> DiGraph:
+        """
+        Constructs the DAG of a BDD from the rows of a BDD description. Each row consists of a node, its positive child,
+        its negative child, its variable and optionally its output variables.
+        The BDD is reduced: redundant nodes are removed and duplicate nodes are merged, until neither is left.
+        Edges with the same literal share the literal object. The literals are looked up in the given table, such that
+        BDDs that are parsed with the same table, e.g. the BDDs of a collection, share their literals as well.
+        :param rows: The rows of the BDD description.
+        :param literals: Optionally, a table mapping a variable and its polarity to the literal.
+        :return: The DAG of the BDD.
+        """
+        if literals is None:
+            literals = dict()
+        nodes = [row[0] for row in rows]
+        indices = {node: i for i, node in enumerate(nodes)}
+        indices['-1'] = -1
+        positive_children = np.array([indices[row[1]] for row in rows], dtype=np.int64)
+        negative_children = np.array([indices[row[2]] for row in rows], dtype=np.int64)
+        variable_indices = dict()
+        variables = np.array([variable_indices.setdefault(row[3], len(variable_indices)) for row in rows],
+                             dtype=np.int64)
+
+        if njit is not None:
+            redirections, positive_children, negative_children = _reduce(variables, positive_children,
+                                                                         negative_children)
+        else:
+            redirections, positive_children, negative_children = BDDParser._reduce_by_level(
+                variables, positive_children, negative_children)
+
+        # The output variables of a removed node are passed to the node to which it is redirected.
+        output_variables = dict()
+        for i, row in enumerate(rows):
+            if len(row) > 4:
+                output_variables.setdefault(int(redirections[i]), set()).update(row[4:])
+        # The nodes with the same variable share the name of the variable.
+        variable_names = list(variable_indices)
+
+        dag = DiGraph()
+        for i, row in enumerate(rows):
+            if redirections[i] != i:
+                continue
+            node = row[0]
+            variable = variable_names[variables[i]]
+            # The node is added explicitly such that a terminal without incoming edges is kept as well.
+            dag.add_node(node,
+                         terminal=variable == '1' or variable == '0',
+                         root=i in output_variables,
+                         variable=variable,
+                         output_variables=frozenset(output_variables[i]) if i in output_variables
+                         else BDDParser._no_output_variables)
+            if positive_children[i] >= 0:
+                literal = literals.get((variable, True))
+                if literal is None:
+                    literal = literals[(variable, True)] = LITERAL(variable, True)
+                dag.add_edge(node, nodes[positive_children[i]], literal=literal)
+            if negative_children[i] >= 0:
+                literal = literals.get((variable, False))
+                if literal is None:
+                    literal = literals[(variable, False)] = LITERAL(variable, False)
+                dag.add_edge(node, nodes[negative_children[i]], literal=literal)
+        return dag
 
     def get_log(self) -> Dict[str, Any]:
         return {
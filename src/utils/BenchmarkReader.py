@@ -8,6 +8,18 @@ from core.decision_diagrams.BDDCollection import BDDCollection
 from core.hardware.Topology import Topology
 
 
+# The functions reading a Boolean function collection from the file with the given file path, by file extension.
+# The benchmarks and BDDs are read relative to the root directory.
+_READERS = {
+    ".pla": lambda file_path: BooleanFunctionCollection({PLABenchmark.read(config.root.joinpath(file_path))}),
+    ".blif": lambda file_path: BooleanFunctionCollection({BLIFBenchmark.read(config.root.joinpath(file_path))}),
+    ".v": lambda file_path: BooleanFunctionCollection({VerilogBenchmark.read(config.root.joinpath(file_path))}),
+    ".bdd": lambda file_path: BDDCollection.read(config.root.joinpath(file_path)),
+    ".xbar": lambda file_path: BooleanFunctionCollection({Crossbar.read(file_path)}),
+    ".topo": lambda file_path: BooleanFunctionCollection({Topology.read(file_path)}),
+}
+
+
 class BenchmarkReader:
 
     def __init__(self, file_path: Path):
@@ -25,29 +37,16 @@ class BenchmarkReader:
         benchmark_name = self.file_path.stem
         file_extension = self.file_path.suffix
 
-        print("Started reading benchmark \"{}\"".format(benchmark_name))
-
-        if file_extension == ".pla":
-            benchmark = PLABenchmark.read(config.root.joinpath(self.file_path))
-            boolean_function_collection = BooleanFunctionCollection({benchmark})
-        elif file_extension == ".blif":
-            benchmark = BLIFBenchmark.read(config.root.joinpath(self.file_path))
-            boolean_function_collection = BooleanFunctionCollection({benchmark})
-        elif file_extension == ".v":
-            benchmark = VerilogBenchmark.read(config.root.joinpath(self.file_path))
-            boolean_function_collection = BooleanFunctionCollection({benchmark})
-        elif file_extension == ".bdd":
-            boolean_function_collection = BDDCollection.read(config.root.joinpath(self.file_path))
-        elif file_extension == ".xbar":
-            crossbar = Crossbar.read(self.file_path)
-            boolean_function_collection = BooleanFunctionCollection({crossbar})
-        elif file_extension == ".topo":
-            topology = Topology.read(self.file_path)
-            boolean_function_collection = BooleanFunctionCollection({topology})
-        else:
+        if config.verbose:
+            print("Started reading benchmark \"{}\"".format(benchmark_name))
+
+        reader = _READERS.get(file_extension)
+        if reader is None:
             raise Exception("Unsupported file type.")
+        boolean_function_collection = reader(self.file_path)
 
-        print("Stopped reading benchmark")
-        print()
+        if config.verbose:
+            print("Stopped reading benchmark")
+            print()
 
         return boolean_function_collection
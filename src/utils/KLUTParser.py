@@ -1,13 +1,16 @@
+import os
+import shlex
+import subprocess
 import time
+from typing import Tuple, Any
 
-import pexpect
 from blifparser.keywords.generic import Blif, Model, Inputs, Outputs
 from networkx import topological_sort
-from pexpect import EOF, TIMEOUT
 
 from utils import config
 from utils.BDDDOTParser import BDDDOTParser
 from utils.DDParser import DDParser
+from utils.ParallelExecutor import ParallelExecutor
 from core.benchmarks.Benchmark import Benchmark, BLIFBenchmark
 from core.decision_diagrams.BDD import BDD
 from core.decision_diagrams.BDDTopology import BDDTopology
@@ -20,7 +23,6 @@ class KLUTParser(DDParser):
         self.K = K
         self.G = G
         self.blif_file = config.abc_path.joinpath("{}.blif".format(self.benchmark.name))
-        self.sub_blif_file = config.abc_path.joinpath("copy.blif")
         self.abc_file_path = config.abc_path.joinpath(self.benchmark.file_path.name)
         self.start_time = None
         self.end_time = None
@@ -30,10 +32,8 @@ class KLUTParser(DDParser):
         Writes the BLIF content using the ABC tool.
         :return: Returns a BLIF benchmark (k-LUT)
         """
-        print("\tStarted ABC")
-
-        # Start a process for the ABC tool
-        process = pexpect.spawn(config.abc_cmd, cwd=str(config.abc_path))
+        if config.verbose:
+            print("\tStarted ABC")
 
         # Careful: the command "collapse" renames output variables to intermediate node names
         arguments = []
@@ -44,27 +44,63 @@ class KLUTParser(DDParser):
             arguments.append("-G")
             arguments.append(str(self.G))
         arguments_str = " ".join(arguments)
-        cmd = 'read "{}"; if {}; write_blif "{}";'.format(self.benchmark.file_path.name, arguments_str, self.blif_file.name)
-        process.sendline(cmd)
+        if self.blif_file.exists():
+            os.remove(self.blif_file)
 
-        blif_benchmark = None
+        # ABC runs the script non-interactively and exits once the k-LUT is written.
+        script = 'read "{}"; if {}; write_blif "{}"'.format(self.benchmark.file_path.name, arguments_str,
+                                                            self.blif_file.name)
         try:
-            index = process.expect(['abc 03'])
-            if index == 0:
-                blif_benchmark = BLIFBenchmark.read(self.blif_file)
+            subprocess.run(config.bash_cmd + ["./abc -c {}".format(shlex.quote(script))], cwd=str(config.abc_path),
+                           capture_output=True, timeout=config.time_limit_abc)
+        except subprocess.TimeoutExpired:
+            raise Exception("\tABC timeout error.\n")
+
+        if not self.blif_file.exists():
+            raise Exception("ABC could not write \"{}\".".format(self.blif_file.name))
+
+        # ABC rewrites the same file name for each k-LUT of the benchmark.
+        Benchmark.clear_parse_cache()
+        blif_benchmark = BLIFBenchmark.read(self.blif_file)
 
-                # if self.blif_file.exists():
-                #     os.remove(self.blif_file)
+        # if self.blif_file.exists():
+        #     os.remove(self.blif_file)
 
+        if config.verbose:
             print("\tStopped ABC")
-        except EOF:
-            raise Exception("\tABC EOF error.\n")
-        except TIMEOUT:
-            raise Exception("\tABC timeout error.\n")
         return blif_benchmark
 
+    @staticmethod
+    def _parse_function(function: Tuple[str, Any]) -> BDD:
+        """
+        Constructs the BDD of a function of the k-LUT. The function is written to a BLIF file of its own, such that
+        the functions can be parsed independently of each other.
+        :param function: A tuple of the output of the function and the function.
+        :return: The BDD of the function.
+        """
+        (output, boolean_function) = function
+        blif = Blif()
+        blif.model = Model(boolean_function.output)
+        if len(boolean_function.inputs) == 0:
+            blif.inputs = Inputs("False")
+        else:
+            blif.inputs = Inputs(" ".join(boolean_function.inputs))
+        blif.outputs = Outputs("{}".format(boolean_function.output))
+        blif.booleanfunctions = [boolean_function]
+        sub_blif_file = config.abc_path.joinpath("copy_{}.blif".format(output))
+        sub_blif_benchmark = BLIFBenchmark(blif, file_path=sub_blif_file, name=output)
+        parser = BDDDOTParser(sub_blif_benchmark)
+        bdd_collection = parser.parse()
+        bdd = next(iter(bdd_collection.boolean_functions))
+
+        assert isinstance(output, str)
+        assert isinstance(bdd, BDD)
+
+        return bdd
+
     def parse(self) -> BDDTopology:
-        print("Started constructing k-LUT from benchmark")
+        if config.verbose:
+            print("Started constructing k-LUT from benchmark")
 
         self.start_time = time.time()
 
@@ -75,30 +111,11 @@ class KLUTParser(DDParser):
         blif_benchmark = self._write_klut()
 
         graph = blif_benchmark.to_data_flow_graph()
-        bdds = dict()
-        for output in topological_sort(graph):
-            # If the node is a primary input variable, then we must not evaluate it.
-            if output in blif_benchmark.get_input_variables():
-                continue
-
-            boolean_function = blif_benchmark.functions.get(output)
-            blif = Blif()
-            blif.model = Model(boolean_function.output)
-            if len(boolean_function.inputs) == 0:
-                blif.inputs = Inputs("False")
-            else:
-                blif.inputs = Inputs(" ".join(boolean_function.inputs))
-            blif.outputs = Outputs("{}".format(boolean_function.output))
-            blif.booleanfunctions = [boolean_function]
-            sub_blif_benchmark = BLIFBenchmark(blif, file_path = self.sub_blif_file, name=output)
-            parser = BDDDOTParser(sub_blif_benchmark)
-            bdd_collection = parser.parse()
-            bdd = list(bdd_collection.boolean_functions)[0]
-
-            assert isinstance(output, str)
-            assert isinstance(bdd, BDD)
-
-            bdds[output] = bdd
+        # If the node is a primary input variable, then we must not evaluate it.
+        input_variables = frozenset(blif_benchmark.get_input_variables())
+        outputs = [output for output in topological_sort(graph) if output not in input_variables]
+        functions = [(output, blif_benchmark.functions.get(output)) for output in outputs]
+        bdds = dict(zip(outputs, ParallelExecutor.map(KLUTParser._parse_function, functions)))
 
         bdd_topology = BDDTopology(graph, bdds)
 
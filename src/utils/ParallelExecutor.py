@@ -0,0 +1,82 @@
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import PurePath
+from typing import Callable, Iterable, List, Any, Dict
+
+from utils import config
+from utils.Log import Log
+
+# The function applied by a worker process. It is set once per worker by the initializer.
+_worker_function = None
+
+
+class ParallelExecutor:
+    """
+    A class to apply a function to independent items in a pool of worker processes.
+    """
+
+    @staticmethod
+    def _get_settings() -> Dict[str, Any]:
+        """
+        Returns the settings in the config module, i.e. the plain values that may have been set by commands.
+        The context manager and the log are excluded.
+        :return: A dictionary mapping the name of each setting to its value.
+        """
+        return {name: value for name, value in vars(config).items()
+                if not name.startswith("_") and isinstance(value, (bool, int, float, str, list, PurePath, type(None)))}
+
+    @staticmethod
+    def _init_worker(pickled_context: bytes):
+        """
+        Initializes a worker process with the shared context. The context is unpickled once per worker,
+        instead of once per task.
+        :param pickled_context: The pickled settings and function.
+        """
+        global _worker_function
+        settings, _worker_function = pickle.loads(pickled_context)
+        vars(config).update(settings)
+
+    @staticmethod
+    def _run(item: Any):
+        """
+        Applies the function of this worker to the given item.
+        The worker logs to memory such that only the main process writes to the log file.
+        :param item: The given item.
+        :return: A tuple of the result and the JSON content logged by the worker.
+        """
+        config.log = Log()
+        result = _worker_function(item)
+        return result, config.log.json_content
+
+    @staticmethod
+    def map(function: Callable[[Any], Any], items: Iterable[Any]) -> List[Any]:
+        """
+        Applies the given function to each of the given items and returns the results in the order of the items.
+        The function must be defined at module level or as a static method, optionally with arguments bound by
+        functools.partial, such that it can be pickled.
+        When there is at most one item, or when there is at most one worker, the items are processed serially.
+        :param function: The given function.
+        :param items: The given items.
+        :return: A list of the results.
+        """
+        items = list(items)
+        workers = config.max_workers or os.cpu_count() or 1
+        if len(items) <= 1 or workers <= 1:
+            return [function(item) for item in items]
+
+        pickled_context = pickle.dumps((ParallelExecutor._get_settings(), function))
+
+        results = [None] * len(items)
+        json_contents = [None] * len(items)
+        with ProcessPoolExecutor(max_workers=workers, initializer=ParallelExecutor._init_worker,
+                                 initargs=(pickled_context,)) as executor:
+            futures = {executor.submit(ParallelExecutor._run, item): i for i, item in enumerate(items)}
+            # Results are collected as soon as they are completed such that a slow item does not hold back the others.
+            for future in as_completed(futures):
+                results[futures[future]], json_contents[futures[future]] = future.result()
+        # The logs of the workers are merged in the order of the items such that the log is deterministic.
+        for json_content in json_contents:
+            for content in json_content:
+                config.log.add_json(content)
+        return results
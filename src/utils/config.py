@@ -11,6 +11,11 @@ log = Log()
 # Settings for DD
 time_limit_bdd = 3600
 
+# Settings for the conversions between benchmark formats with ABC
+time_limit_abc = 3600
+# Benchmarks with at most this number of input variables are converted by enumerating their truth table instead
+max_inputs_direct_conversion = 12
+
 # Settings for COMPACT
 # Apply VH-labeling (2D crossbars) or K-labeling (3D crossbars)
 vh_labeling = False
@@ -33,6 +38,18 @@ max_columns = sys.maxsize
 
 record_formulae = False
 
+# Print the progress of the synthesis methods and the parsers, e.g. when the ILP solver or ABC is started and stopped
+verbose = True
+
+# Settings for parallel execution
+# The maximum number of worker processes. By default, the number of processors is used.
+max_workers = None
+# Run Z3 in parallel mode, i.e. as a portfolio of solvers in at most max_workers threads.
+# This does not apply to the incremental queries of z3_check_assuming.
+z3_parallel = True
+# Check the equivalence queries with (check-sat-assuming ...) instead of asserting them and using (check-sat)
+z3_check_assuming = False
+
 root = pathlib.Path(__file__).parent.parent.parent.absolute()
 abc_path = root.joinpath('abc')
 
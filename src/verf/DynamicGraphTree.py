@@ -4,7 +4,7 @@ from z3 import Not, Bool, Or, And
 
 from utils import config
 from core.benchmarks.Benchmark import VerilogBenchmark
-from core.expressions.BooleanExpression import LITERAL
+from core.expressions.BooleanExpression import TRUE_LITERAL
 from core.hardware.Crossbar import MemristorCrossbar
 from verf.TreeBasedEquivalenceChecker import TreeBasedEquivalenceChecker
 
@@ -108,17 +108,11 @@ class DynamicGraphTree(TreeBasedEquivalenceChecker):
 
         # Construct a bipartite graph where the rows and columns are nodes, and the intersections are edges.
         graph = MultiGraph()
-        for layer in range(self.boolean_function.layers):
-            for r in range(self.boolean_function.rows):
-                for c in range(self.boolean_function.columns):
-                    memristor = self.boolean_function.get_memristor(r, c, layer)
-                    if memristor.literal != LITERAL('False', False):
-                        if layer % 2 == 0:
-                            graph.add_edge("L{}_{}".format(layer, r), "L{}_{}".format(layer + 1, c),
-                                           literal=memristor.literal)
-                        else:
-                            graph.add_edge("L{}_{}".format(layer, c), "L{}_{}".format(layer + 1, r),
-                                           literal=memristor.literal)
+        for (layer, r, c, literal) in self.boolean_function.get_assigned_memristors():
+            if layer % 2 == 0:
+                graph.add_edge("L{}_{}".format(layer, r), "L{}_{}".format(layer + 1, c), literal=literal)
+            else:
+                graph.add_edge("L{}_{}".format(layer, c), "L{}_{}".format(layer + 1, r), literal=literal)
 
         input_layer, input_nanowire = self.boolean_function.get_input_nanowire(input_function)
         output_layer, output_nanowire = self.boolean_function.get_output_nanowire(output_variable)
@@ -162,7 +156,7 @@ class DynamicGraphTree(TreeBasedEquivalenceChecker):
             for child_node in child_nodes:
                 if child_node["output"]:
                     literal = child_node["subtree"].parent_literal
-                    if literal != LITERAL("True", True):
+                    if literal != TRUE_LITERAL:
                         if literal.positive:
                             child_expressions.append(Bool(literal.atom))
                         else:
@@ -176,7 +170,7 @@ class DynamicGraphTree(TreeBasedEquivalenceChecker):
             return subtree_expression
         else:
             literal = tree.parent_literal
-            if literal != LITERAL("True", True):
+            if literal != TRUE_LITERAL:
                 if literal.positive:
                     literal_expression = Bool(literal.atom)
                 else:
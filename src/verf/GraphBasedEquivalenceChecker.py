@@ -1,9 +1,10 @@
 import multiprocessing
+import os
 import time
 from abc import abstractmethod
 from typing import List
 
-from z3 import Solver, Not, unsat, Bool
+from z3 import Solver, Not, unsat, Bool, set_param
 
 from utils import Z3Tools, config
 from utils.Log import Log
@@ -30,6 +31,36 @@ class GraphBasedEquivalenceChecker(EquivalenceChecker):
     def to_formula(self, output_variable: str) -> Bool:
         pass
 
+    @staticmethod
+    def _set_solver_parameters():
+        """
+        Sets the global parameters of Z3. These must be set before a solver is constructed.
+        In parallel mode, Z3 runs a portfolio of solvers in multiple threads. This only applies to non-incremental
+        queries, i.e. the default path of _is_unsatisfiable, and not to (check-sat-assuming ...).
+        """
+        set_param("parallel.enable", config.z3_parallel)
+        if config.z3_parallel:
+            set_param("parallel.threads.max", config.max_workers or os.cpu_count())
+
+    @staticmethod
+    def _is_unsatisfiable(solver: Solver, formula: Bool) -> bool:
+        """
+        Returns true if and only if the given formula is unsatisfiable in the given solver.
+        By default, the solver is reset before the formula is asserted, i.e. (reset) (assert ...) (check-sat).
+        In a scope opened by (push), Z3 would use its incremental core instead of its SAT solver and preprocessing
+        tactics, and does not run the parallel portfolio.
+        When config.z3_check_assuming is set, the formula is checked as an assumption instead,
+        i.e. (check-sat-assuming ...). Z3 can be orders of magnitude slower for the latter.
+        :param solver: The given solver.
+        :param formula: The given formula.
+        :return: True if the formula is unsatisfiable, False otherwise.
+        """
+        if config.z3_check_assuming:
+            return solver.check(formula) == unsat
+        solver.reset()
+        solver.add(formula)
+        return solver.check() == unsat
+
     # def _enumeration_parallel(self, event, sampling_size, queue):
     def _enumeration_parallel(self, event, sampling_size):
         assert isinstance(self.specification, VerilogBenchmark)
@@ -70,9 +101,11 @@ class GraphBasedEquivalenceChecker(EquivalenceChecker):
         total_nr_paths = 0
         total_nr_literals = 0
 
-        for (output_variable, verilog_formula) in self.specification.verilog.functions.items():
-            z3_benchmark_formula = Z3Converter.verilog_to_z3(verilog_formula.verilog_module)
+        # A single solver is reused for all output variables. It is reset before the query of each output variable.
+        self._set_solver_parameters()
+        s = Solver()
 
+        for (output_variable, z3_benchmark_formula) in self.specification.to_z3().items():
             # Start timing extraction
             start_time = time.time()
 
@@ -88,9 +121,8 @@ class GraphBasedEquivalenceChecker(EquivalenceChecker):
 
             f = z3_benchmark_formula == z3_crossbar_formula
 
-            s = Solver()
-            s.add(Not(f))
-            if s.check() == unsat:
+            equivalent = self._is_unsatisfiable(s, Not(f))
+            if equivalent:
                 print("output variable {}: equivalent".format(output_variable))
                 self.graph_log.add("equivalent {}: true\n".format(output_variable))
 
@@ -164,6 +196,10 @@ class GraphBasedEquivalenceChecker(EquivalenceChecker):
         formulae = dict()
         simple_paths = dict()
 
+        # A single solver is reused for all output variables. It is reset before the query of each output variable.
+        self._set_solver_parameters()
+        s = Solver()
+
         for (output_variable, z3_benchmark_formula) in self.specification.to_z3().items():
             start_time = time.time()
             z3_crossbar_formula = self.to_formula(output_variable)
@@ -176,9 +212,8 @@ class GraphBasedEquivalenceChecker(EquivalenceChecker):
             f = z3_benchmark_formula == z3_crossbar_formula
 
             start_time = time.time()
-            s = Solver()
-            s.add(Not(f))
-            if s.check() == unsat:
+            equivalent = self._is_unsatisfiable(s, Not(f))
+            if equivalent:
                 print("Output variable {}: equivalent".format(output_variable))
                 config.log.add("Equivalent {}: true\n".format(output_variable))
             else:
@@ -9,7 +9,7 @@ from utils import config
 from utils.Z3Converter import Z3Converter
 from core.BooleanFunction import BooleanFunction
 from core.benchmarks.Benchmark import VerilogBenchmark
-from core.expressions.BooleanExpression import LITERAL
+from core.expressions.BooleanExpression import TRUE_LITERAL
 from core.hardware.Crossbar import MemristorCrossbar
 from verf.EquivalenceChecker import EquivalenceChecker
 
@@ -60,7 +60,7 @@ class SimplePathTree(EquivalenceChecker):
                 edge_data = graph.get_edge_data(u, v)
                 literal = edge_data["literal"]
                 # print(literal)
-                if literal == LITERAL("True", True):
+                if literal == TRUE_LITERAL:
                     graph.nodes[v]["visited"] = visited.copy()
                     if not self._dfs_visit(graph, v):
                         return False
@@ -128,17 +128,11 @@ class SimplePathTree(EquivalenceChecker):
         # # Construct a bipartite graph where the rows and columns are nodes, and the intersections are edges.
         # TODO: Change from literal attribute to (atom, positive) attributes
         graph = Graph()
-        for layer in range(crossbar.layers):
-            for r in range(crossbar.rows):
-                for c in range(crossbar.columns):
-                    memristor = crossbar.get_memristor(r, c, layer)
-                    if memristor.literal != LITERAL('False', False):
-                        if layer % 2 == 0:
-                            graph.add_edge("L{}_{}".format(layer, r), "L{}_{}".format(layer + 1, c),
-                                           literal=memristor.literal)
-                        else:
-                            graph.add_edge("L{}_{}".format(layer, c), "L{}_{}".format(layer + 1, r),
-                                           literal=memristor.literal)
+        for (layer, r, c, literal) in crossbar.get_assigned_memristors():
+            if layer % 2 == 0:
+                graph.add_edge("L{}_{}".format(layer, r), "L{}_{}".format(layer + 1, c), literal=literal)
+            else:
+                graph.add_edge("L{}_{}".format(layer, c), "L{}_{}".format(layer + 1, r), literal=literal)
 
         for (input_function, (input_layer, input_nanowire)) in crossbar.get_input_nanowires().items():
             attrs = dict()
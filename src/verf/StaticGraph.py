@@ -5,7 +5,6 @@ from networkx import Graph
 from z3 import Bool
 
 from core.benchmarks.Benchmark import VerilogBenchmark
-from core.expressions.BooleanExpression import LITERAL
 from core.hardware.Crossbar import MemristorCrossbar
 from verf.GraphBasedEquivalenceChecker import GraphBasedEquivalenceChecker
 from utils.Z3Converter import Z3Converter
@@ -25,19 +24,13 @@ class StaticGraph(GraphBasedEquivalenceChecker):
         # Construct a bipartite graph where the rows and columns are nodes, and the intersections are edges.
         graph = Graph()
         edge_node_mapping = dict()
-        for layer in range(self.boolean_function.layers):
-            for r in range(self.boolean_function.rows):
-                for c in range(self.boolean_function.columns):
-                    memristor = self.boolean_function.get_memristor(r, c, layer)
-                    if memristor.literal != LITERAL('False', False):
-                        if layer % 2 == 0:
-                            graph.add_edge("L_{}_{}".format(layer, r), "L_{}_{}".format(layer + 1, c),
-                                           literal=memristor.literal)
-                            edge_node_mapping[("L{}_{}".format(layer, r), "C{}".format(layer + 1, c))] = str(memristor.literal)
-                        else:
-                            graph.add_edge("L_{}_{}".format(layer, c), "L_{}_{}".format(layer + 1, r),
-                                           literal=memristor.literal)
-                            edge_node_mapping[("L{}_{}".format(layer, c), "C{}".format(layer + 1, r))] = str(memristor.literal)
+        for (layer, r, c, literal) in self.boolean_function.get_assigned_memristors():
+            if layer % 2 == 0:
+                graph.add_edge("L_{}_{}".format(layer, r), "L_{}_{}".format(layer + 1, c), literal=literal)
+                edge_node_mapping[("L{}_{}".format(layer, r), "C{}".format(layer + 1, c))] = str(literal)
+            else:
+                graph.add_edge("L_{}_{}".format(layer, c), "L_{}_{}".format(layer + 1, r), literal=literal)
+                edge_node_mapping[("L{}_{}".format(layer, c), "C{}".format(layer + 1, r))] = str(literal)
 
         # for r in range(self.crossbar.rows):
         #     for c in range(self.crossbar.columns):
@@ -4,7 +4,7 @@ from z3 import Not, Bool, Or, And
 
 from utils import config
 from core.benchmarks.Benchmark import VerilogBenchmark
-from core.expressions.BooleanExpression import LITERAL
+from core.expressions.BooleanExpression import TRUE_LITERAL
 from core.hardware.Crossbar import MemristorCrossbar
 from verf.TreeBasedEquivalenceChecker import TreeBasedEquivalenceChecker
 
@@ -62,17 +62,11 @@ class StaticGraphTree(TreeBasedEquivalenceChecker):
 
         # Construct a bipartite graph where the rows and columns are nodes, and the intersections are edges.
         graph = MultiGraph()
-        for layer in range(self.boolean_function.layers):
-            for r in range(self.boolean_function.rows):
-                for c in range(self.boolean_function.columns):
-                    memristor = self.boolean_function.get_memristor(r, c, layer)
-                    if memristor.literal != LITERAL('False', False):
-                        if layer % 2 == 0:
-                            graph.add_edge("L_{}_{}".format(layer, r), "L_{}_{}".format(layer + 1, c),
-                                           literal=memristor.literal)
-                        else:
-                            graph.add_edge("L_{}_{}".format(layer, c), "L_{}_{}".format(layer + 1, r),
-                                           literal=memristor.literal)
+        for (layer, r, c, literal) in self.boolean_function.get_assigned_memristors():
+            if layer % 2 == 0:
+                graph.add_edge("L_{}_{}".format(layer, r), "L_{}_{}".format(layer + 1, c), literal=literal)
+            else:
+                graph.add_edge("L_{}_{}".format(layer, c), "L_{}_{}".format(layer + 1, r), literal=literal)
         # for r in range(self.crossbar.rows):
         #     for c in range(self.crossbar.columns):
         #         memristor = self.crossbar.get_memristor(r, c)
@@ -131,7 +125,7 @@ class StaticGraphTree(TreeBasedEquivalenceChecker):
             for child_node in child_nodes:
                 if child_node["output"]:
                     literal = child_node["subtree"].parent_literal
-                    if literal != LITERAL("True", True):
+                    if literal != TRUE_LITERAL:
                         if literal.positive:
                             child_expressions.append(Bool(literal.atom))
                         else:
@@ -145,7 +139,7 @@ class StaticGraphTree(TreeBasedEquivalenceChecker):
             return subtree_expression
         else:
             literal = tree.parent_literal
-            if literal != LITERAL("True", True):
+            if literal != TRUE_LITERAL:
                 if literal.positive:
                     literal_expression = Bool(literal.atom)
                 else:
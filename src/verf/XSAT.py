@@ -19,6 +19,10 @@ from core.hardware.Crossbar import Crossbar, MemristorCrossbar
 from core.expressions.BooleanExpression import LITERAL
 from verf.EquivalenceChecker import EquivalenceChecker
 
+# The memristors are compared by the atom and positive attributes of their edges, without constructing a literal.
+_FALSE_ATTRIBUTES = ("False", False)
+_TRUE_ATTRIBUTES = ("True", True)
+
 
 class SubProblem:
 
@@ -60,12 +64,10 @@ class XSAT(EquivalenceChecker):
     def _get_edge_properties(graph: MultiGraph) -> Dict[str, int]:
         memristor_stats = {"on": 0, "off": 0, "lit": 0}
         for _, _, _, edge_data in graph.edges(keys=True, data=True):
-            atom = edge_data.get("atom")
-            positive = edge_data.get("positive")
-            literal = LITERAL(atom, positive)
-            if literal == LITERAL("False", False):
+            attributes = (edge_data.get("atom"), edge_data.get("positive"))
+            if attributes == _FALSE_ATTRIBUTES:
                 memristor_stats["off"] += 1
-            elif literal == LITERAL("True", True):
+            elif attributes == _TRUE_ATTRIBUTES:
                 memristor_stats["on"] += 1
             else:
                 memristor_stats["lit"] += 1
@@ -73,18 +75,16 @@ class XSAT(EquivalenceChecker):
 
     def _get_variable_count(self, xbar: MemristorCrossbar) -> Dict[str, int]:
         variable_count = dict()
-        for r in range(xbar.rows):
-            for c in range(xbar.columns):
-                literal = xbar.get_memristor(r, c).literal
-                if literal == LITERAL("False", False):
-                    continue
-                elif literal == LITERAL("True", True):
-                    continue
-                else:
-                    atom = literal.atom
-                    if atom not in variable_count:
-                        variable_count[atom] = 0
-                    variable_count[atom] += 1
+        for (layer, _, _, literal) in xbar.get_assigned_memristors():
+            if layer != 0:
+                continue
+            elif (literal.atom, literal.positive) == _TRUE_ATTRIBUTES:
+                continue
+            else:
+                atom = literal.atom
+                if atom not in variable_count:
+                    variable_count[atom] = 0
+                variable_count[atom] += 1
         # We sort the variables in descending order in terms of their values (occurrences)
         variable_count = dict(sorted(variable_count.items(), key=lambda item: item[1], reverse=True))
         self._log_variable_count(variable_count)
@@ -92,7 +92,9 @@ class XSAT(EquivalenceChecker):
 
     @staticmethod
     def _graph_with_fixed_variable(graph: MultiGraph, literal: LITERAL) -> MultiGraph:
-        graph = MultiGraph(copy.deepcopy(graph))
+        # The attributes of the edges are assigned anew, and not changed in place. Hence, a copy of the graph with its
+        # own attribute dictionaries suffices, without copying the literals.
+        graph = graph.copy()
         for (u, v, k) in graph.edges:
             edge_data = graph.get_edge_data(u, v, k)
             e_atom = edge_data.get("atom")
@@ -108,24 +110,18 @@ class XSAT(EquivalenceChecker):
 
     @staticmethod
     def _find_true_edge(graph: MultiGraph) -> Tuple[Any, Any, Any] | None:
-        for (u, v, k) in graph.edges:
-            edge_data = graph.get_edge_data(u, v, k)
-            atom = edge_data.get("atom")
-            positive = edge_data.get("positive")
-            if LITERAL(atom, positive) == LITERAL("True", True):
+        for (u, v, k, edge_data) in graph.edges(keys=True, data=True):
+            if (edge_data.get("atom"), edge_data.get("positive")) == _TRUE_ATTRIBUTES:
                 return u, v, k
         return None
 
     def _contract_graph(self, graph: MultiGraph) -> MultiGraph:
-        graph = MultiGraph(graph.copy(as_view=False))
+        graph = graph.copy()
 
         # First, we remove all edges with FALSE as literal
         false_edges = set()
-        for (u, v, k) in graph.edges:
-            edge_data = graph.get_edge_data(u, v, k)
-            atom = edge_data.get("atom")
-            positive = edge_data.get("positive")
-            if LITERAL(atom, positive) == LITERAL("False", False):
+        for (u, v, k, edge_data) in graph.edges(keys=True, data=True):
+            if (edge_data.get("atom"), edge_data.get("positive")) == _FALSE_ATTRIBUTES:
                 false_edges.add((u, v, k))
         graph.remove_edges_from(false_edges)
 
@@ -161,7 +157,9 @@ class XSAT(EquivalenceChecker):
                 graph.nodes[u]["input_function"] = node_data.get("input_function")
             if "output_functions" in node_data:
                 if "output_functions" in graph.nodes[u]:
-                    graph.nodes[u]["output_functions"].update(node_data.get("output_functions"))
+                    # A new set is assigned, as the sets of output functions are shared with the graph of the crossbar.
+                    graph.nodes[u]["output_functions"] = graph.nodes[u]["output_functions"] | node_data.get(
+                        "output_functions")
                 else:
                     graph.nodes[u]["output_functions"] = node_data.get("output_functions")
 